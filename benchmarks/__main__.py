@@ -0,0 +1,109 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import argparse
+import json
+import sys
+
+from .cases import CASES
+from .runner import compare
+from .runner import run
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark diffsptk modules."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_run = subparsers.add_parser("run", help="run benchmarks")
+    parser_run.add_argument("names", nargs="*", help="names of cases (default: all)")
+    parser_run.add_argument("--output", "-o", help="path to output JSON file")
+    parser_run.add_argument(
+        "--dtype", nargs="+", default=["float"], choices=["float", "double"]
+    )
+    parser_run.add_argument("--threads", nargs="+", type=int, default=[1])
+    parser_run.add_argument(
+        "--grad", default="both", choices=["off", "on", "both"], help="backward pass"
+    )
+    parser_run.add_argument("--device", default="cpu", choices=["cpu", "cuda"])
+    parser_run.add_argument(
+        "--compile", default="off", choices=["off", "on", "both"], help="torch.compile"
+    )
+    parser_run.add_argument("--repeat", type=int, default=5)
+    parser_run.add_argument("--warmup", type=int, default=1)
+    parser_run.add_argument(
+        "--quick", action="store_true", help="use only the first size of each case"
+    )
+    parser_run.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="do not fork for each configuration (peak memory is not reliable)",
+    )
+    parser_run.add_argument(
+        "--timeout", type=float, help="time limit of each configuration in seconds"
+    )
+
+    subparsers.add_parser("list", help="list cases")
+
+    parser_compare = subparsers.add_parser("compare", help="compare two results")
+    parser_compare.add_argument("base", help="baseline JSON file")
+    parser_compare.add_argument("target", help="target JSON file")
+    parser_compare.add_argument(
+        "--threshold", type=float, default=0.1, help="relative slowdown to flag"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for name, (_, unit, sizes) in CASES.items():
+            print(f"{name} ({unit}): {sizes}")
+    elif args.command == "run":
+        unknown = set(args.names) - set(CASES)
+        if unknown:
+            parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+        choices = {"off": [False], "on": [True], "both": [False, True]}
+        grads = choices[args.grad]
+        compiles = choices[args.compile]
+        result = run(
+            names=args.names or None,
+            dtypes=args.dtype,
+            threads=args.threads,
+            grads=grads,
+            device=args.device,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            compiles=compiles,
+            quick=args.quick,
+            isolate=not args.no_isolate,
+            timeout=args.timeout,
+        )
+        if args.output is not None:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=2)
+    elif args.command == "compare":
+        with open(args.base) as f:
+            base = json.load(f)
+        with open(args.target) as f:
+            target = json.load(f)
+        regressions = compare(base, target, threshold=args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) detected.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
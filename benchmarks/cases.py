@@ -0,0 +1,299 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import torch
+
+import diffsptk
+
+# Registry of benchmark cases. Each entry maps a name to a tuple of a setup function,
+# the unit of throughput, and the list of sizes passed to the setup function.
+CASES = {}
+
+
+def register(name, unit, sizes):
+    """Register a benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case, usually the name of the module.
+
+    unit : ['samples', 'frames', 'vectors']
+        Unit of throughput.
+
+    sizes : list[dict]
+        Keyword arguments passed to the setup function. The first one is used in
+        quick mode.
+
+    Returns
+    -------
+    out : Callable
+        Decorator registering a setup function that returns a module, a tuple of
+        inputs, and the number of processed units.
+
+    """
+
+    def decorator(setup):
+        CASES[name] = (setup, unit, sizes)
+        return setup
+
+    return decorator
+
+
+def waveform(B, T):
+    return torch.randn(B, T)
+
+
+def spectrum(B, N, L):
+    return torch.rand(B, N, L // 2 + 1) + 1e-3
+
+
+def cepstrum(B, N, M):
+    return torch.randn(B, N, M + 1) * 0.1
+
+
+UTTERANCE_SIZES = [{"B": 1, "T": 16000 * 5}, {"B": 8, "T": 16000 * 10}]
+FRAME_SIZES = [{"B": 1, "N": 500}, {"B": 8, "N": 2000}]
+
+# Sweeps over the order, M, and the FFT length, L, around the default M=24 and L=512.
+ORDER_SWEEP = [{"B": 1, "N": 500, "M": M} for M in (12, 59)]
+FFT_SWEEP = [{"B": 1, "N": 500, "L": L} for L in (256, 2048)]
+UTTERANCE_FFT_SWEEP = [{"B": 1, "T": 16000 * 5, "L": L} for L in (256, 2048)]
+
+
+@register("Frame", "samples", UTTERANCE_SIZES)
+def frame(B, T):
+    return diffsptk.Frame(400, 80), (waveform(B, T),), B * T
+
+
+@register("STFT", "samples", UTTERANCE_SIZES + UTTERANCE_FFT_SWEEP)
+def stft(B, T, L=512):
+    return diffsptk.STFT(min(400, L), 80, L), (waveform(B, T),), B * T
+
+
+@register("STFT-fused", "samples", UTTERANCE_SIZES + UTTERANCE_FFT_SWEEP)
+def stft_fused(B, T, L=512):
+    module = diffsptk.STFT(min(400, L), 80, L, fused=True)
+    return module, (waveform(B, T),), B * T
+
+
+@register("ISTFT", "frames", FRAME_SIZES + FFT_SWEEP)
+def istft(B, N, L=512):
+    y = torch.randn(B, N, L // 2 + 1, dtype=torch.complex64)
+    return diffsptk.ISTFT(min(400, L), 80, L), (y,), B * N
+
+
+@register("Unframe", "frames", FRAME_SIZES)
+def unframe(B, N):
+    return diffsptk.Unframe(400, 80), (torch.randn(B, N, 400),), B * N
+
+
+@register("MelFilterBankAnalysis", "frames", FRAME_SIZES + FFT_SWEEP)
+def fbank(B, N, L=512):
+    module = diffsptk.MelFilterBankAnalysis(80, L, 16000)
+    return module, (spectrum(B, N, L),), B * N
+
+
+@register("MFCC", "frames", FRAME_SIZES + FFT_SWEEP)
+def mfcc(B, N, L=512):
+    module = diffsptk.MFCC(12, 40, L, 16000)
+    return module, (spectrum(B, N, L),), B * N
+
+
+@register("CQT", "samples", UTTERANCE_SIZES[:1])
+def cqt(B, T):
+    return diffsptk.CQT(80, 16000, n_bin=72), (waveform(B, T),), B * T
+
+
+@register("LPC", "frames", FRAME_SIZES + ORDER_SWEEP)
+def lpc(B, N, M=24):
+    return diffsptk.LPC(400, M), (torch.randn(B, N, 400),), B * N
+
+
+@register(
+    "LinearPredictiveCoefficientsToLineSpectralPairs",
+    "frames",
+    FRAME_SIZES + ORDER_SWEEP,
+)
+def lpc2lsp(B, N, M=24):
+    module = diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(M)
+    a = diffsptk.LPC(400, M)(torch.randn(B, N, 400))
+    return module, (a,), B * N
+
+
+@register(
+    "LineSpectralPairsToSpectrum", "frames", FRAME_SIZES + ORDER_SWEEP + FFT_SWEEP
+)
+def lsp2sp(B, N, M=24, L=512):
+    module = diffsptk.LineSpectralPairsToSpectrum(M, L)
+    w = torch.sort(torch.rand(B, N, M + 1) * torch.pi, dim=-1)[0]
+    return module, (w,), B * N
+
+
+@register("MelCepstralAnalysis", "frames", FRAME_SIZES[:1] + ORDER_SWEEP + FFT_SWEEP)
+def mcep(B, N, M=24, L=512):
+    module = diffsptk.MelCepstralAnalysis(M, L, alpha=0.42, n_iter=3)
+    return module, (spectrum(B, N, L),), B * N
+
+
+@register(
+    "MelGeneralizedCepstralAnalysis",
+    "frames",
+    FRAME_SIZES[:1] + ORDER_SWEEP + FFT_SWEEP,
+)
+def mgcep(B, N, M=24, L=512):
+    module = diffsptk.MelGeneralizedCepstralAnalysis(
+        M, L, alpha=0.42, gamma=-0.5, n_iter=3
+    )
+    return module, (spectrum(B, N, L),), B * N
+
+
+@register("FrequencyTransform", "frames", FRAME_SIZES + ORDER_SWEEP)
+def freqt(B, N, M=24):
+    module = diffsptk.FrequencyTransform(M, M + 15, alpha=0.42)
+    return module, (cepstrum(B, N, M),), B * N
+
+
+@register(
+    "MelGeneralizedCepstrumToMelGeneralizedCepstrum",
+    "frames",
+    FRAME_SIZES + ORDER_SWEEP,
+)
+def mgc2mgc(B, N, M=24):
+    module = diffsptk.MelGeneralizedCepstrumToMelGeneralizedCepstrum(
+        M, M, in_alpha=0.42, in_gamma=-0.5, out_gamma=0
+    )
+    return module, (cepstrum(B, N, M),), B * N
+
+
+@register(
+    "MelGeneralizedCepstrumToSpectrum",
+    "frames",
+    FRAME_SIZES + ORDER_SWEEP + FFT_SWEEP,
+)
+def mgc2sp(B, N, M=24, L=512):
+    module = diffsptk.MelGeneralizedCepstrumToSpectrum(M, L, alpha=0.42)
+    return module, (cepstrum(B, N, M),), B * N
+
+
+@register(
+    "MLSA",
+    "samples",
+    UTTERANCE_SIZES[:1] + [{"B": 1, "T": 16000 * 5, "M": M} for M in (12, 59)],
+)
+def mlsa(B, T, M=24):
+    module = diffsptk.MLSA(M, 80, alpha=0.42, cep_order=99)
+    mc = cepstrum(B, T // 80, M)
+    return module, (waveform(B, T), mc), B * T
+
+
+@register("MLPG", "frames", FRAME_SIZES)
+def mlpg(B, N):
+    return diffsptk.MLPG(N), (torch.randn(B, N, 75),), B * N
+
+
+@register("GMM", "vectors", [{"T": 10000}, {"T": 10000, "M": 59}])
+def gmm(T, M=24):
+    module = diffsptk.GMM(M, 16, n_iter=5)
+    return module, (torch.randn(T, M + 1),), T
+
+
+@register("ExcitationGeneration", "frames", FRAME_SIZES)
+def excite(B, N):
+    p = torch.full((B, N), 100.0)
+    return diffsptk.ExcitationGeneration(80), (p,), B * N
+
+
+@register("Pitch-yin", "samples", UTTERANCE_SIZES)
+def pitch_yin(B, T):
+    module = diffsptk.Pitch(80, 16000, "yin", out_format="f0")
+    return module, (waveform(B, T),), B * T
+
+
+@register("Yingram", "samples", UTTERANCE_SIZES[:1])
+def yingram(B, T):
+    module = diffsptk.Yingram(1024, 16000, frame_period=80)
+    return module, (waveform(B, T),), B * T
+
+
+@register(
+    "PitchAdaptiveSpectralAnalysis",
+    "samples",
+    UTTERANCE_SIZES[:1] + UTTERANCE_FFT_SWEEP[1:],
+)
+def pitch_spec(B, T, L=1024):
+    module = diffsptk.PitchAdaptiveSpectralAnalysis(80, 16000, L)
+    f0 = torch.full((B, T // 80), 120.0)
+    return module, (waveform(B, T), f0), B * T
+
+
+@register("Aperiodicity-d4c", "samples", UTTERANCE_SIZES[:1] + UTTERANCE_FFT_SWEEP[1:])
+def ap_d4c(B, T, L=1024):
+    module = diffsptk.Aperiodicity(80, 16000, L, algorithm="d4c")
+    f0 = torch.full((B, T // 80), 120.0)
+    return module, (waveform(B, T), f0), B * T
+
+
+@register(
+    "Aperiodicity-tandem",
+    "samples",
+    UTTERANCE_SIZES[:1] + UTTERANCE_FFT_SWEEP[1:],
+)
+def ap_tandem(B, T, L=1024):
+    module = diffsptk.Aperiodicity(80, 16000, L, algorithm="tandem")
+    f0 = torch.full((B, T // 80), 120.0)
+    return module, (waveform(B, T), f0), B * T
+
+
+@register("WORLDAnalysis", "samples", UTTERANCE_SIZES[:1] + UTTERANCE_FFT_SWEEP[1:])
+def world_analysis(B, T, L=1024):
+    module = diffsptk.WORLDAnalysis(80, 16000, L)
+    f0 = torch.full((B, T // 80), 120.0)
+    return module, (waveform(B, T), f0), B * T
+
+
+class SeparateWORLDAnalysis(torch.nn.Module):
+    # Baseline of WORLDAnalysis that runs CheapTrick and D4C independently.
+    def __init__(self, frame_period, sample_rate, fft_length):
+        super().__init__()
+        self.sp = diffsptk.PitchAdaptiveSpectralAnalysis(
+            frame_period, sample_rate, fft_length
+        )
+        self.ap = diffsptk.Aperiodicity(
+            frame_period, sample_rate, fft_length, algorithm="d4c"
+        )
+
+    def forward(self, x, f0):
+        return self.sp(x, f0), self.ap(x, f0)
+
+
+@register(
+    "WORLDAnalysis-separate",
+    "samples",
+    UTTERANCE_SIZES[:1] + UTTERANCE_FFT_SWEEP[1:],
+)
+def world_analysis_separate(B, T, L=1024):
+    module = SeparateWORLDAnalysis(80, 16000, L)
+    f0 = torch.full((B, T // 80), 120.0)
+    return module, (waveform(B, T), f0), B * T
+
+
+@register("WORLDSynthesis", "frames", FRAME_SIZES + FFT_SWEEP[1:])
+def world_synthesis(B, N, L=1024):
+    module = diffsptk.WORLDSynthesis(80, 16000, L)
+    f0 = torch.full((B, N), 120.0)
+    ap = torch.rand(B, N, L // 2 + 1)
+    return module, (f0, spectrum(B, N, L), ap), B * N
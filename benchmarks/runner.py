@@ -0,0 +1,374 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import itertools
+import json
+import multiprocessing
+import platform
+import queue as queue_module
+import resource
+import time
+from pathlib import Path
+
+import torch
+
+import diffsptk
+
+from .cases import CASES
+
+
+def get_rss():
+    """Return the current resident set size in bytes (Linux only)."""
+    try:
+        statm = Path("/proc/self/statm").read_text()
+        return int(statm.split()[1]) * resource.getpagesize()
+    except OSError:
+        return None
+
+
+def measure(name, size, dtype, threads, grad, device, repeat, warmup, compile=False):
+    """Run a single benchmark configuration.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case.
+
+    size : dict
+        Size passed to the setup function.
+
+    dtype : ['float', 'double']
+        Data type.
+
+    threads : int >= 1
+        Number of intra-op threads.
+
+    grad : bool
+        If True, measure forward and backward passes.
+
+    device : ['cpu', 'cuda']
+        Device.
+
+    repeat : int >= 1
+        Number of timed runs.
+
+    warmup : int >= 0
+        Number of untimed runs.
+
+    compile : bool
+        If True, compile the module by :func:`torch.compile` with dynamic shapes. The
+        compilation is done in the first warmup run.
+
+    Returns
+    -------
+    out : dict
+        Result of the benchmark.
+
+    """
+    torch.set_num_threads(threads)
+    torch.manual_seed(0)
+    base_rss = get_rss()
+
+    # Modules are built under the default dtype as in the tests.
+    org_dtype = torch.get_default_dtype()
+    torch.set_default_dtype(getattr(torch, dtype))
+    try:
+        setup, unit, _ = CASES[name]
+        module, inputs, count = setup(**size)
+    finally:
+        torch.set_default_dtype(org_dtype)
+    module = module.to(device)
+    if compile:
+        module = torch.compile(module, dynamic=True)
+        warmup = max(1, warmup)
+
+    def cast(x):
+        x = x.to(device)
+        if grad and (x.is_floating_point() or x.is_complex()):
+            x.requires_grad_()
+        return x
+
+    inputs = tuple(cast(x) for x in inputs)
+
+    def run():
+        with torch.set_grad_enabled(grad):
+            y = module(*inputs)
+            if grad:
+                ys = y if isinstance(y, (tuple, list)) else (y,)
+                loss = sum(
+                    z.abs().sum() if z.is_complex() else z.sum()
+                    for z in ys
+                    if torch.is_tensor(z) and z.requires_grad
+                )
+                if torch.is_tensor(loss):
+                    loss.backward()
+        if device == "cuda":
+            torch.cuda.synchronize()
+
+    if device == "cuda":
+        torch.cuda.reset_peak_memory_stats()
+
+    for _ in range(warmup):
+        run()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    wall_time = times[len(times) // 2]
+
+    if device == "cuda":
+        peak_memory = torch.cuda.max_memory_allocated()
+    elif base_rss is not None:
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        peak_memory = max(0, peak_memory - base_rss)
+    else:
+        peak_memory = None
+
+    return {
+        "name": name,
+        "size": size,
+        "dtype": dtype,
+        "threads": threads,
+        "grad": grad,
+        "device": device,
+        "compile": compile,
+        "time": wall_time,
+        "throughput": count / wall_time,
+        "unit": unit,
+        "peak_memory": peak_memory,
+    }
+
+
+def _worker(queue, args):
+    try:
+        queue.put(measure(*args))
+    except Exception as e:  # noqa: BLE001
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def _measure_isolated(args, timeout=None):
+    """Run a single benchmark configuration in a forked process.
+
+    Parameters
+    ----------
+    args : tuple
+        Arguments passed to :func:`measure`.
+
+    timeout : float > 0 or None
+        Time limit in seconds. If None, wait until the process exits.
+
+    Returns
+    -------
+    out : dict
+        Result of the benchmark, or an error if the process died or timed out.
+
+    """
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    p = ctx.Process(target=_worker, args=(queue, args))
+    p.start()
+    start = time.monotonic()
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=1)
+        except queue_module.Empty:
+            if not p.is_alive():
+                # The result may be put just before the process exits.
+                try:
+                    result = queue.get(timeout=1)
+                except queue_module.Empty:
+                    result = {"error": f"process exited with code {p.exitcode}"}
+            elif timeout is not None and timeout < time.monotonic() - start:
+                p.kill()
+                result = {"error": f"timed out after {timeout:g} s"}
+    p.join()
+    return result
+
+
+def run(
+    names=None,
+    dtypes=("float",),
+    threads=(1,),
+    grads=(False, True),
+    device="cpu",
+    repeat=5,
+    warmup=1,
+    compiles=(False,),
+    quick=False,
+    isolate=True,
+    timeout=None,
+    verbose=True,
+):
+    """Run benchmarks.
+
+    Parameters
+    ----------
+    names : list[str] or None
+        Names of the cases to run. If None, all cases are run.
+
+    dtypes : list[str]
+        Data types.
+
+    threads : list[int]
+        Numbers of intra-op threads.
+
+    grads : list[bool]
+        Whether to include backward passes.
+
+    device : ['cpu', 'cuda']
+        Device.
+
+    repeat : int >= 1
+        Number of timed runs.
+
+    warmup : int >= 0
+        Number of untimed runs.
+
+    compiles : list[bool]
+        Whether to compile the modules by :func:`torch.compile`.
+
+    quick : bool
+        If True, only the first size of each case is used.
+
+    isolate : bool
+        If True, run each configuration in a forked process so that the peak memory
+        is measured independently.
+
+    timeout : float > 0 or None
+        Time limit of each configuration in seconds when isolated. A configuration
+        whose process crashes or times out is recorded as an error.
+
+    verbose : bool
+        If True, print progress.
+
+    Returns
+    -------
+    out : dict
+        Metadata and results.
+
+    """
+    if names is None:
+        names = list(CASES)
+
+    results = []
+    for name in names:
+        _, _, sizes = CASES[name]
+        for size in sizes[:1] if quick else sizes:
+            for dtype in dtypes:
+                for n_thread in threads:
+                    for grad, compile in itertools.product(grads, compiles):
+                        args = (name, size, dtype, n_thread, grad, device)
+                        args += (repeat, warmup, compile)
+                        if isolate:
+                            result = _measure_isolated(args, timeout=timeout)
+                        else:
+                            result = measure(*args)
+                        if "error" in result:
+                            result.update(
+                                name=name,
+                                size=size,
+                                dtype=dtype,
+                                threads=n_thread,
+                                grad=grad,
+                                device=device,
+                                compile=compile,
+                            )
+                        results.append(result)
+                        if verbose:
+                            print(format_result(result), flush=True)
+
+    meta = {
+        "diffsptk": diffsptk.__version__,
+        "torch": torch.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+    return {"meta": meta, "results": results}
+
+
+def key(result):
+    """Return the key identifying a configuration."""
+    return (
+        result["name"],
+        json.dumps(result["size"], sort_keys=True),
+        result["dtype"],
+        result["threads"],
+        result["grad"],
+        result["device"],
+        result.get("compile", False),
+    )
+
+
+def format_key(result):
+    size = ",".join(f"{k}={v}" for k, v in result["size"].items())
+    grad = "fwd+bwd" if result["grad"] else "fwd"
+    compile = " compiled" if result.get("compile", False) else ""
+    return (
+        f"{result['name']}[{size}] {result['dtype']} "
+        f"threads={result['threads']} {grad} {result['device']}{compile}"
+    )
+
+
+def format_result(result):
+    if "error" in result:
+        return f"{format_key(result)}: {result['error']}"
+    memory = result["peak_memory"]
+    memory = "n/a" if memory is None else f"{memory / 2**20:.1f} MiB"
+    return (
+        f"{format_key(result)}: {result['time'] * 1e3:.2f} ms, "
+        f"{result['throughput']:.3g} {result['unit']}/s, {memory}"
+    )
+
+
+def compare(base, target, threshold=0.1):
+    """Compare two benchmark results.
+
+    Parameters
+    ----------
+    base : dict
+        Baseline result.
+
+    target : dict
+        Result to be compared.
+
+    threshold : float >= 0
+        Relative slowdown regarded as a regression.
+
+    Returns
+    -------
+    out : list[tuple[dict, dict, float]]
+        Regressions with the ratio of the wall time.
+
+    """
+    base_results = {key(r): r for r in base["results"] if "error" not in r}
+    regressions = []
+    for r in target["results"]:
+        if "error" in r or key(r) not in base_results:
+            continue
+        b = base_results[key(r)]
+        ratio = r["time"] / b["time"]
+        flag = " <- regression" if 1 + threshold < ratio else ""
+        print(
+            f"{format_key(r)}: {b['time'] * 1e3:.2f} ms -> {r['time'] * 1e3:.2f} ms "
+            f"(x{ratio:.2f}){flag}"
+        )
+        if flag:
+            regressions.append((b, r, ratio))
+    return regressions
@@ -2,5 +2,27 @@ from . import functional
 from . import misc
 from . import modules
 from .misc import *
-from .modules import *
 from .version import __version__
+
+__all__ = sorted(
+    {name for name in set(globals()) | set(dir(misc)) if not name.startswith("_")}
+    | set(modules.__all__)
+)
+
+
+def __getattr__(name):
+    # The modules are loaded on first access; see diffsptk.modules.
+    for package in (modules, misc):
+        if name in dir(package):
+            value = getattr(package, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    names = set(globals()) | set(dir(misc)) | set(dir(modules))
+    return sorted(name for name in names if name[0] != "_" or name[:2] == "__")
+
+
+misc.profiling._set_profiling_from_env()
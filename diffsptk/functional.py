@@ -1309,7 +1309,7 @@ def lpc(x, lpc_order, eps=1e-6):
     return nn.LinearPredictiveCodingAnalysis._func(x, lpc_order=lpc_order, eps=eps)
 
 
-def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian"):
+def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian", n_split=256):
     """Convert LPC to LSP.
 
     Parameters
@@ -1326,6 +1326,10 @@ def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian"):
     out_format : ['radian', 'cycle', 'khz', 'hz']
         Output format.
 
+    n_split : int >= 1 or None
+        Number of splits of the frequency axis to search the roots. If None, the
+        roots are found by the eigenvalue decomposition.
+
     Returns
     -------
     out : Tensor [shape=(..., M+1)]
@@ -1333,7 +1337,11 @@ def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian"):
 
     """
     return nn.LinearPredictiveCoefficientsToLineSpectralPairs._func(
-        a, log_gain=log_gain, sample_rate=sample_rate, out_format=out_format
+        a,
+        log_gain=log_gain,
+        sample_rate=sample_rate,
+        out_format=out_format,
+        n_split=n_split,
     )
 
 
@@ -1374,7 +1382,8 @@ def lpccheck(a, margin=1e-16, warn_type="warn"):
         Margin for stability.
 
     warn_type : ['ignore', 'warn', 'exit']
-        Warning type.
+        Warning type. Under :func:`torch.compile`, no warning is issued and an exit
+        is raised by an assertion on the device.
 
     Returns
     -------
@@ -1424,7 +1433,8 @@ def lspcheck(w, rate=0, n_iter=1, warn_type="warn"):
         Number of iterations for modification.
 
     warn_type : ['ignore', 'warn', 'exit']
-        Warning type.
+        Warning type. Under :func:`torch.compile`, no warning is issued and an exit
+        is raised by an assertion on the device.
 
     Returns
     -------
@@ -1437,7 +1447,15 @@ def lspcheck(w, rate=0, n_iter=1, warn_type="warn"):
     )
 
 
-def lsp2sp(w, fft_length, alpha=0, gamma=-1, log_gain=False, out_format="power"):
+def lsp2sp(
+    w,
+    fft_length,
+    alpha=0,
+    gamma=-1,
+    log_gain=False,
+    out_format="power",
+    memory_efficient=False,
+):
     """Convert line spectral pairs to spectrum.
 
     Parameters
@@ -1460,6 +1478,9 @@ def lsp2sp(w, fft_length, alpha=0, gamma=-1, log_gain=False, out_format="power")
     out_format : ['db', 'log-magnitude', 'magnitude', 'power']
         Output format.
 
+    memory_efficient : bool
+        If True, reduce the memory usage by recomputation in the backward pass.
+
     Returns
     -------
     out : Tensor [shape=(..., L/2+1)]
@@ -1473,6 +1494,7 @@ def lsp2sp(w, fft_length, alpha=0, gamma=-1, log_gain=False, out_format="power")
         gamma=gamma,
         log_gain=log_gain,
         out_format=out_format,
+        memory_efficient=memory_efficient,
     )
 
 
@@ -1752,7 +1774,8 @@ def mlsacheck(
         Number of FFT bins, :math:`L`. Used only in non-fast mode.
 
     warn_type : ['ignore', 'warn', 'exit']
-        Warning type.
+        Warning type. Under :func:`torch.compile`, no warning is issued and an exit
+        is raised by an assertion on the device.
 
     mod_type : ['clip', 'scale']
         Modification type.
@@ -2153,6 +2176,7 @@ def stft(
     eps=1e-9,
     relative_floor=None,
     out_format="power",
+    fused=False,
 ):
     """Compute short-time Fourier transform.
 
@@ -2194,6 +2218,10 @@ def stft(
     out_format : ['db', 'log-magnitude', 'magnitude', 'power', 'complex']
         Output format.
 
+    fused : bool
+        If True, feed the windowed frames directly to :func:`torch.stft` without
+        materializing the intermediate frames.
+
     Returns
     -------
     out : Tensor [shape=(..., T/P, N/2+1)]
@@ -2212,6 +2240,7 @@ def stft(
         eps=eps,
         relative_floor=relative_floor,
         out_format=out_format,
+        fused=fused,
     )
 
 
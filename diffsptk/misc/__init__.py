@@ -1,5 +1,28 @@
+from importlib import import_module as _import_module
+from pkgutil import iter_modules as _iter_modules
+
+from .profiling import get_profiling_report
+from .profiling import reset_profiling
+from .profiling import set_profiling
+from .sharing import set_buffer_sharing
+from .sharing import share_buffers
 from .signals import *
 from .utils import TWO_PI as two_pi
 from .utils import get_alpha
 from .utils import read
 from .utils import write
+
+
+def __getattr__(name):
+    if name in _submodules():
+        return _import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    names = set(globals()) | _submodules()
+    return sorted(name for name in names if name[0] != "_" or name[:2] == "__")
+
+
+def _submodules():
+    return {info.name for info in _iter_modules(__path__)}
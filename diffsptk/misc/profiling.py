@@ -0,0 +1,239 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import atexit
+import functools
+import inspect
+import os
+import sys
+import time
+from importlib import import_module
+
+import torch
+from torch import nn
+
+# Original functions replaced by the instrumented ones.
+_originals = {}
+
+# Aggregated statistics: name -> [calls, total time, output bytes, peak memory].
+_stats = {}
+
+# Running CUDA peak memory of the nested calls.
+_peaks = []
+
+# CUDA events of the calls whose elapsed time has not been added to the statistics.
+_events = []
+
+
+def _nbytes(x):
+    if torch.is_tensor(x):
+        return x.nelement() * x.element_size()
+    if isinstance(x, (tuple, list)):
+        return sum(_nbytes(y) for y in x)
+    return 0
+
+
+def _is_cuda(x):
+    if torch.is_tensor(x):
+        return x.is_cuda
+    if isinstance(x, (tuple, list)):
+        return any(_is_cuda(y) for y in x)
+    return False
+
+
+def _flush_events():
+    # Wait for the recorded events only when the statistics are read.
+    if _events:
+        torch.cuda.synchronize()
+        for name, start, end in _events:
+            stats = _stats.setdefault(name, [0, 0.0, 0, 0])
+            stats[1] += start.elapsed_time(end) * 1e-3
+        _events.clear()
+
+
+def _instrument(name, func):
+    label = f"diffsptk.{name}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # The memory statistics are tracked by the allocator on the host, and thus
+        # they do not require synchronization.
+        cuda = torch.cuda.is_available() and torch.cuda.is_initialized()
+        if cuda:
+            if _peaks:
+                _peaks[-1] = max(_peaks[-1], torch.cuda.max_memory_allocated())
+            torch.cuda.reset_peak_memory_stats()
+            _peaks.append(0)
+            base = torch.cuda.memory_allocated()
+
+        # The time of the calls on CUDA tensors is measured by CUDA events so that
+        # the asynchronous execution is not serialized by the profiler.
+        timed = cuda and (_is_cuda(args) or _is_cuda(list(kwargs.values())))
+        if timed:
+            start = torch.cuda.Event(enable_timing=True)
+            start.record()
+        else:
+            start = time.perf_counter()
+        try:
+            with torch.profiler.record_function(label):
+                y = func(*args, **kwargs)
+        finally:
+            if timed:
+                end = torch.cuda.Event(enable_timing=True)
+                end.record()
+                _events.append((name, start, end))
+                elapsed = 0.0
+            else:
+                elapsed = time.perf_counter() - start
+            peak = 0
+            if cuda:
+                peak = max(_peaks.pop(), torch.cuda.max_memory_allocated())
+                if _peaks:
+                    _peaks[-1] = max(_peaks[-1], peak)
+                peak -= base
+
+        stats = _stats.setdefault(name, [0, 0.0, 0, 0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += _nbytes(y)
+        stats[3] = max(stats[3], peak)
+        return y
+
+    return wrapper
+
+
+def _targets():
+    # Load all the lazily imported submodules.
+    modules = import_module("diffsptk.modules")
+    for name in dir(modules):
+        getattr(modules, name)
+    functional = import_module("diffsptk.functional")
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith("diffsptk.modules."):
+            continue
+        for cls in vars(module).values():
+            if (
+                inspect.isclass(cls)
+                and issubclass(cls, nn.Module)
+                and cls.__module__ == module_name
+                and "forward" in vars(cls)
+            ):
+                yield cls, "forward", cls.__name__
+    for func_name, func in vars(functional).items():
+        if (
+            inspect.isfunction(func)
+            and func.__module__ == functional.__name__
+            and not func_name.startswith("_")
+        ):
+            yield functional, func_name, f"functional.{func_name}"
+
+
+def set_profiling(enabled=True):
+    """Enable or disable the profiling of diffsptk modules and functions.
+
+    If enabled, the forward method of every module and every function in
+    :mod:`diffsptk.functional` is wrapped by
+    :func:`torch.profiler.record_function` and the wall-clock time, the size of the
+    outputs, and the peak CUDA memory are accumulated. The time of the calls on CUDA
+    tensors is measured by CUDA events, which are synchronized only when the report
+    is made. If disabled, the original methods are restored, i.e., there is no
+    overhead. Profiling can also be enabled by setting the environment variable
+    `DIFFSPTK_PROFILING=1`, in which case the report is printed at exit.
+
+    Parameters
+    ----------
+    enabled : bool
+        If True, enable profiling, otherwise disable it.
+
+    """
+    if enabled:
+        if _originals:
+            return
+        for owner, attr, name in _targets():
+            func = getattr(owner, attr)
+            _originals[(owner, attr)] = func
+            setattr(owner, attr, _instrument(name, func))
+    else:
+        for (owner, attr), func in _originals.items():
+            setattr(owner, attr, func)
+        _originals.clear()
+
+
+def reset_profiling():
+    """Clear the accumulated profiling statistics."""
+    _events.clear()
+    _stats.clear()
+
+
+def get_profiling_report(sort_by="total"):
+    """Get the aggregated profiling report.
+
+    Nested calls are counted in both the caller and the callee, e.g., the time of
+    :class:`~diffsptk.Frame` called in :class:`~diffsptk.STFT` is also included in
+    that of :class:`~diffsptk.STFT`.
+
+    Parameters
+    ----------
+    sort_by : ['total', 'mean', 'calls', 'bytes', 'peak']
+        Sort key.
+
+    Returns
+    -------
+    out : str
+        Report.
+
+    """
+    index = {"calls": 0, "total": 1, "mean": 1, "bytes": 2, "peak": 3}[sort_by]
+    _flush_events()
+
+    def key(item):
+        stats = item[1]
+        if sort_by == "mean":
+            return stats[1] / stats[0]
+        return stats[index]
+
+    header = ["Name", "Calls", "Total [ms]", "Mean [ms]", "Output [MiB]", "Peak [MiB]"]
+    rows = []
+    for name, (calls, total, nbytes, peak) in sorted(
+        _stats.items(), key=key, reverse=True
+    ):
+        rows.append(
+            [
+                name,
+                f"{calls}",
+                f"{total * 1e3:.3f}",
+                f"{total * 1e3 / calls:.3f}",
+                f"{nbytes / 2**20:.3f}",
+                f"{peak / 2**20:.3f}",
+            ]
+        )
+    widths = [max(len(r[i]) for r in rows + [header]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            c.ljust(w) if i == 0 else c.rjust(w)
+            for i, (c, w) in enumerate(zip(row, widths))
+        )
+        for row in [header] + rows
+    ]
+    lines.insert(1, "-" * len(lines[0]))
+    return "\n".join(lines)
+
+
+def _set_profiling_from_env():
+    if os.environ.get("DIFFSPTK_PROFILING", "0") in ("", "0"):
+        return
+    set_profiling(True)
+    atexit.register(lambda: print(get_profiling_report(), file=sys.stderr))
@@ -0,0 +1,144 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import hashlib
+import weakref
+
+import torch
+from torch import nn
+
+# Shared tensors indexed by their content.
+_registry = weakref.WeakValueDictionary()
+
+# Handles of the global registration hooks.
+_handles = []
+
+
+def _is_target(module):
+    return type(module).__module__.startswith("diffsptk.") and getattr(
+        module, "_share_buffers", True
+    )
+
+
+def _key(x):
+    data = x.detach().reshape(-1).cpu()
+    if data.dtype != torch.bool:
+        data = data.view(torch.uint8)
+    digest = hashlib.sha1(data.numpy().tobytes(), usedforsecurity=False).hexdigest()
+    return digest, x.dtype, tuple(x.shape), x.stride(), str(x.device)
+
+
+def _share(x):
+    key = _key(x)
+    y = _registry.get(key)
+    if y is not None and y is not x and torch.equal(x, y):
+        return y.detach()
+    _registry[key] = x
+    return x
+
+
+def _unshare(param):
+    # Copy the shared storage before the parameter is updated for the first time.
+    if getattr(param, "_shared", False):
+        param.data = param.data.clone()
+        param._shared = False
+
+
+def _unshare_all(module, *args, **kwargs):
+    for param in module.parameters(recurse=False):
+        _unshare(param)
+
+
+def _share_buffer(module, name, buffer):
+    # Private buffers hold a running state of the module and are never shared.
+    if buffer is None or buffer.requires_grad or name.startswith("_"):
+        return None
+    if not _is_target(module):
+        return None
+    return _share(buffer)
+
+
+def _share_parameter(module, name, param):
+    if param is None or not _is_target(module):
+        return None
+    shared = _share(param)
+    if shared is not param:
+        param = nn.Parameter(shared, requires_grad=param.requires_grad)
+    param._shared = True
+    param.register_post_accumulate_grad_hook(_unshare)
+    if not getattr(module, "_unshare_hooked", False):
+        module.register_load_state_dict_pre_hook(_unshare_all)
+        module._unshare_hooked = True
+    return param
+
+
+def set_buffer_sharing(enabled=True):
+    """Enable or disable the sharing of identical buffers among diffsptk modules.
+
+    If enabled, a buffer registered by a diffsptk module is looked up in a registry
+    by its content, i.e., its dtype, shape, stride, device, and values, and the
+    existing tensor is reused if found. As a result, modules constructed with the
+    same hyperparameters share one storage, which reduces the resident memory and
+    the size of the saved state dict. Learnable parameters are also shared but are
+    copied before their first update by backpropagation or loading a state dict.
+    Modules that update their buffers in place, e.g., :class:`~diffsptk.GMM`, are
+    excluded. Note that the sharing is lost by :meth:`torch.nn.Module.to` with a
+    new device or dtype; use :func:`~diffsptk.share_buffers` after that.
+
+    Parameters
+    ----------
+    enabled : bool
+        If True, enable the sharing for the modules constructed afterward, otherwise
+        disable it.
+
+    """
+    if enabled:
+        if _handles:
+            return
+        _handles.append(
+            nn.modules.module.register_module_buffer_registration_hook(_share_buffer)
+        )
+        _handles.append(
+            nn.modules.module.register_module_parameter_registration_hook(
+                _share_parameter
+            )
+        )
+    else:
+        for handle in _handles:
+            handle.remove()
+        _handles.clear()
+
+
+def share_buffers(module):
+    """Make the diffsptk modules in the given module share identical buffers.
+
+    Parameters
+    ----------
+    module : torch.nn.Module
+        Module containing diffsptk modules.
+
+    Returns
+    -------
+    out : torch.nn.Module
+        The given module whose buffers are replaced in place.
+
+    """
+    for m in module.modules():
+        for name, buffer in m._buffers.items():
+            shared = _share_buffer(m, name, buffer)
+            if shared is not None:
+                m._buffers[name] = shared
+    return module
@@ -19,10 +19,8 @@ import math
 from importlib import import_module
 
 import numpy as np
-import soundfile as sf
 import torch
 import torch.nn.functional as F
-import torchaudio
 from torch import nn
 
 UNVOICED_SYMBOL = 0
@@ -291,6 +289,88 @@ def hankel(x):
     return X
 
 
+def solve_toeplitz_plus_hankel(t, h, b):
+    """Solve a Toeplitz-plus-Hankel system in :math:`O(N^2)` operations.
+
+    The system :math:`(T + H)x = b` is equivalent to the symmetric block Toeplitz
+    system :math:`[T, HJ; (HJ)^T, T][x; Jx] = [b; Jb]`, where :math:`J` is the
+    exchange matrix. Interleaving the two halves gives :math:`2 \\times 2` blocks,
+    which is solved by the block Levinson recursion.
+
+    Parameters
+    ----------
+    t : Tensor [shape=(..., N)]
+        First row of the symmetric Toeplitz matrix.
+
+    h : Tensor [shape=(..., 2N-1)]
+        Anti-diagonals of the Hankel matrix.
+
+    b : Tensor [shape=(..., N)]
+        Right-hand side.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., N)]
+        Solution.
+
+    """
+    N = t.size(-1)
+
+    # The block system is similar to diag(T + H, T - H). Moving a constant from the
+    # Hankel to the Toeplitz part keeps T + H but makes T - H regular, e.g., it is
+    # singular in mel-cepstral analysis as its first row is zero.
+    delta = t[..., :1]
+    t = t + delta
+    h = h - delta
+
+    # Make the blocks A_k = [t_k, h_{N-1+k}; h_{N-1-k}, t_k]. The block index is put on
+    # the last axis so that the reductions over it are batched matrix products.
+    k = torch.arange(N, device=t.device)
+    A = torch.stack(
+        [
+            torch.stack([t, h[..., N - 1 + k]], dim=-2),
+            torch.stack([h[..., N - 1 - k], t], dim=-2),
+        ],
+        dim=-3,
+    )  # (..., 2, 2, N)
+    Ar = A.flip(-1)
+    c = torch.stack([b, b.flip(-1)], dim=-2)  # (..., 2, N)
+
+    def inv(X):
+        a, b, c, d = torch.unbind(X.flatten(-2), dim=-1)
+        Y = torch.stack((d, -b, -c, a), dim=-1) / (a * d - b * c).unsqueeze(-1)
+        return Y.unflatten(-1, (2, 2))
+
+    def rmul(X, Y):
+        return (
+            X[..., :, :1, :] * Y[..., None, 0, :, None]
+            + X[..., :, 1:, :] * Y[..., None, 1, :, None]
+        )
+
+    def exchange(X):
+        return X.flip(-3, -2, -1)
+
+    # The forward vector U is the first block column of the inverse of the leading
+    # block submatrix. The matrix is centrosymmetric, so the last block column is
+    # given by exchanging U, and only U needs to be updated.
+    eye = torch.eye(2, dtype=t.dtype, device=t.device)
+    U = inv(A[..., 0]).unsqueeze(-1)
+    x = torch.matmul(U[..., 0], c[..., :1])
+    for m in range(1, N):
+        Af = Ar[..., N - 1 - m : N - 1]  # A_m, ..., A_1
+        eu = torch.matmul(Af[..., 0, :], U[..., 0, :, :].mT)
+        eu = eu + torch.matmul(Af[..., 1, :], U[..., 1, :, :].mT)
+        ex = (Af * x.unsqueeze(-3)).sum((-2, -1))
+        V1 = F.pad(exchange(U), (1, 0))
+        U1 = F.pad(U, (0, 1))
+        U = rmul(U1 - rmul(V1, eu), inv(eye - torch.matmul(eu.flip(-2, -1), eu)))
+        e = c[..., m] - ex
+        x = F.pad(x, (0, 1)) + (exchange(U) * e[..., None, :, None]).sum(-2)
+
+    # The second half is the reversal of the first one.
+    return 0.5 * (x[..., 0, :] + x[..., 1, :].flip(-1))
+
+
 def vander(x):
     X = torch.linalg.vander(x).transpose(-2, -1)
     return X
@@ -325,7 +405,8 @@ def iir(x, b=None, a=None):
         a = F.pad(a, (0, diff))
     elif diff < 0:
         b = F.pad(b, (0, -diff))
-    y = torchaudio.functional.lfilter(x, a, b, clamp=False, batching=True)
+    lfilter = delayed_import("torchaudio.functional", "lfilter")
+    y = lfilter(x, a, b, clamp=False, batching=True)
     return y
 
 
@@ -355,12 +436,14 @@ def deconv1d(x, weight):
 
     """
     assert weight.dim() == 1
-    b = x.view(-1, x.size(-1))
-    a = weight.view(1, -1).expand(b.size(0), -1)
-    impulse = F.pad(torch.ones_like(b[..., :1]), (0, b.size(-1) - a.size(-1)))
-    y = iir(impulse, b, a)
-    y = y.view(x.size()[:-1] + y.size()[-1:])
-    return y
+    # Solve the lower triangular Toeplitz system given by the filter coefficients.
+    M = weight.size(-1) - 1
+    N = x.size(-1) - M
+    index = torch.arange(N, device=x.device)
+    index = index.unsqueeze(-1) - index.unsqueeze(0)
+    W = F.pad(weight, (0, 1))[torch.where((0 <= index) & (index <= M), index, M + 1)]
+    y = torch.linalg.solve_triangular(W, x[..., :N].unsqueeze(-1), upper=False)
+    return y.squeeze(-1)
 
 
 def check_size(x, y, cause):
@@ -402,7 +485,7 @@ def read(filename, double=False, device=None, **kwargs):
     16000
 
     """
-    x, sr = sf.read(filename, **kwargs)
+    x, sr = delayed_import("soundfile", "read")(filename, **kwargs)
     if double:
         x = torch.DoubleTensor(x)
     else:
@@ -437,4 +520,4 @@ def write(filename, x, sr, **kwargs):
 
     """
     x = x.cpu().numpy() if torch.is_tensor(x) else x
-    sf.write(filename, x, sr, **kwargs)
+    delayed_import("soundfile", "write")(filename, x, sr, **kwargs)
@@ -29,17 +29,14 @@ def dc_correction(power_spectrum, f0, sample_rate, fft_length, ramp):
     return power_spectrum
 
 
-def get_windowed_waveform(
-    x,
+def get_window(
     f0,
     window_length_ratio,
     bias_ratio,
-    frame_period,
     sample_rate,
     fft_length,
     window_type,
     normalize_window,
-    eps,
     ramp,
 ):
     # SetParametersForGetWindowedWaveform()
@@ -60,17 +57,12 @@ def get_windowed_waveform(
     window *= mask
     if normalize_window:
         window = window / torch.linalg.vector_norm(window, dim=-1, keepdim=True)
+    return window, mask
+
 
+def apply_window(frames, window, mask, eps):
     # GetWindowedWaveform()
-    waveform = (
-        Frame._func(
-            x,
-            fft_length,
-            frame_period,
-            mode="replicate",
-        )
-        * window
-    )
+    waveform = frames * window
     waveform += torch.randn_like(waveform) * eps * mask
     tmp_weight1 = waveform.sum(dim=-1, keepdim=True)
     tmp_weight2 = window.sum(dim=-1, keepdim=True)
@@ -79,6 +71,33 @@ def get_windowed_waveform(
     return waveform
 
 
+def get_windowed_waveform(
+    x,
+    f0,
+    window_length_ratio,
+    bias_ratio,
+    frame_period,
+    sample_rate,
+    fft_length,
+    window_type,
+    normalize_window,
+    eps,
+    ramp,
+):
+    window, mask = get_window(
+        f0,
+        window_length_ratio,
+        bias_ratio,
+        sample_rate,
+        fft_length,
+        window_type,
+        normalize_window,
+        ramp,
+    )
+    frames = Frame._func(x, fft_length, frame_period, mode="replicate")
+    return apply_window(frames, window, mask, eps)
+
+
 def interp1Q(x, shift, y, xi):
     z = (xi - x) / shift
     xi_base = torch.clip(z.long(), min=0)
@@ -15,15 +15,11 @@
 # ------------------------------------------------------------------------ #
 
 import torch
-import torch.nn.functional as F
 from scipy.special import comb
 from torch import nn
 
 from ..misc.utils import check_size
-from ..misc.utils import hankel
 from ..misc.utils import to
-from ..misc.utils import vander
-from .root_pol import PolynomialToRoots
 
 
 class AutocorrelationToCompositeSinusoidalModelCoefficients(nn.Module):
@@ -83,16 +79,19 @@ class AutocorrelationToCompositeSinusoidalModelCoefficients(nn.Module):
     def _forward(r, C):
         assert r.dtype == torch.double
         u = torch.matmul(r, C)
-        u1, u2 = torch.tensor_split(u, 2, dim=-1)
-
-        U = hankel(-u)
-        p = torch.matmul(U.inverse(), u2.unsqueeze(-1)).squeeze(-1)
-        x = PolynomialToRoots._func(F.pad(p.flip(-1), (1, 0), value=1))
-        x, _ = torch.sort(x.real, descending=True)
+        u1, _ = torch.tensor_split(u, 2, dim=-1)
+
+        # The roots of the polynomial given by the Hankel system are the eigenvalues
+        # of the Jacobi matrix.
+        a, b = AutocorrelationToCompositeSinusoidalModelCoefficients._solve_hankel(u)
+        e = torch.sqrt(b[..., 1:])
+        J = torch.diag_embed(a) + torch.diag_embed(e, 1) + torch.diag_embed(e, -1)
+        x = torch.linalg.eigvalsh(J).flip(-1)
         w = torch.acos(x)
 
-        V = vander(x)
-        m = torch.matmul(V.inverse(), u1.unsqueeze(-1)).squeeze(-1)
+        m = AutocorrelationToCompositeSinusoidalModelCoefficients._solve_vandermonde(
+            x, u1
+        )
         c = torch.cat((w, m), dim=-1)
         return c
 
@@ -103,6 +102,40 @@ class AutocorrelationToCompositeSinusoidalModelCoefficients(nn.Module):
         )
         return AutocorrelationToCompositeSinusoidalModelCoefficients._forward(r, C)
 
+    @staticmethod
+    def _solve_hankel(u):
+        # Compute the recurrence coefficients of the orthogonal polynomials with
+        # respect to the moments u by the Chebyshev algorithm in O(N^2).
+        N = u.size(-1) // 2
+        s0 = u.new_zeros(*u.shape[:-1], 2 * N + 1)
+        s1 = u
+        r0 = torch.zeros_like(u[..., :1])
+        d0 = torch.ones_like(u[..., :1])
+        a = []
+        b = []
+        for k in range(N):
+            d1 = s1[..., k : k + 1]
+            r1 = s1[..., k + 1 : k + 2] / d1
+            a.append(r1 - r0)
+            b.append(d1 / d0)
+            s0, s1 = s1, s1[..., 1:] - a[-1] * s1[..., :-1] - b[-1] * s0[..., :-2]
+            r0, d0 = r1, d1
+        return torch.cat(a, dim=-1), torch.cat(b, dim=-1)
+
+    @staticmethod
+    def _solve_vandermonde(x, b):
+        # Solve the transposed Vandermonde system by the Bjorck-Pereyra algorithm.
+        N = x.size(-1) - 1
+        for k in range(N):
+            y = b[..., k + 1 :] - x[..., k : k + 1] * b[..., k:-1]
+            b = torch.cat((b[..., : k + 1], y), dim=-1)
+        for k in range(N - 1, -1, -1):
+            y = b[..., k + 1 :] / (x[..., k + 1 :] - x[..., : N - k])
+            b = torch.cat((b[..., : k + 1], y), dim=-1)
+            y = b[..., k:-1] - b[..., k + 1 :]
+            b = torch.cat((b[..., :k], y, b[..., -1:]), dim=-1)
+        return b
+
     @staticmethod
     def _precompute(csm_order, dtype=None, device=None):
         N = csm_order + 1
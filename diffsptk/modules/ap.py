@@ -22,9 +22,11 @@ import torch.nn.functional as F
 from torch import nn
 
 from ..misc.utils import numpy_to_torch
+from ..misc.world import apply_window
 from ..misc.world import dc_correction
-from ..misc.world import get_windowed_waveform
+from ..misc.world import get_window
 from ..misc.world import linear_smoothing
+from .frame import Frame
 from .spec import Spectrum
 from .window import Window
 
@@ -369,13 +371,17 @@ class AperiodicityExtractionByD4C(nn.Module):
         fft_length=None,
         threshold=0.0,
         default_f0=150,
+        block_size=None,
     ):
         super().__init__()
 
+        assert block_size is None or 1 <= block_size
+
         self.frame_period = frame_period
         self.sample_rate = sample_rate
         self.threshold = threshold
         self.default_f0 = default_f0
+        self.block_size = block_size
 
         freqency_interval = 3000
         upper_limit = 15000
@@ -425,25 +431,51 @@ class AperiodicityExtractionByD4C(nn.Module):
         self.register_buffer("ramp", torch.arange(self.fft_length_d4c))
 
     def forward(self, x, f0):
+        # All the windowed waveforms are taken from a single framing with the longest
+        # FFT length since the frames with a shorter FFT length are centered slices.
+        frames = Frame._func(
+            x, self.fft_length_d4c, self.frame_period, mode="replicate"
+        )
+
+        N = f0.size(1)
+        if self.block_size is None or N <= self.block_size:
+            return self._analyze(frames, f0)
+        return torch.cat(
+            [
+                self._analyze(
+                    frames[:, i : i + self.block_size], f0[:, i : i + self.block_size]
+                )
+                for i in range(0, N, self.block_size)
+            ],
+            dim=1,
+        )
+
+    def _analyze(self, frames, f0):
         f0 = (
             torch.where(f0 < self.lowest_f0, self.default_f0, f0).unsqueeze(-1).detach()
         )
 
-        # D4CLoveTrain()
-        if 0 < self.threshold:
-            waveform = get_windowed_waveform(
-                x,
+        def get_windowed_waveform(
+            window_length_ratio, bias_ratio, fft_length, window_type
+        ):
+            window, mask = get_window(
                 f0,
-                3,
-                0,
-                self.frame_period,
+                window_length_ratio,
+                bias_ratio,
                 self.sample_rate,
-                self.fft_length_love,
-                "blackman",
+                fft_length,
+                window_type,
                 False,
-                1e-6,
                 self.ramp,
             )
+            offset = frames.size(-1) // 2 - fft_length // 2
+            return apply_window(
+                frames[..., offset : offset + fft_length], window, mask, 1e-6
+            )
+
+        # D4CLoveTrain()
+        if 0 < self.threshold:
+            waveform = get_windowed_waveform(3, 0, self.fft_length_love, "blackman")
             power_spectrum = self.spec_love(waveform)
             rate = self.sample_rate / self.fft_length_love
             boundary0 = math.ceil(100 / rate) + 1
@@ -456,19 +488,9 @@ class AperiodicityExtractionByD4C(nn.Module):
             ).unsqueeze(-1)
 
         # GetCentroid()
-        def get_centroid(x, f0, bias_ratio):
+        def get_centroid(bias_ratio):
             waveform = get_windowed_waveform(
-                x,
-                f0,
-                4,
-                bias_ratio,
-                self.frame_period,
-                self.sample_rate,
-                self.fft_length_d4c,
-                "blackman",
-                False,
-                1e-6,
-                self.ramp,
+                4, bias_ratio, self.fft_length_d4c, "blackman"
             )
             power = waveform.square().sum(dim=-1, keepdim=True)
             waveform = waveform / torch.sqrt(power)
@@ -478,27 +500,15 @@ class AperiodicityExtractionByD4C(nn.Module):
             return centroid
 
         # GetStaticCentroid()
-        centroid1 = get_centroid(x, f0, -0.25)
-        centroid2 = get_centroid(x, f0, 0.25)
+        centroid1 = get_centroid(-0.25)
+        centroid2 = get_centroid(0.25)
         static_centroid = centroid1 + centroid2
         static_centroid = dc_correction(
             static_centroid, f0, self.sample_rate, self.fft_length_d4c, self.ramp
         )
 
         # GetSmoothedPowerSpectrum()
-        waveform = get_windowed_waveform(
-            x,
-            f0,
-            4,
-            0,
-            self.frame_period,
-            self.sample_rate,
-            self.fft_length_love,
-            "hanning",
-            False,
-            1e-6,
-            self.ramp,
-        )
+        waveform = get_windowed_waveform(4, 0, self.fft_length_love, "hanning")
         power_spectrum = self.spec_d4c(waveform)
         power_spectrum = dc_correction(
             power_spectrum, f0, self.sample_rate, self.fft_length_d4c, self.ramp
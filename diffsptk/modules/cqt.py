@@ -179,6 +179,7 @@ class ConstantQTransform(nn.Module):
                 fp.append(fp[i])
                 sr.append(sr[i])
 
+        bands = []
         transforms = []
         resamplers = []
 
@@ -195,6 +196,12 @@ class ConstantQTransform(nn.Module):
                 alpha=alpha[sl],
             )
 
+            # Keep only the frequency band where the basis is nonzero.
+            _, nonzero_bins = fft_basis.nonzero()
+            band = slice(nonzero_bins.min(), nonzero_bins.max() + 1)
+            bands.append(band)
+
+            fft_basis = fft_basis[:, band]
             fft_basis *= np.sqrt(sample_rate / sr[i])
             self.register_buffer(
                 f"fft_basis_{i}", numpy_to_torch(fft_basis.todense()).T
@@ -229,6 +236,7 @@ class ConstantQTransform(nn.Module):
             else:
                 resamplers.append(Lambda(lambda x: x))
 
+        self.bands = bands
         self.transforms = nn.ModuleList(transforms)
         self.resamplers = nn.ModuleList(resamplers)
 
@@ -258,7 +266,7 @@ class ConstantQTransform(nn.Module):
 
         cs = []
         for i in range(len(self.transforms)):
-            X = self.transforms[i](x)
+            X = self.transforms[i](x)[..., self.bands[i]]
             W = getattr(self, f"fft_basis_{i}")
             cs.append(torch.matmul(X, W))
             if i != len(self.transforms) - 1:
@@ -119,7 +119,7 @@ class ExcitationGeneration(nn.Module):
         # Extend right side for interpolation.
         tmp_mask = F.pad(base_mask, (1, 0))
         tmp_mask = torch.eq(torch.diff(tmp_mask), -1)
-        p[tmp_mask] = torch.roll(p, 1, dims=-1)[tmp_mask]
+        p = torch.where(tmp_mask, torch.roll(p, 1, dims=-1), p)
 
         # Interpolate pitch.
         if p.dim() != 1:
@@ -127,19 +127,18 @@ class ExcitationGeneration(nn.Module):
         p = LinearInterpolation._func(p, frame_period)
         if p.dim() != 1:
             p = p.transpose(-2, -1)
-        p *= mask
+        p = p * mask
 
         # Compute phase.
         voiced_pos = torch.gt(p, 0)
-        q = torch.zeros_like(p)
-        q[voiced_pos] = torch.reciprocal(p[voiced_pos])
+        q = torch.where(voiced_pos, torch.reciprocal(p), 0)
         s = torch.cumsum(q.double(), dim=-1)
         bias, _ = torch.cummax(s * ~mask, dim=-1)
         phase = (s - bias).to(p.dtype)
         if init_phase == "zeros":
             pass
         elif init_phase == "random":
-            phase += torch.rand_like(p[..., :1])
+            phase = phase + torch.rand_like(p[..., :1])
         else:
             raise ValueError(f"init_phase {init_phase} is not supported.")
 
@@ -148,7 +147,6 @@ class ExcitationGeneration(nn.Module):
             unipolar = voiced_region == "pulse"
         else:
             unipolar = polarity == "unipolar"
-        e = torch.zeros_like(p)
         if voiced_region == "pulse":
 
             def get_pulse_pos(p):
@@ -156,46 +154,45 @@ class ExcitationGeneration(nn.Module):
                 r = F.pad(r, (1, 0))
                 return torch.ge(torch.diff(r), 1)
 
-            if unipolar:
-                pulse_pos = get_pulse_pos(phase)
-                e[pulse_pos] = torch.sqrt(p[pulse_pos])
-            else:
-                pulse_pos1 = get_pulse_pos(phase)
-                pulse_pos2 = get_pulse_pos(0.5 * phase)
-                e[pulse_pos1] = torch.sqrt(p[pulse_pos1])
-                e[pulse_pos1 & ~pulse_pos2] *= -1
-        elif voiced_region == "sinusoidal":
-            if unipolar:
-                e[mask] = 0.5 * (1 - torch.cos(TWO_PI * phase[mask]))
-            else:
-                e[mask] = torch.sin(TWO_PI * phase[mask])
-        elif voiced_region == "sawtooth":
-            if unipolar:
-                e[mask] = torch.fmod(phase[mask], 1)
-            else:
-                e[mask] = 2 * torch.fmod(phase[mask], 1) - 1
-        elif voiced_region == "inverted-sawtooth":
-            if unipolar:
-                e[mask] = 1 - torch.fmod(phase[mask], 1)
-            else:
-                e[mask] = 1 - 2 * torch.fmod(phase[mask], 1)
-        elif voiced_region == "triangle":
-            if unipolar:
-                e[mask] = torch.abs(2 * torch.fmod(phase[mask] + 0.5, 1) - 1)
-            else:
-                e[mask] = 2 * torch.abs(2 * torch.fmod(phase[mask] + 0.75, 1) - 1) - 1
-        elif voiced_region == "square":
-            if unipolar:
-                e[mask] = torch.le(torch.fmod(phase[mask], 1), 0.5).to(e.dtype)
-            else:
-                e[mask] = 2 * torch.le(torch.fmod(phase[mask], 1), 0.5).to(e.dtype) - 1
+            pulse_pos = get_pulse_pos(phase)
+            e = torch.where(pulse_pos, torch.sqrt(p), 0)
+            if not unipolar:
+                negative_pos = pulse_pos & ~get_pulse_pos(0.5 * phase)
+                e = torch.where(negative_pos, -e, e)
         else:
-            raise ValueError(f"voiced_region {voiced_region} is not supported.")
+            if voiced_region == "sinusoidal":
+                if unipolar:
+                    e = 0.5 * (1 - torch.cos(TWO_PI * phase))
+                else:
+                    e = torch.sin(TWO_PI * phase)
+            elif voiced_region == "sawtooth":
+                if unipolar:
+                    e = torch.fmod(phase, 1)
+                else:
+                    e = 2 * torch.fmod(phase, 1) - 1
+            elif voiced_region == "inverted-sawtooth":
+                if unipolar:
+                    e = 1 - torch.fmod(phase, 1)
+                else:
+                    e = 1 - 2 * torch.fmod(phase, 1)
+            elif voiced_region == "triangle":
+                if unipolar:
+                    e = torch.abs(2 * torch.fmod(phase + 0.5, 1) - 1)
+                else:
+                    e = 2 * torch.abs(2 * torch.fmod(phase + 0.75, 1) - 1) - 1
+            elif voiced_region == "square":
+                if unipolar:
+                    e = torch.le(torch.fmod(phase, 1), 0.5).to(p.dtype)
+                else:
+                    e = 2 * torch.le(torch.fmod(phase, 1), 0.5).to(p.dtype) - 1
+            else:
+                raise ValueError(f"voiced_region {voiced_region} is not supported.")
+            e = torch.where(mask, e, 0)
 
         if unvoiced_region == "zeros":
             pass
         elif unvoiced_region == "gauss":
-            e[~mask] = torch.randn(torch.sum(~mask), device=e.device)
+            e = torch.where(mask, e, torch.randn_like(e))
         else:
             raise ValueError(f"unvoiced_region {unvoiced_region} is not supported.")
         return e
@@ -74,6 +74,9 @@ class GaussianMixtureModeling(nn.Module):
 
     """
 
+    # The buffers are updated in place and must not be shared.
+    _share_buffers = False
+
     def __init__(
         self,
         order,
@@ -145,6 +148,10 @@ class GaussianMixtureModeling(nn.Module):
         self.register_buffer("mu", torch.randn(K, L))
         self.register_buffer("sigma", torch.eye(L).repeat(K, 1, 1))
 
+        # Cache of regression matrices used in the transform method.
+        self._regression = None
+        self.register_load_state_dict_post_hook(GaussianMixtureModeling._clear_cache)
+
         # Save UBM parameters.
         if ubm is not None:
             self.set_params(ubm)
@@ -163,6 +170,7 @@ class GaussianMixtureModeling(nn.Module):
 
         """
         w, mu, sigma = params
+        self._clear_cache(self)
         if w is not None:
             self.w[:] = w
         if mu is not None:
@@ -345,6 +353,7 @@ class GaussianMixtureModeling(nn.Module):
                 break
             prev_log_likelihood = log_likelihood
 
+        self._clear_cache(self)
         ret = [[self.w, self.mu, self.sigma]]
 
         if return_posterior:
@@ -354,14 +363,19 @@ class GaussianMixtureModeling(nn.Module):
         ret.append(log_likelihood)
         return ret
 
-    def transform(self, x):
-        """Transform input vectors based on a single mixture sequence.
+    def transform(self, x, mode="hard"):
+        """Transform input vectors based on the conditional mean of the GMM.
 
         Parameters
         ----------
         x : Tensor [shape=(T, N+1)]
             Input vectors.
 
+        mode : ['hard', 'mmse']
+            If 'hard', use the single mixture sequence maximizing the posterior
+            probabilities. If 'mmse', average the conditional means over the mixture
+            components weighted by the posterior probabilities.
+
         Returns
         -------
         y : Tensor [shape=(T, M-N)]
@@ -381,17 +395,70 @@ class GaussianMixtureModeling(nn.Module):
         if self.order == N:
             return None, indices, log_prob
 
-        L = N + 1
-        sigma_yx = self.sigma[:, L:, :L]
-        sigma_xx = self.sigma[:, :L, :L]
-        sigma_yx_xx = torch.matmul(sigma_yx, torch.inverse(sigma_xx))
-        mu_x = self.mu[indices, :L]
-        mu_y = self.mu[indices, L:]
-        diff = (x - mu_x).unsqueeze(-1)
-        E = mu_y + torch.matmul(sigma_yx_xx[indices], diff).squeeze(-1)
-        y = E
+        # E[y|x,k] = A_k x + b_k
+        A, b = self._get_regression(N + 1)  # (K, N+1, M-N), (K, M-N)
+        if mode == "hard":
+            y = x.new_empty(x.size(0), b.size(-1))
+            order = torch.argsort(indices)
+            counts = torch.bincount(indices, minlength=self.n_mixture).tolist()
+            for k, o in enumerate(torch.split(order, counts)):
+                if len(o):
+                    y[o] = torch.addmm(b[k], x[o], A[k])
+        elif mode == "mmse":
+            y = torch.matmul(posterior, b)
+            for k in range(self.n_mixture):
+                y += posterior[:, k : k + 1] * torch.matmul(x, A[k])
+        else:
+            raise ValueError(f"mode {mode} is not supported.")
         return y, indices, log_prob
 
+    def _get_regression(self, L):
+        """Get the cached regression matrices and biases for conditional means.
+
+        Parameters
+        ----------
+        L : int >= 1
+            Dimension of input vectors.
+
+        Returns
+        -------
+        A : Tensor [shape=(K, L, M+1-L)]
+            Transposed regression matrices.
+
+        b : Tensor [shape=(K, M+1-L)]
+            Biases.
+
+        """
+        # The cache is keyed on the storage, shape, and version counter of the
+        # parameters so that in-place updates invalidate it.
+        key = (L, self._signature(self.mu), self._signature(self.sigma))
+        cache = self._regression
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        sigma_xx = self.sigma[:, :L, :L]
+        sigma_xy = self.sigma[:, :L, L:]
+        A = torch.linalg.solve(sigma_xx, sigma_xy)
+        mu_x = self.mu[:, :L]
+        mu_y = self.mu[:, L:]
+        b = mu_y - torch.matmul(mu_x.unsqueeze(-2), A).squeeze(-2)
+        # Inference tensors have no version counter and are never cached.
+        if None not in key[1] + key[2]:
+            self._regression = (key, (A, b))
+        return A, b
+
+    @staticmethod
+    def _signature(x):
+        try:
+            version = x._version
+        except RuntimeError:
+            version = None
+        return x.data_ptr(), tuple(x.shape), version
+
+    @staticmethod
+    def _clear_cache(module, incompatible_keys=None):
+        module._regression = None
+
     def _e_step(self, x, reduction="sum", in_order=None):
         """Expectation step.
 
@@ -425,33 +492,57 @@ class GaussianMixtureModeling(nn.Module):
             L = in_order + 1
             mu, sigma = self.mu[:, :L], self.sigma[:, :L, :L]
 
+        # The Mahalanobis distances are computed by matrix multiplications without
+        # forming the differences between all pairs of inputs and means. The inputs
+        # and means are centered beforehand to avoid the cancellation of large terms.
         log_pi = L * np.log(2 * np.pi)
+        center = mu.mean(0)  # (L,)
+        mu = mu - center
         if self.is_diag:
-            log_det = torch.log(torch.diagonal(sigma, dim1=-2, dim2=-1)).sum(-1)  # (K,)
-            precision = torch.reciprocal(
-                torch.diagonal(sigma, dim1=-2, dim2=-1)
-            )  # (K, L)
+            var = torch.diagonal(sigma, dim1=-2, dim2=-1)  # (K, L)
+            log_det = torch.log(var).sum(-1)  # (K,)
+            precision = torch.reciprocal(var)  # (K, L)
+            mp = mu * precision  # (K, L)
+            mpm = (mu * mp).sum(-1)  # (K,)
             mahala = []
             for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                xp = batch_x.to(device)
-                diff = xp.unsqueeze(1) - mu.unsqueeze(0)  # (B, K, L)
-                mahala.append((diff**2 * precision).sum(-1))  # (B, K)
+                xp = batch_x.to(device) - center
+                mahala.append(
+                    torch.addmm(mpm, xp**2, precision.T) - 2 * torch.matmul(xp, mp.T)
+                )  # (B, K)
             mahala = torch.cat(mahala)  # (T, K)
         else:
             col = torch.linalg.cholesky(sigma)
             log_det = (
                 torch.log(torch.diagonal(col, dim1=-2, dim2=-1)).sum(-1) * 2
             )  # (K,)
-            precision = torch.cholesky_inverse(col).unsqueeze(0)  # (1, K, L, L)
+            # Whitening transforms W satisfying W^T W = sigma^{-1}.
+            eye = torch.eye(L, dtype=col.dtype, device=col.device)
+            W = torch.linalg.solve_triangular(col, eye, upper=False)  # (K, L, L)
+            Wt = W.transpose(-2, -1)
+            mw = torch.matmul(mu.unsqueeze(-2), Wt).squeeze(-2)  # (K, L)
+            # Split the components into tiles so that the workspace is O(B * K).
+            S = max(1, self.n_mixture // L)
+            tiles = [
+                (w.transpose(0, 1).flatten(1), m)  # (L, S * L), (S, L)
+                for w, m in zip(torch.split(Wt, S), torch.split(mw, S))
+            ]
             mahala = []
             for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                xp = batch_x.to(device)
-                diff = xp.unsqueeze(1) - mu.unsqueeze(0)  # (B, K, L)
-                right = torch.matmul(precision, diff.unsqueeze(-1))  # (B, K, L, 1)
+                xp = batch_x.to(device) - center
                 mahala.append(
-                    torch.matmul(diff.unsqueeze(-2), right).squeeze(-1).squeeze(-1)
+                    torch.cat(
+                        [
+                            (torch.matmul(xp, w).unflatten(-1, (-1, L)) - m)
+                            .square()
+                            .sum(-1)
+                            for w, m in tiles
+                        ],
+                        dim=-1,
+                    )
                 )  # (B, K)
             mahala = torch.cat(mahala)  # (T, K)
+        mahala = torch.clip(mahala, min=0)
         numer = torch.log(self.w) - 0.5 * (log_pi + log_det + mahala)  # (T, K)
         denom = torch.logsumexp(numer, dim=-1, keepdim=True)  # (T, 1)
         posterior = torch.exp(numer - denom)  # (T, K)
@@ -61,6 +61,9 @@ class IndependentComponentAnalysis(nn.Module):
 
     """
 
+    # The buffers are updated in place and must not be shared.
+    _share_buffers = False
+
     def __init__(
         self,
         order,
@@ -16,6 +16,7 @@
 
 import numpy as np
 import torch
+import torch.nn.functional as F
 import torchaudio
 from torch import nn
 
@@ -141,6 +142,7 @@ class InverseConstantQTransform(nn.Module):
         sr.reverse()
 
         slices = []
+        paddings = []
         transforms = []
         resamplers = []
 
@@ -166,6 +168,12 @@ class InverseConstantQTransform(nn.Module):
             freq_power = np.reciprocal(np.sum(np.abs(fft_basis) ** 2, axis=1))
             freq_power *= fft_length / lengths[sl]
             fft_basis *= freq_power[:, None]
+
+            # Keep only the frequency band where the basis is nonzero.
+            nonzero_bins = np.flatnonzero(np.any(fft_basis != 0, axis=0))
+            left, right = nonzero_bins[0], nonzero_bins[-1] + 1
+            paddings.append((left, fft_basis.shape[-1] - right))
+            fft_basis = fft_basis[:, left:right]
             self.register_buffer(f"fft_basis_{i}", numpy_to_torch(fft_basis))
 
             transforms.append(
@@ -189,6 +197,7 @@ class InverseConstantQTransform(nn.Module):
             )
 
         self.slices = slices
+        self.paddings = paddings
         self.transforms = nn.ModuleList(transforms)
         self.resamplers = nn.ModuleList(resamplers)
 
@@ -221,7 +230,7 @@ class InverseConstantQTransform(nn.Module):
         for i in range(len(self.transforms)):
             C = c[..., self.slices[i]] * self.cqt_scale[self.slices[i]]
             W = getattr(self, f"fft_basis_{i}")
-            X = torch.matmul(C, W)
+            X = F.pad(torch.matmul(C, W), self.paddings[i])
             x = self.transforms[i](X)
             x = self.resamplers[i](x)
             if i == 0:
@@ -42,6 +42,13 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
     out_format : ['radian', 'cycle', 'khz', 'hz']
         Output format.
 
+    n_split : int >= 1 or None
+        Number of splits of the frequency axis to search the roots of the symmetric
+        and antisymmetric polynomials in the cosine domain. The frames in which not
+        all the roots are found or refined to convergence are processed by the
+        eigenvalue decomposition of the companion matrix. If None, the decomposition
+        is always used.
+
     References
     ----------
     .. [1] P. Kabal et al., "The computation of line spectral frequencies using
@@ -51,14 +58,21 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
     """
 
     def __init__(
-        self, lpc_order, log_gain=False, sample_rate=None, out_format="radian"
+        self,
+        lpc_order,
+        log_gain=False,
+        sample_rate=None,
+        out_format="radian",
+        n_split=256,
     ):
         super().__init__()
 
         assert 0 <= lpc_order
+        assert n_split is None or 1 <= n_split
 
         self.lpc_order = lpc_order
         self.log_gain = log_gain
+        self.n_split = n_split
         self.formatter = self._formatter(out_format, sample_rate)
         kernel_p, kernel_q = self._precompute(self.lpc_order)
         self.register_buffer("kernel_p", kernel_p)
@@ -94,11 +108,16 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
         """
         check_size(a.size(-1), self.lpc_order + 1, "dimension of LPC")
         return self._forward(
-            a, self.log_gain, self.formatter, self.kernel_p, self.kernel_q
+            a,
+            self.log_gain,
+            self.formatter,
+            self.kernel_p,
+            self.kernel_q,
+            self.n_split,
         )
 
     @staticmethod
-    def _forward(a, log_gain, formatter, kernel_p, kernel_q):
+    def _forward(a, log_gain, formatter, kernel_p, kernel_q, n_split):
         M = a.size(-1) - 1
         K, a = torch.split(a, [1, M], dim=-1)
 
@@ -110,19 +129,12 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
         a0 = F.pad(a, (1, 0), value=1)
         a1 = F.pad(a0, (0, 1), value=0)
         a2 = a1.flip(-1)
-        p = a1 - a2
-        q = a1 + a2
-        if M == 1:
-            q = PolynomialToRoots._func(q)
-            w = torch.angle(q[..., 0])
+        p = deconv1d(a1 - a2, kernel_p)
+        q = deconv1d(a1 + a2, kernel_q)
+        if n_split is None or torch.compiler.is_compiling():
+            w = LinearPredictiveCoefficientsToLineSpectralPairs._eig(p, q)
         else:
-            p = deconv1d(p, kernel_p)
-            q = deconv1d(q, kernel_q)
-            p = PolynomialToRoots._func(p)
-            q = PolynomialToRoots._func(q)
-            p = torch.angle(p[..., 0::2])
-            q = torch.angle(q[..., 0::2])
-            w, _ = torch.sort(torch.cat((p, q), dim=-1))
+            w = LinearPredictiveCoefficientsToLineSpectralPairs._search(p, q, n_split)
 
         w = w.view_as(a)
         w = formatter(w)
@@ -130,7 +142,7 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
         return w
 
     @staticmethod
-    def _func(a, log_gain, sample_rate, out_format):
+    def _func(a, log_gain, sample_rate, out_format, n_split):
         formatter = LinearPredictiveCoefficientsToLineSpectralPairs._formatter(
             out_format, sample_rate
         )
@@ -138,17 +150,107 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
             a.size(-1) - 1, dtype=a.dtype, device=a.device
         )
         return LinearPredictiveCoefficientsToLineSpectralPairs._forward(
-            a, log_gain, formatter, *kernels
+            a, log_gain, formatter, *kernels, n_split
+        )
+
+    @staticmethod
+    def _eig(p, q):
+        if p.size(-1) == 1:
+            q = PolynomialToRoots._func(q)
+            return torch.angle(q[..., :1])
+        p = PolynomialToRoots._func(p)
+        q = PolynomialToRoots._func(q)
+        p = torch.angle(p[..., 0::2])
+        q = torch.angle(q[..., 0::2])
+        w, _ = torch.sort(torch.cat((p, q), dim=-1))
+        return w
+
+    @staticmethod
+    def _search(p, q, n_split):
+        shape = p.shape[:-1]
+        p = p.reshape(-1, p.size(-1))
+        q = q.reshape(-1, q.size(-1))
+
+        wp, ok_p = LinearPredictiveCoefficientsToLineSpectralPairs._chebyshev_roots(
+            p, n_split
+        )
+        wq, ok_q = LinearPredictiveCoefficientsToLineSpectralPairs._chebyshev_roots(
+            q, n_split
         )
+        w, _ = torch.sort(torch.cat((wp, wq), dim=-1))
+
+        # Fall back to the eigenvalue decomposition.
+        ng = torch.logical_not(torch.logical_and(ok_p, ok_q))
+        if torch.any(ng):
+            w_ng = LinearPredictiveCoefficientsToLineSpectralPairs._eig(p[ng], q[ng])
+            w = w.index_put((ng,), w_ng)
+        return w.view(*shape, -1)
+
+    @staticmethod
+    def _chebyshev_roots(p, n_split, max_iter=50):
+        # A symmetric polynomial of degree 2H is written as a cosine series of order
+        # H on the unit circle, which has H roots in (0, pi) for a stable LPC.
+        H = (p.size(-1) - 1) // 2
+        c = torch.cat((p[..., H : H + 1], 2 * p[..., H + 1 :]), dim=-1)
+        k = torch.arange(H + 1, dtype=p.dtype, device=p.device)
+        if H == 0:
+            return c[..., :0], torch.ones_like(c[..., 0], dtype=torch.bool)
+
+        def f(w, c):
+            return (c.unsqueeze(-2) * torch.cos(w.unsqueeze(-1) * k)).sum(-1)
+
+        def df(w, c):
+            return -(c.unsqueeze(-2) * k * torch.sin(w.unsqueeze(-1) * k)).sum(-1)
+
+        # Find the intervals including a root by grid search.
+        n_split = max(n_split, H)
+        step = torch.pi / n_split
+        grid = torch.arange(n_split + 1, dtype=p.dtype, device=p.device) * step
+        v = torch.matmul(c, torch.cos(k.unsqueeze(-1) * grid))
+        sign = v < 0
+        change = sign[..., :-1] != sign[..., 1:]
+        ok = change.sum(-1) == H
+        order = torch.arange(n_split, 0, -1, device=p.device)
+        _, index = torch.topk(change * order, H, dim=-1, sorted=True)
+
+        # Refine the roots by Newton's method safeguarded by bisection until the
+        # update becomes smaller than the tolerance.
+        tol = 8 * torch.finfo(p.dtype).eps * torch.pi
+        c_ = c.detach()
+        lo = index.to(p.dtype) * step
+        hi = lo + step
+        sign_lo = sign.gather(-1, index)
+        v_lo = v.gather(-1, index).detach()
+        v_hi = v.gather(-1, index + 1).detach()
+        r = torch.where(change.gather(-1, index), v_lo / (v_lo - v_hi), 0.5)
+        w = lo + step * r
+        for _ in range(max_iter):
+            y = f(w, c_)
+            move = (y < 0) == sign_lo
+            lo = torch.where(move, w, lo)
+            hi = torch.where(move, hi, w)
+            w_prev = w
+            w = w - y / df(w, c_)
+            w = torch.where(torch.logical_and(lo <= w, w <= hi), w, 0.5 * (lo + hi))
+            converged = torch.logical_or(
+                torch.abs(w - w_prev) <= tol, hi - lo <= tol
+            ).all(-1)
+            if torch.all(converged):
+                break
+        ok = torch.logical_and(ok, converged)
+
+        # Make the roots differentiable via the implicit function theorem.
+        w = w - f(w, c) / df(w, c_)
+        return w, ok
 
     @staticmethod
     def _precompute(lpc_order, dtype=None, device=None):
         if lpc_order % 2 == 0:
-            kernel_p = torch.tensor([1.0, -1.0], device=device)
-            kernel_q = torch.tensor([1.0, 1.0], device=device)
+            kernel_p = torch.tensor([1.0, -1.0], dtype=dtype, device=device)
+            kernel_q = torch.tensor([1.0, 1.0], dtype=dtype, device=device)
         else:
-            kernel_p = torch.tensor([1.0, 0.0, -1.0], device=device)
-            kernel_q = torch.tensor([1.0], device=device)
+            kernel_p = torch.tensor([1.0, 0.0, -1.0], dtype=dtype, device=device)
+            kernel_q = torch.tensor([1.0], dtype=dtype, device=device)
         return kernel_p, kernel_q
 
     @staticmethod
@@ -37,11 +37,16 @@ class LinearPredictiveCoefficientsStabilityCheck(nn.Module):
         Margin for stability.
 
     warn_type : ['ignore', 'warn', 'exit']
-        Warning type.
+        Warning type. Under :func:`torch.compile`, a warning is deferred to
+        :func:`report` and an exit is raised by an assertion on the device.
+
+    defer : bool
+        If True, the check is performed without a host-device synchronization. The
+        number of unstable frames is accumulated and reported by :func:`report`.
 
     """
 
-    def __init__(self, lpc_order, margin=1e-16, warn_type="warn"):
+    def __init__(self, lpc_order, margin=1e-16, warn_type="warn", defer=False):
         super().__init__()
 
         assert 0 < margin < 1
@@ -49,8 +54,12 @@ class LinearPredictiveCoefficientsStabilityCheck(nn.Module):
         self.lpc_order = lpc_order
         self.bound = self._precompute(margin)
         self.warn_type = warn_type
+        self.defer = defer
+        self.register_buffer(
+            "_n_unstable", torch.zeros((), dtype=torch.long), persistent=False
+        )
 
-    def forward(self, a):
+    def forward(self, a, return_mask=False):
         """Check stability of LPC.
 
         Parameters
@@ -58,11 +67,18 @@ class LinearPredictiveCoefficientsStabilityCheck(nn.Module):
         a : Tensor [shape=(..., M+1)]
             LPC coefficients.
 
+        return_mask : bool
+            If True, also return the per-frame instability mask.
+
         Returns
         -------
         out : Tensor [shape=(..., M+1)]
             Modified LPC coefficients.
 
+        mask : Tensor [shape=(...,)]
+            True for the frames detected as unstable. Returned only if
+            ``return_mask`` is True.
+
         Examples
         --------
         >>> x = diffsptk.nrand(4)
@@ -77,17 +93,49 @@ class LinearPredictiveCoefficientsStabilityCheck(nn.Module):
 
         """
         check_size(a.size(-1), self.lpc_order + 1, "dimension of LPC")
-        return self._forward(a, self.bound, self.warn_type)
+        a2, unstable = self._forward(a, self.bound, self.warn_type, self.defer)
+        if self.defer or (torch.compiler.is_compiling() and self.warn_type == "warn"):
+            if self._n_unstable.device != unstable.device:
+                self._n_unstable = self._n_unstable.to(unstable.device)
+            self._n_unstable += unstable.sum()
+        if return_mask:
+            return a2, unstable
+        return a2
+
+    def report(self):
+        """Report unstable LPC coefficients detected since the last report.
+
+        Returns
+        -------
+        out : int
+            Number of unstable frames.
+
+        """
+        n_unstable = int(self._n_unstable)
+        self._n_unstable.zero_()
+        if 0 < n_unstable:
+            if self.warn_type == "warn":
+                warnings.warn(f"Detected {n_unstable} unstable LPC coefficients.")
+            elif self.warn_type == "exit":
+                raise RuntimeError(f"Detected {n_unstable} unstable LPC coefficients.")
+        return n_unstable
 
     @staticmethod
-    def _forward(a, bound, warn_type):
+    def _forward(a, bound, warn_type, defer=False):
         k = LinearPredictiveCoefficientsToParcorCoefficients._func(a)
         K, k1 = torch.split(k, [1, k.size(-1) - 1], dim=-1)
 
-        if torch.any(1 <= torch.abs(k1)):
-            if warn_type == "ignore":
-                pass
-            elif warn_type == "warn":
+        unstable = torch.any(1 <= torch.abs(k1), dim=-1)
+        if warn_type == "ignore" or defer:
+            pass
+        elif torch.compiler.is_compiling():
+            # A compiled graph cannot branch on the result without a synchronization.
+            if warn_type == "exit":
+                torch._assert_async(
+                    ~torch.any(unstable), "Detected unstable LPC coefficients."
+                )
+        elif torch.any(unstable):
+            if warn_type == "warn":
                 warnings.warn("Detected unstable LPC coefficients.")
             elif warn_type == "exit":
                 raise RuntimeError("Detected unstable LPC coefficients.")
@@ -97,12 +145,13 @@ class LinearPredictiveCoefficientsStabilityCheck(nn.Module):
         k1 = torch.clip(k1, -bound, bound)
         k2 = torch.cat((K, k1), dim=-1)
         a2 = ParcorCoefficientsToLinearPredictiveCoefficients._func(k2)
-        return a2
+        return a2, unstable
 
     @staticmethod
     def _func(a, margin, warn_type):
         const = LinearPredictiveCoefficientsStabilityCheck._precompute(margin)
-        return LinearPredictiveCoefficientsStabilityCheck._forward(a, const, warn_type)
+        a2, _ = LinearPredictiveCoefficientsStabilityCheck._forward(a, const, warn_type)
+        return a2
 
     @staticmethod
     def _precompute(margin):
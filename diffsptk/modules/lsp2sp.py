@@ -24,6 +24,20 @@ from ..misc.utils import to
 LOG_ZERO = -1.0e10
 
 
+class FloorLog(torch.autograd.Function):
+    # LOG_ZERO is below the logarithm of any positive float, so the logarithm is
+    # floored exactly at zero, where the gradient is zero rather than NaN.
+    @staticmethod
+    def forward(ctx, x):
+        ctx.save_for_backward(x)
+        return torch.log(x).clip_(min=LOG_ZERO)
+
+    @staticmethod
+    def backward(ctx, grad):
+        (x,) = ctx.saved_tensors
+        return torch.where(x == 0, 0, grad / x)
+
+
 class LineSpectralPairsToSpectrum(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/mglsp2sp.html>`_
     for details.
@@ -48,6 +62,11 @@ class LineSpectralPairsToSpectrum(nn.Module):
     out_format : ['db', 'log-magnitude', 'magnitude', 'power']
         Output format.
 
+    memory_efficient : bool
+        If True, accumulate the log distances order by order and recompute them in
+        the backward pass. This reduces the memory usage from :math:`O(LM)` to
+        :math:`O(L)` per frame.
+
     References
     ----------
     .. [1] A. V. Oppenheim et al., "Discrete representation of signals," *Proceedings of
@@ -66,6 +85,7 @@ class LineSpectralPairsToSpectrum(nn.Module):
         gamma=-1,
         log_gain=False,
         out_format="power",
+        memory_efficient=False,
     ):
         super().__init__()
 
@@ -76,6 +96,7 @@ class LineSpectralPairsToSpectrum(nn.Module):
 
         self.lsp_order = lsp_order
         self.log_gain = log_gain
+        self.memory_efficient = memory_efficient
         self.formatter = self._formatter(out_format)
 
         cos_omega, p_bias, q_bias, self.c1, self.c2 = self._precompute(
@@ -123,34 +144,45 @@ class LineSpectralPairsToSpectrum(nn.Module):
             self.q_bias,
             self.c1,
             self.c2,
+            self.memory_efficient,
         )
 
     @staticmethod
-    def _forward(w, log_gain, formatter, cos_omega, p_bias, q_bias, c1, c2):
-        def floor_log(x):
-            return torch.clip(torch.log(x), min=LOG_ZERO)
-
+    def _forward(
+        w,
+        log_gain,
+        formatter,
+        cos_omega,
+        p_bias,
+        q_bias,
+        c1,
+        c2,
+        memory_efficient=False,
+    ):
         K, w = torch.split(w, [1, w.size(-1) - 1], dim=-1)
         if not log_gain:
-            K = floor_log(K)
+            K = FloorLog.apply(K)
 
-        cos_w = torch.cos(w).unsqueeze(-2)
-        pq = floor_log(torch.abs(cos_omega - cos_w))  # [..., L/2+1, M]
-        p = pq[..., 1::2].sum(-1)
-        q = pq[..., 0::2].sum(-1)
+        if memory_efficient:
+            p, q = LineSpectralPairsToSpectrumImpl.apply(w, cos_omega)
+        else:
+            cos_w = torch.cos(w).unsqueeze(-2)
+            pq = FloorLog.apply(torch.abs(cos_omega - cos_w))  # [..., L/2+1, M]
+            p = pq[..., 1::2].sum(-1)
+            q = pq[..., 0::2].sum(-1)
         r = torch.logsumexp(2 * torch.stack([p + p_bias, q + q_bias], dim=-1), dim=-1)
         sp = K + c1 * (c2 + r)
         sp = formatter(sp)
         return sp
 
     @staticmethod
-    def _func(w, fft_length, alpha, gamma, log_gain, out_format):
+    def _func(w, fft_length, alpha, gamma, log_gain, out_format, memory_efficient):
         formatter = LineSpectralPairsToSpectrum._formatter(out_format)
         precomputes = LineSpectralPairsToSpectrum._precompute(
             w.size(-1) - 1, fft_length, alpha, gamma, dtype=w.dtype, device=w.device
         )
         return LineSpectralPairsToSpectrum._forward(
-            w, log_gain, formatter, *precomputes
+            w, log_gain, formatter, *precomputes, memory_efficient
         )
 
     @staticmethod
@@ -192,3 +224,34 @@ class LineSpectralPairsToSpectrum(nn.Module):
         elif out_format in (3, "power"):
             return lambda x: torch.exp(2 * x)
         raise ValueError(f"out_format {out_format} is not supported.")
+
+
+class LineSpectralPairsToSpectrumImpl(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, w, cos_omega):
+        ctx.save_for_backward(w, cos_omega)
+
+        cos_omega = cos_omega.squeeze(-1)
+        cos_w = torch.cos(w).unsqueeze(-1)
+        pq = w.new_zeros(2, *w.shape[:-1], cos_omega.size(-1))
+        for m in range(w.size(-1)):
+            d = torch.abs(cos_omega - cos_w[..., m, :])
+            pq[(m + 1) % 2] += torch.log(d).clip_(min=LOG_ZERO)
+        p, q = pq
+        return p, q
+
+    @staticmethod
+    def backward(ctx, grad_p, grad_q):
+        w, cos_omega = ctx.saved_tensors
+
+        # The gradient of log|cos(omega) - cos(w)| is sin(w) / (cos(omega) - cos(w)),
+        # which is zero where the logarithm is floored as in FloorLog.
+        cos_omega = cos_omega.squeeze(-1)
+        cos_w = torch.cos(w).unsqueeze(-1)
+        grad_w = torch.empty_like(w)
+        for m in range(w.size(-1)):
+            d = cos_omega - cos_w[..., m, :]
+            g = grad_q if m % 2 == 0 else grad_p
+            grad_w[..., m] = torch.where(d == 0, 0, g / d).sum(-1)
+        grad_w = grad_w * torch.sin(w)
+        return grad_w, None
@@ -38,11 +38,16 @@ class LineSpectralPairsStabilityCheck(nn.Module):
         Number of iterations for modification.
 
     warn_type : ['ignore', 'warn', 'exit']
-        Warning type.
+        Warning type. Under :func:`torch.compile`, a warning is deferred to
+        :func:`report` and an exit is raised by an assertion on the device.
+
+    defer : bool
+        If True, the check is performed without a host-device synchronization. The
+        number of unstable frames is accumulated and reported by :func:`report`.
 
     """
 
-    def __init__(self, lsp_order, rate=0, n_iter=1, warn_type="warn"):
+    def __init__(self, lsp_order, rate=0, n_iter=1, warn_type="warn", defer=False):
         super().__init__()
 
         assert 0 <= lsp_order
@@ -54,8 +59,12 @@ class LineSpectralPairsStabilityCheck(nn.Module):
         self.min_distance = self._precompute(lsp_order, rate)
         self.n_iter = n_iter
         self.warn_type = warn_type
+        self.defer = defer
+        self.register_buffer(
+            "_n_unstable", torch.zeros((), dtype=torch.long), persistent=False
+        )
 
-    def forward(self, w):
+    def forward(self, w, return_mask=False):
         """Check stability of LSP.
 
         Parameters
@@ -63,11 +72,18 @@ class LineSpectralPairsStabilityCheck(nn.Module):
         w : Tensor [shape=(..., M+1)]
             LSP coefficients in radians.
 
+        return_mask : bool
+            If True, also return the per-frame instability mask.
+
         Returns
         -------
         out : Tensor [shape=(..., M+1)]
             Modified LSP coefficients.
 
+        mask : Tensor [shape=(...,)]
+            True for the frames detected as unstable. Returned only if
+            ``return_mask`` is True.
+
         Examples
         --------
         >>> w1 = torch.tensor([0, 0, 1]) * torch.pi
@@ -78,17 +94,52 @@ class LineSpectralPairsStabilityCheck(nn.Module):
 
         """
         check_size(w.size(-1), self.lsp_order + 1, "dimension of LSP")
-        return self._forward(w, self.min_distance, self.n_iter, self.warn_type)
+        w2, unstable = self._forward(
+            w, self.min_distance, self.n_iter, self.warn_type, self.defer
+        )
+        if self.defer or (torch.compiler.is_compiling() and self.warn_type == "warn"):
+            if self._n_unstable.device != unstable.device:
+                self._n_unstable = self._n_unstable.to(unstable.device)
+            self._n_unstable += unstable.sum()
+        if return_mask:
+            return w2, unstable
+        return w2
+
+    def report(self):
+        """Report unstable LSP coefficients detected since the last report.
+
+        Returns
+        -------
+        out : int
+            Number of unstable frames.
+
+        """
+        n_unstable = int(self._n_unstable)
+        self._n_unstable.zero_()
+        if 0 < n_unstable:
+            if self.warn_type == "warn":
+                warnings.warn(f"Detected {n_unstable} unstable LSP coefficients.")
+            elif self.warn_type == "exit":
+                raise RuntimeError(f"Detected {n_unstable} unstable LSP coefficients.")
+        return n_unstable
 
     @staticmethod
-    def _forward(w, min_distance, n_iter, warn_type):
+    def _forward(w, min_distance, n_iter, warn_type, defer=False):
         K, w1 = torch.split(w, [1, w.size(-1) - 1], dim=-1)
 
         distance = torch.diff(w1, dim=-1)
-        if torch.any(distance <= 0) or torch.any(w <= 0) or torch.any(torch.pi <= w):
-            if warn_type == "ignore":
-                pass
-            elif warn_type == "warn":
+        unstable = torch.any(distance <= 0, dim=-1)
+        unstable |= torch.any(w <= 0, dim=-1) | torch.any(torch.pi <= w, dim=-1)
+        if warn_type == "ignore" or defer:
+            pass
+        elif torch.compiler.is_compiling():
+            # A compiled graph cannot branch on the result without a synchronization.
+            if warn_type == "exit":
+                torch._assert_async(
+                    ~torch.any(unstable), "Detected unstable LSP coefficients."
+                )
+        elif torch.any(unstable):
+            if warn_type == "warn":
                 warnings.warn("Detected unstable LSP coefficients.")
             elif warn_type == "exit":
                 raise RuntimeError("Detected unstable LSP coefficients.")
@@ -105,16 +156,21 @@ class LineSpectralPairsStabilityCheck(nn.Module):
                 w1[..., n] += step_size
             w1 = torch.clip(w1, min=min_distance, max=torch.pi - min_distance)
             distance = torch.diff(w1, dim=-1)
-            if torch.all(min_distance - 1e-16 <= distance):
+            if (
+                not defer
+                and not torch.compiler.is_compiling()
+                and torch.all(min_distance - 1e-16 <= distance)
+            ):
                 break
 
         w2 = torch.cat((K, w1), dim=-1)
-        return w2
+        return w2, unstable
 
     @staticmethod
     def _func(w, rate, n_iter, warn_type):
         const = LineSpectralPairsStabilityCheck._precompute(w.size(-1) - 1, rate)
-        return LineSpectralPairsStabilityCheck._forward(w, const, n_iter, warn_type)
+        w2, _ = LineSpectralPairsStabilityCheck._forward(w, const, n_iter, warn_type)
+        return w2
 
     @staticmethod
     def _precompute(lsp_order, rate):
@@ -19,6 +19,7 @@ from torch import nn
 
 from ..misc.utils import check_size
 from ..misc.utils import hankel
+from ..misc.utils import solve_toeplitz_plus_hankel
 from ..misc.utils import symmetric_toeplitz
 from ..misc.utils import to
 from .freqt import FrequencyTransform
@@ -48,8 +49,7 @@ class CoefficientsFrequencyTransform(nn.Module):
 
 class MelCepstralAnalysis(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/mgcep.html>`_
-    for details. Note that the current implementation does not use the efficient
-    Toeplitz-plus-Hankel system solver.
+    for details.
 
     Parameters
     ----------
@@ -65,17 +65,31 @@ class MelCepstralAnalysis(nn.Module):
     n_iter : int >= 0
         Number of iterations.
 
+    eps : float >= 0
+        Convergence threshold. If positive, the frames whose maximum absolute update
+        is smaller than this value are excluded from the subsequent iterations.
+
+    solver : ['dense', 'tph']
+        Solver of the Toeplitz-plus-Hankel system in each iteration. 'dense' uses
+        :func:`torch.linalg.solve`, and 'tph' uses the :math:`O(M^2)` block Levinson
+        recursion. The latter is sequential over the order, so the former is usually
+        faster for batched inputs on CPU.
+
     """
 
-    def __init__(self, cep_order, fft_length, alpha=0, n_iter=0):
+    def __init__(self, cep_order, fft_length, alpha=0, n_iter=0, eps=0, solver="dense"):
         super().__init__()
 
         assert 0 <= cep_order <= fft_length // 2
         assert 0 <= n_iter
+        assert 0 <= eps
+        assert solver in ("dense", "tph")
 
         self.cep_order = cep_order
         self.fft_length = fft_length
         self.n_iter = n_iter
+        self.eps = eps
+        self.solver = solver
 
         self.freqt = FrequencyTransform(self.fft_length // 2, self.cep_order, alpha)
         self.ifreqt = FrequencyTransform(self.cep_order, self.fft_length // 2, -alpha)
@@ -120,7 +134,7 @@ class MelCepstralAnalysis(nn.Module):
         c[..., H] *= 0.5
         mc = self.freqt(c[..., : H + 1])
 
-        for _ in range(self.n_iter):
+        def newton(mc, log_x):
             c = self.ifreqt(mc)
             d = torch.fft.rfft(c, n=self.fft_length).real
             d = torch.exp(log_x - d - d)
@@ -130,9 +144,28 @@ class MelCepstralAnalysis(nn.Module):
             r = rt[..., : M + 1]
             ra = r - self.alpha_vector
 
-            R = symmetric_toeplitz(r)
-            Q = hankel(rt)
-            gradient = torch.linalg.solve(R + Q, ra)
-            mc = mc + gradient
-
-        return mc
+            if self.solver == "tph":
+                gradient = solve_toeplitz_plus_hankel(r, rt, ra)
+            else:
+                R = symmetric_toeplitz(r)
+                Q = hankel(rt)
+                gradient = torch.linalg.solve(R + Q, ra)
+            return gradient
+
+        if self.eps == 0:
+            for _ in range(self.n_iter):
+                mc = mc + newton(mc, log_x)
+            return mc
+
+        # Update only the frames that have not converged yet.
+        shape = mc.shape
+        mc = mc.reshape(-1, M + 1)
+        log_x = log_x.reshape(-1, H + 1)
+        index = torch.arange(len(mc), device=mc.device)
+        for _ in range(self.n_iter):
+            gradient = newton(mc[index], log_x[index])
+            mc = mc.index_add(0, index, gradient)
+            index = index[self.eps <= gradient.abs().amax(-1)]
+            if len(index) == 0:
+                break
+        return mc.view(shape)
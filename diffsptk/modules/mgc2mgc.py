@@ -53,14 +53,45 @@ class GeneralizedCepstrumToGeneralizedCepstrum(nn.Module):
 
     @staticmethod
     def _forward(c1, out_order, in_gamma, out_gamma, n_fft):
+        # The recursion costs O(M1 * M2) per frame while the FFT costs O(N log N) with
+        # a much larger constant, so the recursion is used unless the orders are high.
+        in_order = c1.size(-1) - 1
+        if min(in_order, out_order) * out_order <= 32 * n_fft:
+            return GeneralizedCepstrumToGeneralizedCepstrum._forward_recursive(
+                c1, out_order, in_gamma, out_gamma
+            )
+        return GeneralizedCepstrumToGeneralizedCepstrum._forward_fft(
+            c1, out_order, in_gamma, out_gamma, n_fft
+        )
+
+    @staticmethod
+    def _forward_recursive(c1, out_order, in_gamma, out_gamma):
+        M1 = c1.size(-1) - 1
+        M2 = out_order
+
+        i = torch.arange(1, M2 + 1, dtype=c1.dtype, device=c1.device).unsqueeze(-1)
+        k = torch.arange(M1 + 1, dtype=c1.dtype, device=c1.device)
+        W = (out_gamma * k - in_gamma * (i - k)) / i
+
+        c1 = F.pad(c1, (0, max(0, M2 - M1)))
+        c2 = c1[..., :0]  # Reversed output.
+        for m in range(1, M2 + 1):
+            n = min(M1, m - 1)
+            cc = c1[..., 1 : n + 1] * W[m - 1, 1 : n + 1]
+            c = c1[..., m : m + 1] + torch.linalg.vecdot(cc, c2[..., :n]).unsqueeze(-1)
+            c2 = torch.cat((c, c2), dim=-1)
+        c2 = torch.cat((c1[..., :1], c2.flip(-1)), dim=-1)
+        return c2
+
+    @staticmethod
+    def _forward_fft(c1, out_order, in_gamma, out_gamma, n_fft):
         c01 = F.pad(c1[..., 1:], (1, 0))
         C1 = torch.fft.fft(c01, n=n_fft)
 
         if in_gamma == 0:
             sC1 = cexp(C1)
         else:
-            C1 *= in_gamma
-            C1.real += 1
+            C1 = C1 * in_gamma + 1
             r = C1.abs() ** (1 / in_gamma)
             theta = C1.angle() / in_gamma
             sC1 = torch.polar(r, theta)
@@ -145,7 +176,8 @@ class ZerothGammaMultiplication(nn.Module):
 
 class MelGeneralizedCepstrumToMelGeneralizedCepstrum(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/mgc2mgc.html>`_
-    for details. The conversion uses FFT instead of recursive formula.
+    for details. The gamma conversion uses the recursive formula for low orders and
+    FFT otherwise.
 
     Parameters
     ----------
@@ -180,7 +212,8 @@ class MelGeneralizedCepstrumToMelGeneralizedCepstrum(nn.Module):
         If True, assume gamma-multiplied output.
 
     n_fft : int >> M1, M2
-        Number of FFT bins. Accurate conversion requires the large value.
+        Number of FFT bins. Accurate conversion requires the large value. This also
+        controls the threshold of the orders above which FFT is used.
 
     References
     ----------
@@ -15,10 +15,12 @@
 # ------------------------------------------------------------------------ #
 
 import torch
+import torch.nn.functional as F
 from torch import nn
 
 from ..misc.utils import check_size
 from ..misc.utils import hankel
+from ..misc.utils import solve_toeplitz_plus_hankel
 from ..misc.utils import symmetric_toeplitz
 from ..misc.utils import to
 from .b2mc import MLSADigitalFilterCoefficientsToMelCepstrum
@@ -55,6 +57,69 @@ class CoefficientsFrequencyTransform(nn.Module):
         return y
 
 
+class WarpedFourierTransform(nn.Module):
+    def __init__(self, fft_length, alpha, n_fft):
+        super().__init__()
+
+        assert fft_length <= n_fft
+
+        self.fft_length = fft_length
+        self.n_fft = n_fft
+
+        # The dense transforms above are equivalent to evaluating a trigonometric
+        # polynomial at the warped frequencies on the linear frequency grid.
+        # Here it is approximated by an FFT on the uniform warped frequency grid
+        # followed by cubic Lagrange interpolation.
+        H = fft_length // 2
+        omega = torch.arange(H + 1, dtype=torch.double) * (2 * torch.pi / fft_length)
+        z = torch.polar(torch.ones_like(omega), omega)
+        phi = omega + 2 * torch.atan2(
+            alpha * torch.sin(omega), 1 - alpha * torch.cos(omega)
+        )
+        g = (1 - alpha * alpha) * z / (z - alpha)
+
+        t = phi * (n_fft / (2 * torch.pi))
+        n = torch.floor(t)
+        s = t - n
+        index = n.long() + torch.arange(-1, 3).unsqueeze(-1)
+        weight = torch.stack(
+            [
+                -s * (s - 1) * (s - 2) / 6,
+                (s + 1) * (s - 1) * (s - 2) / 2,
+                -(s + 1) * s * (s - 2) / 2,
+                (s + 1) * s * (s - 1) / 6,
+            ]
+        )
+
+        # Take into account the conjugate symmetry of the spectrum.
+        v = torch.full((H + 1,), 2 / fft_length, dtype=torch.double)
+        v[0] /= 2
+        v[H] /= 2
+
+        self.register_buffer("index", (index % n_fft).view(-1))
+        self.register_buffer("v", to(v))
+        self.register_buffer("g1", to(g.conj()))
+        self.register_buffer("g2", to(n_fft * v * g))
+        self.register_buffer("weight", to(weight.unsqueeze(-1).repeat(1, 1, 2)))
+
+    def forward(self, b):
+        b0, b1 = torch.split(b, [1, b.size(-1) - 1], dim=-1)
+        B = torch.fft.fft(F.pad(b1, (1, 0)), n=self.n_fft)
+        B = torch.view_as_real(B[..., self.index]).unflatten(-2, self.weight.shape[:2])
+        B = torch.view_as_complex((B * self.weight).sum(-3))
+        return b0 + B * self.g1
+
+    def transpose(self, X, order):
+        U = torch.view_as_real(X * self.g2).unsqueeze(-3) * self.weight
+        U = torch.view_as_complex(U).flatten(-2)
+        U = torch.zeros(
+            *U.shape[:-1], self.n_fft, dtype=U.dtype, device=U.device
+        ).index_add(-1, self.index, U)
+        y0 = (X.real * self.v).sum(-1, keepdim=True)
+        y1 = torch.fft.ifft(U)[..., 1 : order + 1].real
+        return torch.cat((y0, y1), dim=-1)
+
+
 class PTransform(nn.Module):
     def __init__(self, order, alpha):
         super().__init__()
@@ -94,8 +159,7 @@ class QTransform(nn.Module):
 
 class MelGeneralizedCepstralAnalysis(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/mgcep.html>`_
-    for details. Note that the current implementation does not use the efficient
-    Toeplitz-plus-Hankel system solver.
+    for details.
 
     Parameters
     ----------
@@ -114,32 +178,70 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
     n_iter : int >= 0
         Number of iterations.
 
+    eps : float >= 0
+        Convergence threshold. If positive, the frames whose maximum absolute update
+        is smaller than this value are excluded from the subsequent iterations.
+
+    n_fft : int >= L or None
+        Number of FFT bins used for frequency warping when :math:`\\gamma \\ne 0`.
+        If None, the warping is performed by :math:`L`-size dense matrices. Otherwise,
+        it is performed by FFTs with interpolation, which requires only
+        :math:`O(L)` memory. Accurate conversion requires the large value, e.g.,
+        :math:`2L`.
+
+    solver : ['dense', 'tph']
+        Solver of the Toeplitz-plus-Hankel system in each iteration. 'dense' uses
+        :func:`torch.linalg.solve`, and 'tph' uses the :math:`O(M^2)` block Levinson
+        recursion. The latter is sequential over the order, so the former is usually
+        faster for batched inputs on CPU.
+
     """
 
-    def __init__(self, cep_order, fft_length, alpha=0, gamma=0, n_iter=0):
+    def __init__(
+        self,
+        cep_order,
+        fft_length,
+        alpha=0,
+        gamma=0,
+        n_iter=0,
+        eps=0,
+        n_fft=None,
+        solver="dense",
+    ):
         super().__init__()
 
         assert 0 <= cep_order <= fft_length // 2
         assert gamma <= 0
         assert 0 <= n_iter
+        assert 0 <= eps
+        assert solver in ("dense", "tph")
+        assert n_fft is None or fft_length <= n_fft
 
         self.cep_order = cep_order
         self.fft_length = fft_length
         self.gamma = gamma
         self.n_iter = n_iter
+        self.eps = eps
+        self.solver = solver
+        self.n_fft = n_fft
 
         if gamma == 0:
-            self.mcep = MelCepstralAnalysis(cep_order, fft_length, alpha, n_iter=n_iter)
-        else:
-            self.cfreqt = CoefficientsFrequencyTransform(
-                cep_order, fft_length - 1, -alpha
-            )
-            self.pfreqt = CoefficientsFrequencyTransform(
-                fft_length - 1, 2 * cep_order, alpha
-            )
-            self.rfreqt = CoefficientsFrequencyTransform(
-                fft_length - 1, cep_order, alpha
+            self.mcep = MelCepstralAnalysis(
+                cep_order, fft_length, alpha, n_iter=n_iter, eps=eps, solver=solver
             )
+        else:
+            if n_fft is None:
+                self.cfreqt = CoefficientsFrequencyTransform(
+                    cep_order, fft_length - 1, -alpha
+                )
+                self.pfreqt = CoefficientsFrequencyTransform(
+                    fft_length - 1, 2 * cep_order, alpha
+                )
+                self.rfreqt = CoefficientsFrequencyTransform(
+                    fft_length - 1, cep_order, alpha
+                )
+            else:
+                self.wfreqt = WarpedFourierTransform(fft_length, alpha, n_fft)
 
             self.ptrans = PTransform(2 * cep_order, alpha)
             self.qtrans = QTransform(2 * cep_order, alpha)
@@ -191,15 +293,18 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
         H = self.fft_length // 2
         check_size(x.size(-1), H + 1, "dimension of spectrum")
 
-        def newton(gamma, b1):
+        def newton(gamma, b1, x):
             def epsilon(gamma, r, b):
                 eps = r[..., 0] + gamma * (r[..., 1:] * b).sum(-1)
                 return eps
 
             b0 = torch.zeros(*b1.shape[:-1], 1, device=b1.device)
             b = torch.cat((b0, b1), dim=-1)
-            c = self.cfreqt(b)
-            C = torch.fft.rfft(c, n=self.fft_length)
+            if self.n_fft is None:
+                c = self.cfreqt(b)
+                C = torch.fft.rfft(c, n=self.fft_length)
+            else:
+                C = self.wfreqt(b)
 
             if gamma == -1:
                 p_re = x
@@ -219,13 +324,28 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
                 r_re = p * X
                 r_im = p * Y
 
-            p = self.pfreqt(torch.fft.irfft(p_re))
-            if gamma == -1:
+            if self.n_fft is None:
+                p = self.pfreqt(torch.fft.irfft(p_re))
+                if gamma == -1:
+                    q = p
+                    r = p[..., : M + 1]
+                else:
+                    q = self.pfreqt(torch.fft.irfft(torch.complex(q_re, q_im)))
+                    r = self.rfreqt(torch.fft.irfft(torch.complex(r_re, r_im)))
+            elif gamma == -1:
+                p = self.wfreqt.transpose(p_re, 2 * M)
                 q = p
                 r = p[..., : M + 1]
             else:
-                q = self.pfreqt(torch.fft.irfft(torch.complex(q_re, q_im)))
-                r = self.rfreqt(torch.fft.irfft(torch.complex(r_re, r_im)))
+                X = torch.stack(
+                    [
+                        torch.complex(p_re, torch.zeros_like(p_re)),
+                        torch.complex(q_re, q_im),
+                        torch.complex(r_re, r_im),
+                    ]
+                )
+                p, q, r = self.wfreqt.transpose(X, 2 * M)
+                r = r[..., : M + 1]
 
             p = self.ptrans(p)
             q = self.qtrans(q)
@@ -237,9 +357,12 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
             qt = q[..., 2:] * (1 + gamma)
             rt = r[..., 1:]
 
-            R = symmetric_toeplitz(pt)
-            Q = hankel(qt)
-            gradient = torch.linalg.solve(R + Q, rt)
+            if self.solver == "tph":
+                gradient = solve_toeplitz_plus_hankel(pt, qt, rt)
+            else:
+                R = symmetric_toeplitz(pt)
+                Q = hankel(qt)
+                gradient = torch.linalg.solve(R + Q, rt)
             b1 = b1 + gradient
 
             if gamma == -1:
@@ -249,14 +372,33 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
             return b0, b1
 
         b1 = torch.zeros(*x.shape[:-1], M, device=x.device)
-        b0, b1 = newton(-1, b1)
+        b0, b1 = newton(-1, b1, x)
 
         if self.gamma != -1:
             b = torch.cat((b0, b1), dim=-1)
             b = self.b2b(b)
             _, b1 = torch.split(b, [1, M], dim=-1)
-            for _ in range(self.n_iter):
-                b0, b1 = newton(self.gamma, b1)
+            if self.eps == 0:
+                for _ in range(self.n_iter):
+                    b0, b1 = newton(self.gamma, b1, x)
+            elif 0 < self.n_iter:
+                # Update only the frames that have not converged yet.
+                shape = b1.shape[:-1]
+                x = x.reshape(-1, H + 1)
+                b1 = b1.reshape(-1, M)
+                b0 = b0.reshape(-1, 1)
+                index = torch.arange(len(b1), device=b1.device)
+                for _ in range(self.n_iter):
+                    prev_b1 = b1[index]
+                    next_b0, next_b1 = newton(self.gamma, prev_b1, x[index])
+                    b0 = b0.index_copy(0, index, next_b0)
+                    b1 = b1.index_copy(0, index, next_b1)
+                    update = (next_b1 - prev_b1).abs().amax(-1)
+                    index = index[self.eps <= update]
+                    if len(index) == 0:
+                        break
+                b0 = b0.view(*shape, 1)
+                b1 = b1.view(*shape, M)
 
         b = torch.cat((b0, b1), dim=-1)
         mc = self.b2mc(b)
@@ -51,11 +51,16 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
         Number of FFT bins, :math:`L`. Used only in non-fast mode.
 
     warn_type : ['ignore', 'warn', 'exit']
-        Warning type.
+        Warning type. Under :func:`torch.compile`, a warning is deferred to
+        :func:`report` and an exit is raised by an assertion on the device.
 
     mod_type : ['clip', 'scale']
         Modification type.
 
+    defer : bool
+        If True, the check is performed without a host-device synchronization. The
+        number of unstable frames is accumulated and reported by :func:`report`.
+
     References
     ----------
     .. [1] S. Imai et al., "Mel log spectrum approximation (MLSA) filter for speech
@@ -76,6 +81,7 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
         n_fft=256,
         warn_type="warn",
         mod_type="scale",
+        defer=False,
     ):
         super().__init__()
 
@@ -89,11 +95,15 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
         self.n_fft = n_fft
         self.warn_type = warn_type
         self.mod_type = mod_type
+        self.defer = defer
         self.threshold = self._threshold(threshold, pade_order, strict)
         alpha_vector = self._precompute(cep_order, alpha)
         self.register_buffer("alpha_vector", alpha_vector)
+        self.register_buffer(
+            "_n_unstable", torch.zeros((), dtype=torch.long), persistent=False
+        )
 
-    def forward(self, c):
+    def forward(self, c, return_mask=False):
         """Check stability of MLSA filter.
 
         Parameters
@@ -101,11 +111,18 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
         c : Tensor [shape=(..., M+1)]
             Mel-cepstrum.
 
+        return_mask : bool
+            If True, also return the per-frame instability mask.
+
         Returns
         -------
         out : Tensor [shape=(..., M+1)]
             Modified mel-cepstrum.
 
+        mask : Tensor [shape=(...,)]
+            True for the frames detected as unstable. Returned only if
+            ``return_mask`` is True.
+
         Examples
         --------
         >>> c1 = diffsptk.nrand(4, stdv=10)
@@ -118,7 +135,7 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
 
         """
         check_size(c.size(-1), self.cep_order + 1, "dimension of mel-cepstrum")
-        return self._forward(
+        c2, unstable = self._forward(
             c,
             self.fast,
             self.n_fft,
@@ -126,10 +143,38 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
             self.mod_type,
             self.threshold,
             self.alpha_vector,
+            self.defer,
         )
+        if self.defer or (torch.compiler.is_compiling() and self.warn_type == "warn"):
+            if self._n_unstable.device != unstable.device:
+                self._n_unstable = self._n_unstable.to(unstable.device)
+            self._n_unstable += unstable.sum()
+        if return_mask:
+            return c2, unstable
+        return c2
+
+    def report(self):
+        """Report unstable MLSA filters detected since the last report.
+
+        Returns
+        -------
+        out : int
+            Number of unstable frames.
+
+        """
+        n_unstable = int(self._n_unstable)
+        self._n_unstable.zero_()
+        if 0 < n_unstable:
+            if self.warn_type == "warn":
+                warnings.warn(f"Detected {n_unstable} unstable MLSA filters.")
+            elif self.warn_type == "exit":
+                raise RuntimeError(f"Detected {n_unstable} unstable MLSA filters.")
+        return n_unstable
 
     @staticmethod
-    def _forward(c, fast, n_fft, warn_type, mod_type, threshold, alpha_vector):
+    def _forward(
+        c, fast, n_fft, warn_type, mod_type, threshold, alpha_vector, defer=False
+    ):
         gain = (c * alpha_vector).sum(-1, keepdim=True)
 
         if fast:
@@ -140,11 +185,19 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
             C1_amplitude = C1.abs()
             max_amplitude = torch.amax(C1_amplitude, dim=-1, keepdim=True)
         max_amplitude = torch.clip(max_amplitude, min=1e-16)
-
-        if torch.any(threshold < max_amplitude):
-            if warn_type == "ignore":
-                pass
-            elif warn_type == "warn":
+        unstable = (threshold < max_amplitude).squeeze(-1)
+
+        # Skip the check while compiling as it requires a host-device synchronization.
+        if warn_type == "ignore" or defer:
+            pass
+        elif torch.compiler.is_compiling():
+            # A compiled graph cannot branch on the result without a synchronization.
+            if warn_type == "exit":
+                torch._assert_async(
+                    ~torch.any(unstable), "Detected unstable MLSA filter."
+                )
+        elif torch.any(unstable):
+            if warn_type == "warn":
                 warnings.warn("Detected unstable MLSA filter.")
             elif warn_type == "exit":
                 raise RuntimeError("Detected unstable MLSA filter.")
@@ -168,7 +221,7 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
         else:
             c2 = torch.fft.irfft(C1 * scale)[..., : cep_order + 1]
             c2 = torch.cat((c2[..., :1] + gain, c2[..., 1:]), dim=-1)
-        return c2
+        return c2, unstable
 
     @staticmethod
     def _func(
@@ -180,9 +233,10 @@ class MLSADigitalFilterStabilityCheck(nn.Module):
         alpha_vector = MLSADigitalFilterStabilityCheck._precompute(
             c.size(-1) - 1, alpha, dtype=c.dtype, device=c.device
         )
-        return MLSADigitalFilterStabilityCheck._forward(
+        c2, _ = MLSADigitalFilterStabilityCheck._forward(
             c, fast, n_fft, warn_type, mod_type, threshold, alpha_vector
         )
+        return c2
 
     @staticmethod
     def _precompute(cep_order, alpha, dtype=None, device=None):
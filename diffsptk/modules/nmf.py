@@ -68,6 +68,9 @@ class NonnegativeMatrixFactorization(nn.Module):
 
     """
 
+    # The buffers are updated in place and must not be shared.
+    _share_buffers = False
+
     def __init__(
         self,
         n_data,
@@ -48,6 +48,9 @@ class PrincipalComponentAnalysis(nn.Module):
 
     """
 
+    # The buffers are updated in place and must not be shared.
+    _share_buffers = False
+
     def __init__(
         self,
         order,
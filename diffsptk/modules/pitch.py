@@ -18,7 +18,9 @@ import importlib
 from abc import ABC
 from abc import abstractmethod
 
+import numpy as np
 import torch
+import torch.nn.functional as F
 import torchaudio
 from torch import nn
 
@@ -28,8 +30,46 @@ from .frame import Frame
 from .stft import ShortTimeFourierTransform
 
 
+def infer_by_chunk(infer, frames, chunk_size):
+    """Apply frame-wise inference to a limited number of frames at a time.
+
+    Parameters
+    ----------
+    infer : Callable
+        Frame-wise inference function.
+
+    frames : Tensor [shape=(B, N, L)]
+        Framed waveform, usually a view of the waveform.
+
+    chunk_size : int >= 1 or None
+        Maximum number of frames processed by a single call of `infer`.
+
+    Returns
+    -------
+    out : Tensor [shape=(B, N, C)]
+        Concatenated output of `infer`.
+
+    """
+    B, N, _ = frames.shape
+    if chunk_size is None or B * N <= chunk_size:
+        return infer(frames)
+
+    # Split the flattened frame axis so that a chunk may span several batches.
+    y = []
+    for s in range(0, B * N, chunk_size):
+        e = min(s + chunk_size, B * N)
+        chunk = torch.cat(
+            [
+                frames[b, max(s - b * N, 0) : min(e - b * N, N)]
+                for b in range(s // N, (e - 1) // N + 1)
+            ]
+        )
+        y.append(infer(chunk.unsqueeze(0)).squeeze(0))
+    return torch.cat(y).unflatten(0, (B, N))
+
+
 class Pitch(nn.Module):
-    """Pitch extraction module using external neural models.
+    """Pitch extraction module using external neural models or YIN.
 
     Parameters
     ----------
@@ -39,11 +79,11 @@ class Pitch(nn.Module):
     sample_rate : int >= 1
         Sample rate in Hz.
 
-    algorithm : ['crepe', 'fcnf0']
+    algorithm : ['crepe', 'fcnf0', 'yin']
         Algorithm.
 
     out_format : ['pitch', 'f0', 'log-f0', 'prob', 'embed']
-        Output format.
+        Output format. The 'prob' and 'embed' formats are not supported by YIN.
 
     f_min : float >= 0
         Minimum frequency in Hz.
@@ -52,7 +92,17 @@ class Pitch(nn.Module):
         Maximum frequency in Hz.
 
     voicing_threshold : float
-        Voiced/unvoiced threshold.
+        Voiced/unvoiced threshold of periodicity, i.e., the frames whose periodicity is
+        lower than this value are unvoiced. Not used by YIN.
+
+    aperiodicity_threshold : float
+        Voiced/unvoiced threshold of YIN, i.e., the frames whose normalized difference
+        function has no dip below this value are unvoiced. Note that, unlike
+        `voicing_threshold`, a larger value yields more voiced frames.
+
+    chunk_size : int >= 1 or None
+        Maximum number of frames fed to the neural model at once. If None, all
+        frames are processed at once.
 
     References
     ----------
@@ -62,6 +112,10 @@ class Pitch(nn.Module):
     .. [2] M. Morisson et al., "Cross-domain neural pitch and periodicity estimation,"
            *arXiv prepreint*, arXiv:2301.12258, 2023.
 
+    .. [3] A. Cheveigne and H. Kawahara, "YIN, a fundamental frequency estimator for
+           speech and music," *The Journal of the Acoustical Society of America*,
+           vol. 111, 2002.
+
     """
 
     def __init__(
@@ -77,10 +131,15 @@ class Pitch(nn.Module):
         assert 1 <= frame_period
         assert 1 <= sample_rate
 
+        if algorithm == "yin" and out_format in ("prob", "embed"):
+            raise ValueError(f"out_format {out_format} is not supported by YIN.")
+
         if algorithm == "crepe":
             self.extractor = PitchExtractionByCREPE(frame_period, sample_rate, **kwargs)
         elif algorithm == "fcnf0":
             self.extractor = PitchExtractionByFCNF0(frame_period, sample_rate, **kwargs)
+        elif algorithm == "yin":
+            self.extractor = PitchExtractionByYIN(frame_period, sample_rate, **kwargs)
         else:
             raise ValueError(f"algorithm {algorithm} is not supported.")
 
@@ -206,6 +265,7 @@ class PitchExtractionByCREPE(PitchExtractionInterface, nn.Module):
         silence_threshold=-60,
         filter_length=3,
         model="full",
+        chunk_size=None,
     ):
         super().__init__()
 
@@ -225,6 +285,9 @@ class PitchExtractionByCREPE(PitchExtractionInterface, nn.Module):
         self.model = model
         assert self.model in ("tiny", "full")
 
+        self.chunk_size = chunk_size
+        assert self.chunk_size is None or 1 <= self.chunk_size
+
         self.frame = Frame(
             self.torchcrepe.WINDOW_SIZE,
             frame_period * self.torchcrepe.SAMPLE_RATE // sample_rate,
@@ -250,13 +313,16 @@ class PitchExtractionByCREPE(PitchExtractionInterface, nn.Module):
     def forward(self, x, embed=True):
         x = self.resample(x)
         x = self.frame(x)
-        x = x / torch.clip(x.std(dim=-1, keepdim=True), min=1e-10)
 
-        B, N, L = x.shape
-        x = x.reshape(-1, L)
-        y = self.torchcrepe.infer(x, model=self.model, embed=embed, device=x.device)
-        y = y.reshape(B, N, -1)
-        return y
+        def infer(x):
+            x = x / torch.clip(x.std(dim=-1, keepdim=True), min=1e-10)
+            B, N, L = x.shape
+            x = x.reshape(-1, L)
+            y = self.torchcrepe.infer(x, model=self.model, embed=embed, device=x.device)
+            y = y.reshape(B, N, -1)
+            return y
+
+        return infer_by_chunk(infer, x, self.chunk_size)
 
     def calc_prob(self, x):
         return self.forward(x, embed=False)
@@ -302,6 +368,7 @@ class PitchExtractionByFCNF0(PitchExtractionInterface, nn.Module):
         f_min=None,
         f_max=None,
         voicing_threshold=0.5,
+        chunk_size=None,
     ):
         super().__init__()
 
@@ -316,6 +383,9 @@ class PitchExtractionByFCNF0(PitchExtractionInterface, nn.Module):
 
         self.voicing_threshold = voicing_threshold
 
+        self.chunk_size = chunk_size
+        assert self.chunk_size is None or 1 <= self.chunk_size
+
         self.frame = Frame(
             self.penn.WINDOW_SIZE,
             frame_period * self.penn.SAMPLE_RATE // sample_rate,
@@ -330,10 +400,14 @@ class PitchExtractionByFCNF0(PitchExtractionInterface, nn.Module):
     def forward(self, x):
         x = self.resample(x)
         frames = self.frame(x)
-        target_shape = frames.shape[:-1] + (self.penn.PITCH_BINS,)
-        logits = self.penn.infer(frames.reshape(-1, 1, self.penn.WINDOW_SIZE))
-        logits = logits.reshape(*target_shape)
-        return logits
+
+        def infer(frames):
+            target_shape = frames.shape[:-1] + (self.penn.PITCH_BINS,)
+            logits = self.penn.infer(frames.reshape(-1, 1, self.penn.WINDOW_SIZE))
+            logits = logits.reshape(*target_shape)
+            return logits
+
+        return infer_by_chunk(infer, frames, self.chunk_size)
 
     def calc_prob(self, x):
         return torch.softmax(self.forward(x), dim=-1)
@@ -350,3 +424,87 @@ class PitchExtractionByFCNF0(PitchExtractionInterface, nn.Module):
             self.voicing_threshold <= result[2], result[1], UNVOICED_SYMBOL
         )
         return pitch.reshape(*target_shape)
+
+
+class PitchExtractionByYIN(PitchExtractionInterface, nn.Module):
+    """Pitch extraction by YIN."""
+
+    def __init__(
+        self,
+        frame_period,
+        sample_rate,
+        f_min=None,
+        f_max=None,
+        aperiodicity_threshold=0.15,
+        silence_threshold=-60,
+    ):
+        super().__init__()
+
+        self.f_min = 50 if f_min is None else f_min
+        self.f_max = min(500, sample_rate / 2) if f_max is None else f_max
+        assert 0 < self.f_min < self.f_max <= sample_rate / 2
+
+        self.sample_rate = sample_rate
+        self.aperiodicity_threshold = aperiodicity_threshold
+        self.silence_threshold = silence_threshold
+
+        # The integration window is as long as the maximum lag, and one extra lag is
+        # kept for the parabolic interpolation.
+        self.lag_min = max(1, int(sample_rate / self.f_max))
+        self.lag_max = int(np.ceil(sample_rate / self.f_min))
+        frame_length = 2 * self.lag_max + 1
+        self.fft_length = 2 ** int(np.ceil(np.log2(frame_length)))
+
+        self.frame = Frame(frame_length, frame_period)
+        self.register_buffer("ramp", torch.arange(1, self.lag_max + 2))
+
+    def forward(self, x):
+        y = self.frame(x)
+        W = self.lag_max
+        L = y.size(-1)
+
+        # Compute the difference function via the FFT-based cross-correlation.
+        s = F.pad(torch.cumsum(y * y, dim=-1), (1, 0))
+        e = s[..., W:] - s[..., : L - W + 1]
+        Y = torch.fft.rfft(y, n=self.fft_length)
+        A = torch.fft.rfft(y[..., :W], n=self.fft_length)
+        r = torch.fft.irfft(Y * A.conj(), n=self.fft_length)[..., : L - W + 1]
+        d = torch.clip(e[..., :1] + e - 2 * r, min=0)[..., 1:]
+
+        # Compute the cumulative mean normalized difference function.
+        d = self.ramp * d / torch.clip(torch.cumsum(d, dim=-1), min=1e-10)
+        d = F.pad(d, (1, 0), value=1)
+        return d, e[..., 0] / W
+
+    def calc_prob(self, x):
+        raise ValueError("YIN does not support the calculation of probability.")
+
+    def calc_embed(self, x):
+        raise ValueError("YIN does not support the calculation of embedding.")
+
+    def calc_pitch(self, x):
+        d, power = self.forward(x)
+
+        # Find the first local minimum below the threshold.
+        c = d[..., self.lag_min : self.lag_max + 1]
+        c_prev = d[..., self.lag_min - 1 : self.lag_max]
+        c_next = d[..., self.lag_min + 1 : self.lag_max + 2]
+        candidate = (c < self.aperiodicity_threshold) & (c <= c_prev) & (c < c_next)
+        voiced = candidate.any(-1)
+        index = torch.where(voiced, candidate.int().argmax(-1), c.argmin(-1))
+        lag = (index + self.lag_min).unsqueeze(-1)
+
+        # Refine the lag by parabolic interpolation.
+        c_prev = torch.gather(d, -1, lag - 1).squeeze(-1)
+        c = torch.gather(d, -1, lag).squeeze(-1)
+        c_next = torch.gather(d, -1, lag + 1).squeeze(-1)
+        denom = c_prev - 2 * c + c_next
+        shift = torch.where(
+            0 < denom, 0.5 * (c_prev - c_next) / torch.clip(denom, min=1e-10), 0
+        )
+        pitch = self.sample_rate / (lag.squeeze(-1) + shift)
+
+        loudness = 10 * torch.log10(torch.clip(power, min=1e-10))
+        mask = torch.logical_or(~voiced, loudness < self.silence_threshold)
+        pitch = torch.where(mask, UNVOICED_SYMBOL, pitch)
+        return pitch
@@ -18,9 +18,11 @@ import numpy as np
 import torch
 from torch import nn
 
+from ..misc.world import apply_window
 from ..misc.world import dc_correction
-from ..misc.world import get_windowed_waveform
+from ..misc.world import get_window
 from ..misc.world import linear_smoothing
+from .frame import Frame
 from .spec import Spectrum
 
 
@@ -48,6 +50,10 @@ class PitchAdaptiveSpectralAnalysis(nn.Module):
     default_f0 : float > 0
         F0 value used when the input F0 is unvoiced.
 
+    block_size : int >= 1 or None
+        Number of frames processed at once. If None, all frames are processed at
+        once. A small value bounds the peak memory usage for long inputs.
+
     References
     ----------
     .. [1] M. Morise, "CheapTrick, a spectral envelope estimator for high-quality speech
@@ -63,11 +69,13 @@ class PitchAdaptiveSpectralAnalysis(nn.Module):
         out_format="power",
         q1=-0.15,
         default_f0=500,
+        block_size=None,
     ):
         super().__init__()
 
         assert 1 <= frame_period
         assert 8000 <= sample_rate
+        assert block_size is None or 1 <= block_size
 
         self.frame_period = frame_period
         self.sample_rate = sample_rate
@@ -88,6 +96,8 @@ class PitchAdaptiveSpectralAnalysis(nn.Module):
         self.q1 = q1
         self.default_f0 = default_f0
 
+        self.block_size = block_size
+
         # Prepare modules.
         self.spec = Spectrum(fft_length)
 
@@ -122,22 +132,31 @@ class PitchAdaptiveSpectralAnalysis(nn.Module):
         torch.Size([7, 513])
 
         """
+        frames = Frame._func(x, self.fft_length, self.frame_period, mode="replicate")
+
+        N = f0.size(-1)
+        if self.block_size is None or N <= self.block_size:
+            return self._analyze(frames, f0)
+
+        # Write the result of each block into the preallocated output.
+        sp = frames.new_empty(*f0.shape, self.fft_length // 2 + 1)
+        for i in range(0, N, self.block_size):
+            j = i + self.block_size
+            sp[..., i:j, :] = self._analyze(frames[..., i:j, :], f0[..., i:j])
+        return sp
+
+    def _analyze(self, frames, f0):
         f0 = torch.where(f0 <= self.f_min, self.default_f0, f0).unsqueeze(-1).detach()
 
+        # Take the centered part if the frames are longer than the FFT length.
+        offset = frames.size(-1) // 2 - self.fft_length // 2
+        frames = frames[..., offset : offset + self.fft_length]
+
         # GetWindowedWaveform()
-        waveform = get_windowed_waveform(
-            x,
-            f0,
-            3,
-            0,
-            self.frame_period,
-            self.sample_rate,
-            self.fft_length,
-            "hanning",
-            True,
-            1e-12,
-            self.ramp,
+        window, mask = get_window(
+            f0, 3, 0, self.sample_rate, self.fft_length, "hanning", True, self.ramp
         )
+        waveform = apply_window(frames, window, mask, 1e-12)
 
         # GetPowerSpectrum()
         power_spectrum = self.spec(waveform)
@@ -154,7 +173,7 @@ class PitchAdaptiveSpectralAnalysis(nn.Module):
 
         # AddInfinitesimalNoise()
         power_spectrum += (
-            torch.randn_like(power_spectrum).abs() * torch.finfo(x.dtype).eps
+            torch.randn_like(power_spectrum).abs() * torch.finfo(frames.dtype).eps
         )
 
         # SmoothingWithRecovery()
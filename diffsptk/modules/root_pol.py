@@ -32,18 +32,27 @@ class PolynomialToRoots(nn.Module):
     out_format : ['rectangular', 'polar']
         Output format.
 
+    defer : bool
+        If True, the leading coefficient is checked without a host-device
+        synchronization. The number of invalid frames is accumulated and reported by
+        :func:`report`.
+
     """
 
-    def __init__(self, order, out_format="rectangular"):
+    def __init__(self, order, out_format="rectangular", defer=False):
         super().__init__()
 
         assert 1 <= order
 
         self.order = order
         self.formatter = self._formatter(out_format)
+        self.defer = defer
         self.register_buffer("eye", self._precompute(self.order))
+        self.register_buffer(
+            "_n_invalid", torch.zeros((), dtype=torch.long), persistent=False
+        )
 
-    def forward(self, a):
+    def forward(self, a, return_mask=False):
         """Find roots of polynomial.
 
         Parameters
@@ -51,11 +60,18 @@ class PolynomialToRoots(nn.Module):
         a : Tensor [shape=(..., M+1)]
             Polynomial coefficients.
 
+        return_mask : bool
+            If True, also return the per-frame mask of zero leading coefficients.
+
         Returns
         -------
         out : Tensor [shape=(..., M)]
             Complex roots.
 
+        mask : Tensor [shape=(...,)]
+            True for the frames whose leading coefficient is zero. Returned only if
+            ``return_mask`` is True.
+
         Examples
         --------
         >>> a = torch.tensor([3, 4, 5])
@@ -66,22 +82,55 @@ class PolynomialToRoots(nn.Module):
 
         """
         check_size(a.size(-1), self.order + 1, "order of polynomial")
-        return self._forward(a, self.formatter, self.eye)
+        x, invalid = self._forward(a, self.formatter, self.eye, self.defer)
+        if self.defer:
+            if self._n_invalid.device != invalid.device:
+                self._n_invalid = self._n_invalid.to(invalid.device)
+            self._n_invalid += invalid.sum()
+        if return_mask:
+            return x, invalid
+        return x
+
+    def report(self):
+        """Report zero leading coefficients detected since the last report.
+
+        Returns
+        -------
+        out : int
+            Number of invalid frames.
+
+        """
+        n_invalid = int(self._n_invalid)
+        self._n_invalid.zero_()
+        if 0 < n_invalid:
+            raise RuntimeError(
+                f"Detected {n_invalid} polynomials with zero leading coefficient."
+            )
+        return n_invalid
 
     @staticmethod
-    def _forward(a, formatter, eye):
-        if torch.any(a[..., 0] == 0):
+    def _forward(a, formatter, eye, defer=False):
+        invalid = a[..., 0] == 0
+        if defer:
+            pass
+        elif torch.compiler.is_compiling():
+            # A compiled graph cannot branch on the result without a synchronization.
+            torch._assert_async(
+                ~torch.any(invalid), "Leading coefficient must be non-zero."
+            )
+        elif torch.any(invalid):
             raise RuntimeError("Leading coefficient must be non-zero.")
 
-        # Make companion matrix.
-        a = -a[..., 1:] / a[..., :1]  # (..., M)
+        # Make companion matrix. The roots of the invalid frames are meaningless.
+        a0 = torch.where(invalid.unsqueeze(-1), 1, a[..., :1])
+        a = -a[..., 1:] / a0  # (..., M)
         E = eye.expand(a.size()[:-1] + eye.size())
         A = torch.cat((a.unsqueeze(-2), E), dim=-2)  # (..., M, M)
 
         # Find roots as eigenvalues.
         x, _ = torch.linalg.eig(A)
         x = formatter(x)
-        return x
+        return x, invalid
 
     @staticmethod
     def _func(a, out_format="rectangular"):
@@ -89,7 +138,8 @@ class PolynomialToRoots(nn.Module):
         eye = PolynomialToRoots._precompute(
             a.size(-1) - 1, dtype=a.dtype, device=a.device
         )
-        return PolynomialToRoots._forward(a, formatter, eye)
+        x, _ = PolynomialToRoots._forward(a, formatter, eye)
+        return x
 
     @staticmethod
     def _precompute(order, dtype=None, device=None):
@@ -121,12 +121,18 @@ class Spectrum(nn.Module):
         return 10 ** (relative_floor / 10)
 
     @staticmethod
-    def _formatter(out_format):
+    def _formatter(out_format, inplace=False):
         if out_format in (0, "db"):
+            if inplace:
+                return lambda x: x.log10_().mul_(10)
             return lambda x: 10 * torch.log10(x)
         elif out_format in (1, "log-magnitude"):
+            if inplace:
+                return lambda x: x.log_().mul_(0.5)
             return lambda x: 0.5 * torch.log(x)
         elif out_format in (2, "magnitude"):
+            if inplace:
+                return lambda x: x.sqrt_()
             return lambda x: torch.sqrt(x)
         elif out_format in (3, "power"):
             return lambda x: x
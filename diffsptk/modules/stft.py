@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import torch
+import torch.nn.functional as F
 from torch import nn
 
 from ..misc.utils import Lambda
@@ -60,6 +61,11 @@ class ShortTimeFourierTransform(nn.Module):
     out_format : ['db', 'log-magnitude', 'magnitude', 'power', 'complex']
         Output format.
 
+    fused : bool
+        If True, feed the windowed frames directly to :func:`torch.stft` without
+        materializing the intermediate frames. The post-processing is performed in
+        place when autograd is not required.
+
     """
 
     def __init__(
@@ -75,23 +81,39 @@ class ShortTimeFourierTransform(nn.Module):
         eps=1e-9,
         relative_floor=None,
         out_format="power",
+        fused=False,
     ):
         super().__init__()
 
-        self.stft = nn.Sequential(
-            Frame(frame_length, frame_period, center=center, zmean=zmean),
-            Window(frame_length, fft_length, window=window, norm=norm),
-            (
-                Lambda(torch.fft.rfft)
-                if out_format == "complex"
-                else Spectrum(
-                    fft_length,
-                    eps=eps,
-                    relative_floor=relative_floor,
-                    out_format=out_format,
-                )
-            ),
-        )
+        self.fused = fused
+
+        if fused:
+            self.frame_length = frame_length
+            self.frame_period = frame_period
+            self.fft_length = fft_length
+            self.center = center
+            self.zmean = zmean
+            self.eps = eps
+            self.relative_floor = Spectrum._precompute(relative_floor)
+            self.out_format = out_format
+            self.register_buffer(
+                "window", self._precompute(frame_length, fft_length, window, norm)
+            )
+        else:
+            self.stft = nn.Sequential(
+                Frame(frame_length, frame_period, center=center, zmean=zmean),
+                Window(frame_length, fft_length, window=window, norm=norm),
+                (
+                    Lambda(torch.fft.rfft)
+                    if out_format == "complex"
+                    else Spectrum(
+                        fft_length,
+                        eps=eps,
+                        relative_floor=relative_floor,
+                        out_format=out_format,
+                    )
+                ),
+            )
 
     def forward(self, x):
         """Compute short-time Fourier transform.
@@ -119,8 +141,76 @@ class ShortTimeFourierTransform(nn.Module):
                 [9.0000, 9.0000, 9.0000, 9.0000, 9.0000]])
 
         """
+        if self.fused:
+            return self._forward(
+                x,
+                self.frame_length,
+                self.frame_period,
+                self.fft_length,
+                self.center,
+                self.zmean,
+                self.eps,
+                self.relative_floor,
+                self.out_format,
+                self.window,
+            )
         return self.stft(x)
 
+    @staticmethod
+    def _forward(
+        x,
+        frame_length,
+        frame_period,
+        fft_length,
+        center,
+        zmean,
+        eps,
+        relative_floor,
+        out_format,
+        window,
+    ):
+        if center:
+            padding = (frame_length // 2, (frame_length - 1) // 2)
+        else:
+            padding = (0, frame_length - 1)
+        x = F.pad(x, (padding[0], padding[1] + fft_length - frame_length))
+
+        # Let torch.stft do framing, windowing, and zero-padding at once.
+        X = torch.stft(
+            x.reshape(-1, x.size(-1)),
+            fft_length,
+            hop_length=frame_period,
+            window=window.to(x.dtype),
+            center=False,
+            return_complex=True,
+        )
+        X = X.transpose(-2, -1).reshape(*x.shape[:-1], -1, fft_length // 2 + 1)
+
+        if zmean:
+            # The mean of each frame contributes the scaled spectrum of the window.
+            n_frame = X.size(-2)
+            m = x.unfold(-1, frame_length, frame_period)[..., :n_frame, :]
+            W = torch.fft.rfft(window.to(x.dtype))
+            X = X - m.mean(-1, keepdim=True) * W
+
+        if out_format == "complex":
+            return X
+
+        inplace = not (torch.is_grad_enabled() and X.requires_grad)
+        if inplace:
+            s = X.real.square()
+            s.addcmul_(X.imag, X.imag).add_(eps)
+        else:
+            s = torch.square(X.abs()) + eps
+        if relative_floor is not None:
+            m = torch.amax(s, dim=-1, keepdim=True)
+            if inplace:
+                s = torch.maximum(s, m * relative_floor, out=s)
+            else:
+                s = torch.maximum(s, m * relative_floor)
+        s = Spectrum._formatter(out_format, inplace=inplace)(s)
+        return s
+
     @staticmethod
     def _func(
         x,
@@ -134,7 +224,25 @@ class ShortTimeFourierTransform(nn.Module):
         eps,
         relative_floor,
         out_format,
+        fused=False,
     ):
+        if fused:
+            relative_floor = Spectrum._precompute(relative_floor)
+            window = ShortTimeFourierTransform._precompute(
+                frame_length, fft_length, window, norm, dtype=x.dtype, device=x.device
+            )
+            return ShortTimeFourierTransform._forward(
+                x,
+                frame_length,
+                frame_period,
+                fft_length,
+                center,
+                zmean,
+                eps,
+                relative_floor,
+                out_format,
+                window,
+            )
         y = Frame._func(x, frame_length, frame_period, center, zmean)
         y = Window._func(y, fft_length, window, norm)
         if out_format == "complex":
@@ -142,3 +250,8 @@ class ShortTimeFourierTransform(nn.Module):
         else:
             y = Spectrum._func(y, None, fft_length, eps, relative_floor, out_format)
         return y
+
+    @staticmethod
+    def _precompute(frame_length, fft_length, window, norm, dtype=None, device=None):
+        w = Window._precompute(frame_length, window, norm, dtype=dtype, device=device)
+        return F.pad(w, (0, fft_length - frame_length))
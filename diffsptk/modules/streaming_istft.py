@@ -0,0 +1,156 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import torch
+import torch.nn.functional as F
+from torch import nn
+
+from .window import Window
+
+
+class StreamingInverseShortTimeFourierTransform(nn.Module):
+    """Stateful version of :func:`~diffsptk.InverseShortTimeFourierTransform` that
+    accepts spectrum chunks of arbitrary length. The concatenation of the outputs is
+    the same as the output of :func:`~diffsptk.InverseShortTimeFourierTransform`
+    applied to the concatenation of the inputs.
+
+    Parameters
+    ----------
+    frame_length : int >= 1
+        Frame length, :math:`L`.
+
+    frame_period : int in [1, L]
+        Frame period, :math:`P`.
+
+    fft_length : int >= L
+        Number of FFT bins, :math:`N`.
+
+    center : bool
+        If True, assume that the center of data is the center of frame, otherwise
+        assume that the center of data is the left edge of frame.
+
+    window : ['blackman', 'hamming', 'hanning', 'bartlett', 'trapezoidal', \
+              'rectangular']
+        Window type.
+
+    norm : ['none', 'power', 'magnitude']
+        Normalization type of window.
+
+    """
+
+    def __init__(
+        self,
+        frame_length,
+        frame_period,
+        fft_length,
+        *,
+        center=True,
+        window="blackman",
+        norm="power",
+    ):
+        super().__init__()
+
+        assert 1 <= frame_period <= frame_length <= fft_length
+
+        self.frame_length = frame_length
+        self.frame_period = frame_period
+        self.fft_length = fft_length
+        self.center = center
+        self.register_buffer(
+            "window", self._precompute(frame_length, frame_period, window, norm)
+        )
+        self.reset()
+
+    def reset(self):
+        """Clear the internal buffer to start a new stream."""
+        self.buffer = None
+        self.n_frame = 0
+        self.n_skip = self.frame_length // 2 if self.center else 0
+
+    def forward(self, y, last=False):
+        """Compute inverse short-time Fourier transform of a spectrum chunk.
+
+        Parameters
+        ----------
+        y : Tensor [shape=(..., N', N/2+1)]
+            Complex spectrum chunk.
+
+        last : bool
+            If True, regard the chunk as the end of the stream. The remaining samples
+            are emitted and the internal buffer is cleared.
+
+        Returns
+        -------
+        out : Tensor [shape=(..., T)]
+            Reconstructed waveform chunk whose overlap-add is complete.
+
+        Examples
+        --------
+        >>> x = diffsptk.ramp(1, 3)
+        >>> x
+        tensor([1., 2., 3.])
+        >>> stft_params = {"frame_length": 3, "frame_period": 1, "fft_length": 8}
+        >>> stft = diffsptk.STFT(**stft_params, out_format="complex")
+        >>> istft = diffsptk.StreamingISTFT(**stft_params)
+        >>> X = stft(x)
+        >>> y = torch.cat((istft(X[:2]), istft(X[2:], last=True)))
+        >>> y[:3]
+        tensor([1., 2., 3.])
+
+        """
+        L = self.frame_length
+        P = self.frame_period
+        N = y.size(-2)
+
+        if self.buffer is None:
+            self.buffer = y.real.new_zeros(*y.shape[:-2], L - P)
+
+        # Perform overlap-add of the new frames and the buffered tail.
+        if 0 < N:
+            x = torch.fft.irfft(y, n=self.fft_length)[..., :L]
+            x = x.transpose(-2, -1).reshape(-1, L, N)
+            x = F.fold(x, (1, (N - 1) * P + L), (1, L), stride=(1, P))
+            x = x.reshape(*y.shape[:-2], -1)
+            x = x + F.pad(self.buffer, (0, N * P))
+        else:
+            x = self.buffer
+
+        # Normalize the completed samples by the window sum.
+        T = x.size(-1) if last else N * P
+        n_period = (T + P - 1) // P
+        m = torch.arange(n_period, device=x.device).unsqueeze(-1) + self.n_frame
+        k = m - torch.arange(self.window.size(0), device=x.device)
+        mask = torch.logical_and(0 <= k, k < self.n_frame + N)
+        w = torch.matmul(mask.to(self.window.dtype), self.window).view(-1)
+        skip = min(self.n_skip, T)
+        out = x[..., skip:T] / w[skip:T]
+
+        if last:
+            self.reset()
+        else:
+            self.buffer = x[..., T:]
+            self.n_frame += N
+            self.n_skip -= skip
+        return out
+
+    @staticmethod
+    def _precompute(frame_length, frame_period, window, norm):
+        # Arrange the window so that the q-th row is the part overlapped by the
+        # frame preceding by q frame periods.
+        n_overlap = (frame_length + frame_period - 1) // frame_period
+        w = Window._precompute(frame_length, window, norm)
+        w = F.pad(w, (0, n_overlap * frame_period - frame_length))
+        return w.view(n_overlap, frame_period)
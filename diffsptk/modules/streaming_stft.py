@@ -0,0 +1,164 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import torch
+import torch.nn.functional as F
+from torch import nn
+
+from ..misc.utils import Lambda
+from .spec import Spectrum
+from .window import Window
+
+
+class StreamingShortTimeFourierTransform(nn.Module):
+    """Stateful version of :func:`~diffsptk.ShortTimeFourierTransform` that accepts
+    waveform chunks of arbitrary length. The concatenation of the outputs is the same
+    as the output of :func:`~diffsptk.ShortTimeFourierTransform` applied to the
+    concatenation of the inputs.
+
+    Parameters
+    ----------
+    frame_length : int >= 1
+        Frame length, :math:`L`.
+
+    frame_period : int in [1, L]
+        Frame period, :math:`P`.
+
+    fft_length : int >= L
+        Number of FFT bins, :math:`N`.
+
+    center : bool
+        If True, assume that the center of data is the center of frame, otherwise
+        assume that the center of data is the left edge of frame.
+
+    zmean : bool
+        If True, perform mean subtraction on each frame.
+
+    window : ['blackman', 'hamming', 'hanning', 'bartlett', 'trapezoidal', \
+        'rectangular']
+        Window type.
+
+    norm : ['none', 'power', 'magnitude']
+        Normalization type of window.
+
+    eps : float >= 0
+        A small value added to power spectrum.
+
+    relative_floor : float < 0 or None
+        Relative floor in decibels.
+
+    out_format : ['db', 'log-magnitude', 'magnitude', 'power', 'complex']
+        Output format.
+
+    """
+
+    def __init__(
+        self,
+        frame_length,
+        frame_period,
+        fft_length,
+        *,
+        center=True,
+        zmean=False,
+        window="blackman",
+        norm="power",
+        eps=1e-9,
+        relative_floor=None,
+        out_format="power",
+    ):
+        super().__init__()
+
+        assert 1 <= frame_period <= frame_length
+
+        self.frame_length = frame_length
+        self.frame_period = frame_period
+        self.zmean = zmean
+        if center:
+            self.padding = (frame_length // 2, (frame_length - 1) // 2)
+        else:
+            self.padding = (0, frame_length - 1)
+
+        self.window = Window(frame_length, fft_length, window=window, norm=norm)
+        self.spec = (
+            Lambda(torch.fft.rfft)
+            if out_format == "complex"
+            else Spectrum(
+                fft_length,
+                eps=eps,
+                relative_floor=relative_floor,
+                out_format=out_format,
+            )
+        )
+
+        self.buffer = None
+
+    def reset(self):
+        """Clear the internal buffer to start a new stream."""
+        self.buffer = None
+
+    def forward(self, x, last=False):
+        """Compute short-time Fourier transform of a waveform chunk.
+
+        Parameters
+        ----------
+        x : Tensor [shape=(..., T)]
+            Waveform chunk.
+
+        last : bool
+            If True, regard the chunk as the end of the stream. The remaining frames
+            are emitted and the internal buffer is cleared.
+
+        Returns
+        -------
+        out : Tensor [shape=(..., N', N/2+1)]
+            Spectrum of the frames completed by the chunk, where :math:`N'` depends on
+            the number of buffered samples.
+
+        Examples
+        --------
+        >>> x = diffsptk.ramp(1, 3)
+        >>> x
+        tensor([1., 2., 3.])
+        >>> stft = diffsptk.StreamingSTFT(frame_length=3, frame_period=1, fft_length=8)
+        >>> y1 = stft(x[:2])
+        >>> y1
+        tensor([[1.0000, 1.0000, 1.0000, 1.0000, 1.0000]])
+        >>> y2 = stft(x[2:], last=True)
+        >>> y2
+        tensor([[4.0000, 4.0000, 4.0000, 4.0000, 4.0000],
+                [9.0000, 9.0000, 9.0000, 9.0000, 9.0000]])
+
+        """
+        if self.buffer is None:
+            x = F.pad(x, (self.padding[0], 0))
+        else:
+            x = torch.cat((self.buffer, x), dim=-1)
+        if last:
+            x = F.pad(x, (0, self.padding[1]))
+
+        # Emit only the frames that are complete.
+        n_frame = max(0, (x.size(-1) - self.frame_length) // self.frame_period + 1)
+        if 0 < n_frame:
+            y = x.unfold(-1, self.frame_length, self.frame_period)
+        else:
+            # A dummy frame is used to keep the output shape consistent.
+            y = x.new_zeros(*x.shape[:-1], 1, self.frame_length)
+        if self.zmean:
+            y = y - y.mean(-1, keepdim=True)
+        y = self.spec(self.window(y))[..., :n_frame, :]
+
+        self.buffer = None if last else x[..., n_frame * self.frame_period :]
+        return y
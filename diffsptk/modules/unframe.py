@@ -14,6 +14,7 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import torch
 import torch.nn.functional as F
 from torch import nn
 
@@ -114,32 +115,49 @@ class Unframe(nn.Module):
         N = y.size(-2)
         assert 2 <= d <= 4, "Input must be 2D, 3D, or 4D tensor."
 
-        def fold(x):
-            x = F.fold(
-                x,
-                (1, (N - 1) * frame_period + frame_length),
-                (1, frame_length),
-                stride=(1, frame_period),
-            )
-            s = frame_length // 2 if center else 0
-            e = None if out_length is None else s + out_length
-            x = x[..., 0, 0, s:e]
-            return x
-
-        w = window.repeat(1, 1, N)
         x = y.transpose(-2, -1)
-
         if d == 2:
             x = x.unsqueeze(0)
 
-        w = fold(w)
-        x = fold(x)
-        x = x / w
+        x = F.fold(
+            x,
+            (1, (N - 1) * frame_period + frame_length),
+            (1, frame_length),
+            stride=(1, frame_period),
+        )
+        s = frame_length // 2 if center else 0
+        e = None if out_length is None else s + out_length
+        x = x[..., 0, 0, s:e]
+
+        w = Unframe._envelope(window.view(-1), frame_period, N)[s:e]
+        if window.requires_grad:
+            x = x / w
+        else:
+            x = x.div_(w)
 
         if d == 2:
             x = x.squeeze(0)
         return x
 
+    @staticmethod
+    def _envelope(window, frame_period, n_frame):
+        # The overlap-added window is periodic except for the first and last K-1
+        # periods, so it is built from one period of the window split into K parts.
+        frame_length = window.size(-1)
+        K = (frame_length + frame_period - 1) // frame_period
+        W = F.pad(window, (0, K * frame_period - frame_length)).view(K, frame_period)
+        if n_frame < K:
+            m = torch.arange(n_frame + K - 1, device=W.device).unsqueeze(-1)
+            q = torch.arange(K, device=W.device)
+            mask = (q <= m) & (m - q < n_frame)
+            w = torch.matmul(mask.to(W.dtype), W)
+        else:
+            head = torch.cumsum(W[:-1], dim=0)
+            body = W.sum(0).expand(n_frame - K + 1, -1)
+            tail = torch.cumsum(W[1:].flip(0), dim=0).flip(0)
+            w = torch.cat([head, body, tail])
+        return w.view(-1)[: (n_frame - 1) * frame_period + frame_length]
+
     @staticmethod
     def _func(y, out_length, frame_length, frame_period, center, window, norm):
         window = Unframe._precompute(
@@ -0,0 +1,152 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import torch
+from torch import nn
+
+from .ap import Aperiodicity
+from .frame import Frame
+from .pitch_spec import PitchAdaptiveSpectralAnalysis
+
+
+class WORLDAnalysis(nn.Module):
+    """Joint estimation of spectral envelope and aperiodicity in the manner of WORLD.
+    The waveform is framed only once and the frames are shared by CheapTrick and D4C.
+    The windowed spectra are not shared since the two estimators use different
+    F0-adaptive windows, and thus the computational cost is almost the same as that of
+    :class:`~diffsptk.PitchAdaptiveSpectralAnalysis` followed by
+    :class:`~diffsptk.Aperiodicity`.
+
+    Parameters
+    ----------
+    frame_period : int >= 1
+        Frame period in sample, :math:`P`.
+
+    sample_rate : int >= 8000
+        Sample rate in Hz.
+
+    fft_length : int >= 1024
+        Number of FFT bins, :math:`L`.
+
+    sp_format : ['db', 'log-magnitude', 'magnitude', 'power']
+        Output format of spectral envelope.
+
+    ap_format : ['a', 'p', 'a/p', 'p/a']
+        Output format of aperiodicity.
+
+    q1 : float
+        A parameter used for spectral recovery.
+
+    threshold : float
+        Threshold of D4C LoveTrain.
+
+    lower_bound : float >= 0
+        Lower bound of aperiodicity.
+
+    upper_bound : float <= 1
+        Upper bound of aperiodicity.
+
+    References
+    ----------
+    .. [1] M. Morise, "CheapTrick, a spectral envelope estimator for high-quality speech
+           synthesis", *Speech Communication*, vol. 67, pp. 1-7, 2015.
+
+    .. [2] M. Morise, "D4C, a band-aperiodicity estimator for high-quality speech
+           synthesis," *Speech Communication*, vol. 84, pp. 57-65, 2016.
+
+    """
+
+    def __init__(
+        self,
+        frame_period,
+        sample_rate,
+        fft_length,
+        sp_format="power",
+        ap_format="a",
+        q1=-0.15,
+        threshold=0.0,
+        lower_bound=0.001,
+        upper_bound=0.999,
+    ):
+        super().__init__()
+
+        self.frame_period = frame_period
+        self.pitch_spec = PitchAdaptiveSpectralAnalysis(
+            frame_period, sample_rate, fft_length, out_format=sp_format, q1=q1
+        )
+        self.ap = Aperiodicity(
+            frame_period,
+            sample_rate,
+            fft_length,
+            algorithm="d4c",
+            out_format=ap_format,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            threshold=threshold,
+        )
+        self.frame_length = max(fft_length, self.ap.extractor.fft_length_d4c)
+
+    def forward(self, x, f0):
+        """Estimate spectral envelope and aperiodicity.
+
+        Parameters
+        ----------
+        x : Tensor [shape=(B, T) or (T,)]
+            Waveform.
+
+        f0 : Tensor [shape=(B, T/P) or (T/P,)]
+            F0 in Hz.
+
+        Returns
+        -------
+        sp : Tensor [shape=(B, T/P, L/2+1) or (T/P, L/2+1)]
+            Spectral envelope.
+
+        ap : Tensor [shape=(B, T/P, L/2+1) or (T/P, L/2+1)]
+            Aperiodicity.
+
+        Examples
+        --------
+        >>> x = diffsptk.sin(1000, 80)
+        >>> pitch = diffsptk.Pitch(160, 8000, out_format="f0")
+        >>> f0 = pitch(x)
+        >>> world = diffsptk.WORLDAnalysis(160, 8000, 1024)
+        >>> sp, ap = world(x, f0)
+        >>> sp.shape, ap.shape
+        (torch.Size([7, 513]), torch.Size([7, 513]))
+
+        """
+        d = x.dim()
+        if d == 1:
+            x = x.unsqueeze(0)
+        assert x.dim() == 2, "Input must be 2D tensor."
+
+        if f0.dim() == 1:
+            f0 = f0.unsqueeze(0)
+        assert f0.dim() == 2, "Input must be 2D tensor."
+
+        frames = Frame._func(x, self.frame_length, self.frame_period, mode="replicate")
+
+        sp = self.pitch_spec._analyze(frames, f0)
+
+        ap = self.ap.extractor._analyze(frames, f0)
+        ap = torch.clip(ap, min=self.ap.lower_bound, max=self.ap.upper_bound)
+        ap = self.ap.convert(ap)
+
+        if d == 1:
+            sp = sp.squeeze(0)
+            ap = ap.squeeze(0)
+        return sp, ap
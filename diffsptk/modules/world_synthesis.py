@@ -0,0 +1,208 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from torch import nn
+
+from ..misc.utils import UNVOICED_SYMBOL
+from .c2mpir import CepstrumToMinimumPhaseImpulseResponse
+from .excite import ExcitationGeneration
+
+
+class WORLDSynthesis(nn.Module):
+    """Waveform synthesis from F0, spectral envelope, and aperiodicity in the manner of
+    WORLD. The pulse train and the Gaussian noise are filtered by the frame-wise
+    minimum phase responses of the periodic and aperiodic spectra, respectively, and
+    the filtered segments are overlap-added.
+
+    Parameters
+    ----------
+    frame_period : int >= 1
+        Frame period in sample, :math:`P`.
+
+    sample_rate : int >= 8000
+        Sample rate in Hz.
+
+    fft_length : int >= 16
+        Number of FFT bins, :math:`L`.
+
+    sp_format : ['db', 'log-magnitude', 'magnitude', 'power']
+        Input format of spectral envelope.
+
+    ap_format : ['a', 'p', 'a/p', 'p/a']
+        Input format of aperiodicity.
+
+    References
+    ----------
+    .. [1] M. Morise et al., "WORLD: A vocoder-based high-quality speech synthesis
+           system for real-time applications," *IEICE Transactions on Information and
+           Systems*, vol. E99-D, no. 7, pp. 1877-1884, 2016.
+
+    """
+
+    def __init__(
+        self,
+        frame_period,
+        sample_rate,
+        fft_length,
+        sp_format="power",
+        ap_format="a",
+    ):
+        super().__init__()
+
+        assert 1 <= frame_period
+        assert 8000 <= sample_rate
+        assert 16 <= fft_length
+
+        self.frame_period = frame_period
+        self.sample_rate = sample_rate
+        self.fft_length = fft_length
+        self.conv_length = 2 ** int(np.ceil(np.log2(2 * frame_period + fft_length - 1)))
+        self.sp_formatter = self._sp_formatter(sp_format)
+        self.ap_formatter = self._ap_formatter(ap_format)
+
+        self.excite = ExcitationGeneration(
+            frame_period, voiced_region="pulse", unvoiced_region="zeros"
+        )
+        self.register_buffer("window", self._precompute(frame_period))
+
+    def forward(self, f0, sp, ap):
+        """Synthesize waveform.
+
+        Parameters
+        ----------
+        f0 : Tensor [shape=(B, N) or (N,)]
+            F0 in Hz.
+
+        sp : Tensor [shape=(B, N, L/2+1) or (N, L/2+1)]
+            Spectral envelope.
+
+        ap : Tensor [shape=(B, N, L/2+1) or (N, L/2+1)]
+            Aperiodicity.
+
+        Returns
+        -------
+        out : Tensor [shape=(B, NxP) or (NxP,)]
+            Waveform.
+
+        Examples
+        --------
+        >>> x = diffsptk.sin(1000, 80)
+        >>> pitch = diffsptk.Pitch(160, 8000, out_format="f0")
+        >>> f0 = pitch(x)
+        >>> world = diffsptk.WORLDAnalysis(160, 8000, 1024)
+        >>> sp, ap = world(x, f0)
+        >>> synthesis = diffsptk.WORLDSynthesis(160, 8000, 1024)
+        >>> y = synthesis(f0, sp, ap)
+        >>> y.shape
+        torch.Size([1120])
+
+        """
+        d = f0.dim()
+        if d == 1:
+            f0 = f0.unsqueeze(0)
+            sp = sp.unsqueeze(0)
+            ap = ap.unsqueeze(0)
+        assert f0.dim() == 2, "Input must be 2D tensor."
+        assert sp.size(-1) == ap.size(-1) == self.fft_length // 2 + 1
+
+        # Split the power spectrum into the periodic and aperiodic parts. Unvoiced
+        # frames are fully aperiodic.
+        voiced = (f0 != UNVOICED_SYMBOL).unsqueeze(-1)
+        sp = self.sp_formatter(sp)
+        ratio = torch.where(voiced, self.ap_formatter(ap) ** 2, 1)
+        periodic_response = self._get_response(sp * (1 - ratio))
+        aperiodic_response = self._get_response(sp * ratio)
+
+        # Generate the excitation signals. The pulse amplitudes make the power of the
+        # pulse train equal to one as is the case with the Gaussian noise.
+        pitch = torch.where(voiced.squeeze(-1), self.sample_rate / f0, 0)
+        pulse = self.excite(pitch.detach())
+        noise = torch.randn_like(pulse)
+
+        # Filter the excitation signals in the frequency domain and overlap-add them.
+        Y = self._segment(pulse) * periodic_response
+        Y += self._segment(noise) * aperiodic_response
+        y = self._overlap_add(torch.fft.irfft(Y), pulse.size(-1))
+
+        if d == 1:
+            y = y.squeeze(0)
+        return y
+
+    def _get_response(self, power_spectrum):
+        # Compute the minimum phase impulse response via the folded cepstrum.
+        c = torch.fft.irfft(0.5 * torch.log(power_spectrum + 1e-16))
+        c = c[..., : self.fft_length // 2 + 1]
+        c = torch.cat((c[..., :1], 2 * c[..., 1:-1], c[..., -1:]), dim=-1)
+        h = CepstrumToMinimumPhaseImpulseResponse._func(
+            c, self.fft_length, self.fft_length
+        )
+        H = torch.fft.rfft(h, n=self.conv_length)
+        # The last frame is repeated to cover the right edge.
+        H = torch.cat((H, H[..., -1:, :]), dim=-2)
+        return H
+
+    def _segment(self, e):
+        # Segment the excitation with windows centered on the frames.
+        P = self.frame_period
+        e = F.pad(e, (P, P)).unfold(-1, 2 * P, P) * self.window
+        return torch.fft.rfft(e, n=self.conv_length)
+
+    def _overlap_add(self, y, out_length):
+        P = self.frame_period
+        N = y.size(-2)
+        L = 2 * P + self.fft_length - 1
+        y = F.fold(
+            y[..., :L].transpose(-2, -1),
+            (1, (N - 1) * P + L),
+            (1, L),
+            stride=(1, P),
+        )
+        y = y[..., 0, 0, P : P + out_length]
+        return y
+
+    @staticmethod
+    def _precompute(frame_period, dtype=None, device=None):
+        # The periodic Hanning window of length 2P sums to one at hop P.
+        return torch.hann_window(
+            2 * frame_period, periodic=True, dtype=dtype, device=device
+        )
+
+    @staticmethod
+    def _sp_formatter(sp_format):
+        if sp_format in (0, "db"):
+            return lambda x: 10 ** (x / 10)
+        elif sp_format in (1, "log-magnitude"):
+            return lambda x: torch.exp(2 * x)
+        elif sp_format in (2, "magnitude"):
+            return lambda x: x**2
+        elif sp_format in (3, "power"):
+            return lambda x: x
+        raise ValueError(f"sp_format {sp_format} is not supported.")
+
+    @staticmethod
+    def _ap_formatter(ap_format):
+        if ap_format in (0, "a"):
+            return lambda x: x
+        elif ap_format in (1, "p"):
+            return lambda x: 1 - x
+        elif ap_format in (2, "a/p"):
+            return lambda x: x / (1 + x)
+        elif ap_format in (3, "p/a"):
+            return lambda x: 1 / (1 + x)
+        raise ValueError(f"ap_format {ap_format} is not supported.")
@@ -44,6 +44,15 @@ class Yingram(nn.Module):
     n_bin : int >= 1
         Number of bins of Yingram to represent a semitone range.
 
+    frame_period : int >= 1 or None
+        Frame period, :math:`P`. If given, the input is regarded as waveform and is
+        framed internally. The energy terms are then computed from a running sum
+        shared by all frames.
+
+    chunk_size : int >= 1 or None
+        Number of frames processed at once when `frame_period` is given. If None, all
+        frames are processed at once.
+
     References
     ----------
     .. [1] A. Cheveigne and H. Kawahara, "YIN, a fundamental frequency estimator for
@@ -62,6 +71,8 @@ class Yingram(nn.Module):
         lag_min=22,
         lag_max=None,
         n_bin=20,
+        frame_period=None,
+        chunk_size=None,
     ):
         super().__init__()
 
@@ -71,9 +82,13 @@ class Yingram(nn.Module):
         assert 1 <= sample_rate
         assert 1 <= lag_min <= lag_max < frame_length
         assert 1 <= n_bin
+        assert frame_period is None or 1 <= frame_period
+        assert chunk_size is None or 1 <= chunk_size
 
         self.frame_length = frame_length
         self.lag_max = lag_max
+        self.frame_period = frame_period
+        self.chunk_size = chunk_size
         self.acorr = Autocorrelation(frame_length, lag_max - 1)
         lags, lags_ceil, lags_floor, ramp = self._precompute(
             sample_rate, lag_min, lag_max, n_bin
@@ -88,12 +103,12 @@ class Yingram(nn.Module):
 
         Parameters
         ----------
-        x : Tensor [shape=(..., L)]
-            Framed waveform.
+        x : Tensor [shape=(..., L) or (..., T)]
+            Framed waveform, or waveform if `frame_period` is given.
 
         Returns
         -------
-        out : Tensor [shape=(..., M)]
+        out : Tensor [shape=(..., M) or (..., T/P, M)]
             Yingram.
 
         Examples
@@ -106,6 +121,9 @@ class Yingram(nn.Module):
         torch.Size([51, 1580])
 
         """
+        if self.frame_period is not None:
+            return self._forward_waveform(x)
+
         check_size(x.size(-1), self.frame_length, "frame length")
         return self._forward(
             x,
@@ -128,7 +146,40 @@ class Yingram(nn.Module):
 
         # Compute Eq. (7).
         d = (term1 + term2 + term3)[..., 1:]
+        return Yingram._normalize(d, lags, lags_ceil, lags_floor, ramp)
+
+    def _forward_waveform(self, x):
+        W = self.frame_length
+        P = self.frame_period
+        x = F.pad(x, (W // 2, (W - 1) // 2))
+        N = (x.size(-1) - W) // P + 1
+
+        # The running sum of energy is shared by all frames. It is accumulated in
+        # double precision to avoid the cancellation over long inputs.
+        s = F.pad(torch.cumsum(x.double().square(), dim=-1), (1, 0))
+        tau = self.ramp
+        frames = x.unfold(-1, W, P)
+
+        chunk_size = N if self.chunk_size is None else self.chunk_size
+        y = []
+        for i in range(0, N, chunk_size):
+            j = min(i + chunk_size, N)
+            start = torch.arange(i, j, device=x.device).unsqueeze(-1) * P
+            term1 = s[..., start + W - tau] - s[..., start]
+            term2 = s[..., start + W] - s[..., start + tau]
+            term3 = -2 * self.acorr(frames[..., i:j, :])[..., 1:]
+
+            # Compute Eq. (7).
+            d = (term1 + term2).to(x.dtype) + term3
+            y.append(
+                self._normalize(
+                    d, self.lags, self.lags_ceil, self.lags_floor, self.ramp
+                )
+            )
+        return torch.cat(y, dim=-2)
 
+    @staticmethod
+    def _normalize(d, lags, lags_ceil, lags_floor, ramp):
         # Compute Eq. (8).
         d = ramp * d / (torch.cumsum(d, dim=-1) + 1e-7)
 
@@ -47,3 +47,22 @@ def test_compatibility(device, module, M=25, L=100, B=2):
 
     acorr = diffsptk.Autocorrelation(L, M)
     U.check_differentiability(device, [acr2csm, acorr], [B, L])
+
+
+@pytest.mark.parametrize("M", [1, 9, 29])
+def test_moments(M, L=400, B=10):
+    if torch.get_default_dtype() == torch.float:
+        pytest.skip("This test is only for torch.double.")
+
+    acorr = diffsptk.Autocorrelation(L, M)
+    acr2csm = diffsptk.AutocorrelationToCompositeSinusoidalModelCoefficients(M)
+    r = acorr(diffsptk.nrand(B, L - 1))
+    c = acr2csm(r)
+
+    # The CSM coefficients must reproduce the moments of the autocorrelation.
+    N = (M + 1) // 2
+    x = torch.cos(c[..., :N])
+    m = c[..., N:]
+    n = torch.arange(2 * N).unsqueeze(-1)
+    u = torch.sum(m.unsqueeze(-2) * x.unsqueeze(-2) ** n, dim=-1)
+    assert torch.allclose(u, torch.matmul(r, acr2csm.C))
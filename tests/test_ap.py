@@ -76,3 +76,19 @@ def test_compatibility(device, algorithm, out_format, M=24, P=80, sr=16000, L=51
     )
 
     U.check_differentiability(device, ap, [(B, sr), (B, sr // P)], checks=[True, False])
+
+
+@pytest.mark.parametrize("block_size", [1, 7])
+def test_block_processing(block_size, P=80, L=512):
+    x, sr = diffsptk.read(
+        "assets/data.wav",
+        double=torch.get_default_dtype() == torch.double,
+    )
+    f0 = torch.full((x.size(0) // P,), 120.0)
+
+    ap1 = diffsptk.Aperiodicity(P, sr, L, "d4c")
+    ap2 = diffsptk.Aperiodicity(P, sr, L, "d4c", block_size=block_size)
+    y1 = ap1(x, f0)
+    y2 = ap2(x, f0)
+    assert y1.shape == y2.shape
+    assert torch.mean(torch.abs(y1 - y2)) < 1e-3
@@ -0,0 +1,99 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import pytest
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+def pipeline(name):
+    if name == "stft":
+        return diffsptk.STFT(400, 80, 512, out_format="db")
+    if name == "fused_stft":
+        return diffsptk.STFT(400, 80, 512, out_format="db", fused=True)
+    if name == "istft":
+        return torch.nn.Sequential(
+            diffsptk.STFT(400, 80, 512, out_format="complex"),
+            diffsptk.ISTFT(400, 80, 512),
+        )
+    if name == "mfcc":
+        return torch.nn.Sequential(
+            diffsptk.STFT(400, 80, 512),
+            diffsptk.MFCC(12, 40, 512, 16000),
+        )
+    if name == "mcep":
+        return torch.nn.Sequential(
+            diffsptk.STFT(400, 80, 512),
+            diffsptk.MelCepstralAnalysis(
+                fft_length=512, cep_order=24, alpha=0.42, n_iter=3
+            ),
+            diffsptk.MelGeneralizedCepstrumToSpectrum(
+                24, 512, alpha=0.42, out_format="db"
+            ),
+        )
+    if name == "lsp":
+        return torch.nn.Sequential(
+            diffsptk.Frame(400, 80),
+            diffsptk.Window(400),
+            diffsptk.LPC(400, 24),
+            diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(24),
+            diffsptk.LineSpectralPairsStabilityCheck(24),
+            diffsptk.LineSpectralPairsToSpectrum(24, 512, out_format="db"),
+        )
+    raise ValueError(name)
+
+
+@pytest.mark.parametrize("name", ["stft", "fused_stft", "istft", "mfcc", "mcep", "lsp"])
+def test_compile(name, T1=4000, T2=6480):
+    torch.manual_seed(0)
+    torch._dynamo.reset()
+    module = pipeline(name)
+    compiled = torch.compile(module, fullgraph=True, dynamic=True)
+
+    # The second length must be handled without recompilation.
+    with torch._dynamo.config.patch(error_on_recompile=True):
+        for T in (T1, T2):
+            x = torch.randn(2, T)
+            y1 = module(x)
+            y2 = compiled(x)
+            assert y1.shape == y2.shape
+            assert U.allclose(y1, y2, rtol=1e-4, atol=1e-3)
+
+
+def test_compile_check(M=9, B=4):
+    torch._dynamo.reset()
+    c = torch.full((B, M + 1), 0.01)
+    c[0] = 10
+
+    mlsacheck = diffsptk.MLSADigitalFilterStabilityCheck(M, warn_type="exit")
+    compiled = torch.compile(mlsacheck, fullgraph=True)
+    compiled(c[1:])
+    with pytest.raises(RuntimeError):
+        compiled(c)
+
+    mlsacheck = diffsptk.MLSADigitalFilterStabilityCheck(M, warn_type="warn")
+    compiled = torch.compile(mlsacheck, fullgraph=True)
+    compiled(c)
+    with pytest.warns(UserWarning):
+        assert mlsacheck.report() == 1
+
+    root_pol = diffsptk.PolynomialToRoots(M)
+    compiled = torch.compile(root_pol, fullgraph=True)
+    compiled(c[1:])
+    with pytest.raises(RuntimeError):
+        compiled(c - 10)
@@ -14,6 +14,7 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import numpy as np
 import pytest
 import torch
 
@@ -158,3 +159,91 @@ def test_posterior(M=3, K=4, B=32, n_iter=50):
     gmm = diffsptk.GMM(M, K, n_iter=10)
     _, posterior, _ = gmm(x, return_posterior=True)
     assert posterior.sum().item() == pytest.approx(B)
+
+
+@pytest.mark.parametrize("var_type", ["diag", "full"])
+def test_e_step(var_type, M=4, K=70, T=50):
+    torch.manual_seed(0)
+    L = M + 1
+    w = torch.softmax(torch.randn(K), dim=0)
+    mu = torch.randn(K, L)
+    A = torch.randn(K, L, L)
+    sigma = torch.matmul(A, A.transpose(-2, -1)) + torch.eye(L)
+    if var_type == "diag":
+        sigma = torch.diag_embed(torch.diagonal(sigma, dim1=-2, dim2=-1))
+
+    gmm = diffsptk.GMM(M, K, var_type=var_type, batch_size=16)
+    gmm.set_params((w, mu, sigma))
+    x = torch.randn(T, L) * 2
+    posterior, log_prob = gmm._e_step(x, reduction="none")
+
+    dist = torch.distributions.MultivariateNormal(mu, sigma)
+    numer = torch.log(w) + dist.log_prob(x.unsqueeze(1))
+    target = torch.logsumexp(numer, dim=-1)
+    assert U.allclose(log_prob, target, rtol=1e-4, atol=1e-3)
+    assert U.allclose(posterior, torch.softmax(numer, dim=-1), atol=1e-5)
+
+
+@pytest.mark.parametrize("var_type", ["diag", "full"])
+def test_transform(var_type, M=3, N=1, K=4, T=50):
+    torch.manual_seed(0)
+    x = torch.randn(T * 4, M + 1)
+    gmm = diffsptk.GMM(M, K, n_iter=5, var_type=var_type, block_size=(2, 2))
+    gmm.warmup(x, seed=1234)
+    gmm(x)
+
+    L = N + 1
+    x = torch.randn(T, L)
+    mu, sigma = gmm.mu, gmm.sigma
+    A = torch.matmul(sigma[:, L:, :L], torch.inverse(sigma[:, :L, :L]))
+    diff = (x.unsqueeze(1) - mu[:, :L]).unsqueeze(-1)
+    E = mu[:, L:] + torch.matmul(A, diff).squeeze(-1)  # (T, K, M-N)
+
+    y, indices, _ = gmm.transform(x)
+    assert U.allclose(y, E[torch.arange(T), indices], atol=1e-5)
+
+    posterior, _ = gmm._e_step(x, reduction="none", in_order=N)
+    y, _, _ = gmm.transform(x, mode="mmse")
+    assert U.allclose(y, (posterior.unsqueeze(-1) * E).sum(1), atol=1e-5)
+
+    # The cached regression matrices must follow the parameter update.
+    with torch.inference_mode():
+        gmm.set_params((None, torch.cat((mu[:, :L], mu[:, L:] + 1), dim=-1), None))
+    y, _, _ = gmm.transform(x, mode="mmse")
+    assert U.allclose(y, (posterior.unsqueeze(-1) * E).sum(1) + 1, atol=1e-5)
+
+    # The cache must also follow in-place updates of the parameters.
+    with torch.inference_mode():
+        gmm.mu[:, L:] += 5
+    y, _, _ = gmm.transform(x, mode="mmse")
+    assert U.allclose(y, (posterior.unsqueeze(-1) * E).sum(1) + 6, atol=1e-5)
+    with torch.inference_mode():
+        gmm.sigma[:, :L, :L] *= 2
+    y, _, _ = gmm.transform(x)
+    gmm._clear_cache(gmm)
+    assert torch.equal(y, gmm.transform(x)[0])
+
+
+@pytest.mark.parametrize("var_type", ["diag", "full"])
+@pytest.mark.parametrize("offset, stdv", [(5, 0.1), (20, 0.01)])
+def test_e_step_precision(var_type, offset, stdv, M=39, K=64, T=100):
+    torch.manual_seed(0)
+    L = M + 1
+    w = torch.softmax(torch.randn(K), dim=0)
+    mu = offset + stdv * torch.randn(K, L)
+    var = (stdv * (0.5 + torch.rand(K, L))) ** 2
+    sigma = torch.diag_embed(var)
+
+    gmm = diffsptk.GMM(M, K, var_type=var_type, batch_size=16).float()
+    gmm.set_params((w.float(), mu.float(), sigma.float()))
+    x = (offset + stdv * torch.randn(T, L)).float()
+    posterior, log_prob = gmm._e_step(x, reduction="none")
+    assert posterior.dtype == torch.float
+
+    x, mu, var, w = x.float(), mu.float(), var.float(), w.float()
+    mahala = ((x.unsqueeze(1) - mu) ** 2 / var).sum(-1)
+    log_det = torch.log(var).sum(-1)
+    numer = torch.log(w) - 0.5 * (L * np.log(2 * np.pi) + log_det + mahala)
+    target = torch.logsumexp(numer, dim=-1)
+    assert U.allclose(log_prob, target, atol=1e-3)
+    assert U.allclose(posterior, torch.softmax(numer, dim=-1), atol=1e-4)
@@ -0,0 +1,55 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import subprocess
+import sys
+
+import diffsptk
+
+
+def test_lazy_import():
+    code = (
+        "import sys, diffsptk; "
+        "assert 'vector_quantize_pytorch' not in sys.modules; "
+        "assert 'torchaudio' not in sys.modules; "
+        "assert 'diffsptk.modules.vq' not in sys.modules; "
+        "diffsptk.STFT; "
+        "assert 'diffsptk.modules.vq' not in sys.modules; "
+        "diffsptk.VectorQuantization; "
+        "assert 'vector_quantize_pytorch' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_public_names():
+    for name in diffsptk.modules.__all__:
+        assert name in dir(diffsptk)
+        assert getattr(diffsptk, name) is getattr(diffsptk.modules, name)
+    assert diffsptk.MLSA is diffsptk.PseudoMGLSADigitalFilter
+    assert diffsptk.modules.stft.ShortTimeFourierTransform is diffsptk.STFT
+    assert "stft" in dir(diffsptk.functional)
+
+
+def test_star_import():
+    namespace = {}
+    exec("from diffsptk import *", namespace)
+    names = set(namespace) - {"__builtins__"}
+    assert names == {name for name in dir(diffsptk) if not name.startswith("_")}
+    assert names == set(diffsptk.__all__)
+    for name in ("stft", "world", "librosa", "signals", "functional", "STFT"):
+        assert name in names
+    for package in (diffsptk, diffsptk.modules, diffsptk.misc):
+        assert not any(n[0] == "_" and n[:2] != "__" for n in dir(package))
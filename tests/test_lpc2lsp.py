@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -45,3 +46,18 @@ def test_compatibility(device, module, M, out_format, L=32, B=2):
     )
 
     U.check_differentiability(device, lpc2lsp, [B, M + 1])
+
+
+@pytest.mark.parametrize("M", [1, 2, 7, 24])
+@pytest.mark.parametrize("n_split", [4, 256])
+def test_root_finding(M, n_split, L=512, B=100):
+    torch.manual_seed(0)
+    lpc = diffsptk.LPC(L, M)
+    a = lpc(diffsptk.nrand(B, L - 1))
+    lpc2lsp = diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(
+        M, n_split=n_split
+    )
+    lpc2lsp_eig = diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(
+        M, n_split=None
+    )
+    assert torch.allclose(lpc2lsp(a), lpc2lsp_eig(a), atol=1e-5)
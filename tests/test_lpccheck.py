@@ -14,7 +14,10 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import warnings
+
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -43,3 +46,23 @@ def test_compatibility(device, module, L=32, M=9, margin=0.01, B=2):
     )
 
     U.check_differentiability(device, lpccheck, [B, M + 1])
+
+
+def test_defer(M=9, B=10):
+    k = diffsptk.nrand(B, M, stdv=0.1)
+    k[:3, 1] = 1.5
+    a = diffsptk.functional.par2lpc(k)
+    lpccheck = diffsptk.LinearPredictiveCoefficientsStabilityCheck(
+        M, warn_type="ignore"
+    )
+    lpccheck_defer = diffsptk.LinearPredictiveCoefficientsStabilityCheck(
+        M, warn_type="exit", defer=True
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        a2, mask = lpccheck_defer(a, return_mask=True)
+    assert torch.allclose(lpccheck(a), a2)
+    assert torch.equal(mask, torch.arange(B) < 3)
+    with pytest.raises(RuntimeError):
+        lpccheck_defer.report()
+    assert lpccheck_defer.report() == 0
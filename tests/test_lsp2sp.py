@@ -46,3 +46,27 @@ def test_compatibility(device, module, M, out_format, L=16, B=2):
     )
 
     U.check_differentiability(device, [lsp2sp, torch.abs], [B, M + 1])
+
+
+@pytest.mark.parametrize("M", [0, 7, 8])
+def test_memory_efficient(M, L=64, B=4):
+    w = torch.sort(torch.rand(B, M + 1) * torch.pi, dim=-1)[0]
+    if 1 <= M:
+        # Make the spectrum hit the floor of the logarithm.
+        w[0, 1] = 0
+        w[-1, -1] = torch.pi
+    w1 = w.clone().requires_grad_()
+    w2 = w.clone().requires_grad_()
+    lsp2sp1 = diffsptk.LineSpectralPairsToSpectrum(
+        M, L, gamma=-0.5, out_format="log-magnitude"
+    )
+    lsp2sp2 = diffsptk.LineSpectralPairsToSpectrum(
+        M, L, gamma=-0.5, out_format="log-magnitude", memory_efficient=True
+    )
+    y1 = lsp2sp1(w1)
+    y2 = lsp2sp2(w2)
+    assert torch.allclose(y1, y2)
+    y1.sum().backward()
+    y2.sum().backward()
+    assert torch.all(torch.isfinite(w1.grad))
+    assert torch.allclose(w1.grad, w2.grad)
@@ -14,6 +14,8 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import warnings
+
 import pytest
 import torch
 
@@ -46,3 +48,19 @@ def test_compatibility(device, module, L=32, M=9, rate=0.8, B=2):
     U.check_differentiability(
         device, [lspcheck, lambda x: torch.sort(x)[0], torch.abs], [B, M + 1]
     )
+
+
+def test_defer(M=9, B=10):
+    w = torch.linspace(0.1, 3, M + 1).repeat(B, 1)
+    w[0, 2] = w[0, 1]
+    w[1, -1] = torch.pi
+    lspcheck = diffsptk.LineSpectralPairsStabilityCheck(M, rate=0.8, warn_type="ignore")
+    lspcheck_defer = diffsptk.LineSpectralPairsStabilityCheck(M, rate=0.8, defer=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert torch.allclose(lspcheck(w), lspcheck_defer(w))
+        _, mask = lspcheck_defer(w, return_mask=True)
+    assert torch.equal(mask, torch.arange(B) < 2)
+    with pytest.warns(UserWarning):
+        assert lspcheck_defer.report() == 4
+    assert lspcheck_defer.report() == 0
@@ -93,3 +93,13 @@ def test_compatibility(
     )
 
     U.check_differentiability(device, [mgc2mgc, torch.abs], [B, m + 1])
+
+
+@pytest.mark.parametrize("in_order, out_order", [[0, 4], [4, 0], [8, 8], [4, 12]])
+@pytest.mark.parametrize("in_gamma, out_gamma", [[0, -0.5], [-1, 0.3], [0.5, -0.2]])
+def test_recursive_conversion(in_order, out_order, in_gamma, out_gamma, B=4):
+    gc2gc = diffsptk.modules.mgc2mgc.GeneralizedCepstrumToGeneralizedCepstrum
+    c1 = diffsptk.nrand(B, in_order) / (10 * (torch.arange(in_order + 1) + 1))
+    c2 = gc2gc._forward_recursive(c1, out_order, in_gamma, out_gamma)
+    c3 = gc2gc._forward_fft(c1, out_order, in_gamma, out_gamma, n_fft=1024)
+    assert U.allclose(c2, c3)
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -39,3 +40,51 @@ def test_compatibility(device, n_iter, gamma, M=8, L=32, B=2, alpha=0.1):
     )
 
     U.check_differentiability(device, [mgcep, spec], [B, L])
+
+
+@pytest.mark.parametrize("gamma", [0, -0.5])
+def test_early_stopping(gamma, M=8, L=32, B=4, alpha=0.1, n_iter=10):
+    x = diffsptk.nrand(B, 3, L - 1) ** 2
+    spec = diffsptk.Spectrum(L, eps=1e-8)(x)
+    mgcep1 = diffsptk.MelGeneralizedCepstralAnalysis(M, L, alpha, gamma, n_iter=n_iter)
+    mgcep2 = diffsptk.MelGeneralizedCepstralAnalysis(
+        M, L, alpha, gamma, n_iter=n_iter, eps=1e-6
+    )
+    y1 = mgcep1(spec)
+    y2 = mgcep2(spec)
+    assert y1.shape == y2.shape
+    assert U.allclose(y1, y2, rtol=1e-3, atol=1e-3)
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("gamma", [-0.5, -1])
+def test_fft_warping(device, gamma, M=8, L=64, B=2, alpha=0.1):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    x = diffsptk.nrand(B, L - 1).to(device)
+    spec = diffsptk.Spectrum(L, eps=1e-8).to(device)
+    mgcep1 = diffsptk.MelGeneralizedCepstralAnalysis(M, L, alpha, gamma, n_iter=3)
+    mgcep2 = diffsptk.MelGeneralizedCepstralAnalysis(
+        M, L, alpha, gamma, n_iter=3, n_fft=4 * L
+    )
+    y1 = mgcep1.to(device)(spec(x))
+    y2 = mgcep2.to(device)(spec(x))
+    assert U.allclose(y1, y2, rtol=1e-3, atol=1e-3)
+
+    U.check_differentiability(device, [mgcep2, spec], [B, L])
+
+
+@pytest.mark.parametrize("gamma", [0, -0.5, -1])
+def test_tph_solver(gamma, M=8, L=32, B=4, alpha=0.1):
+    x = diffsptk.nrand(B, L - 1)
+    spec = diffsptk.Spectrum(L, eps=1e-8)
+    mgcep1 = diffsptk.MelGeneralizedCepstralAnalysis(M, L, alpha, gamma, n_iter=3)
+    mgcep2 = diffsptk.MelGeneralizedCepstralAnalysis(
+        M, L, alpha, gamma, n_iter=3, solver="tph"
+    )
+    y1 = mgcep1(spec(x))
+    y2 = mgcep2(spec(x))
+    assert U.allclose(y1, y2)
+
+    U.check_differentiability("cpu", [mgcep2, spec], [B, L])
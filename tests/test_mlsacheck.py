@@ -14,7 +14,10 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import warnings
+
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -68,3 +71,19 @@ def test_compatibility(
     )
 
     U.check_differentiability(device, mlsacheck, [B, M + 1])
+
+
+def test_defer(M=9, B=10):
+    c = torch.full((B, M + 1), 0.01)
+    c[: B // 2] = 10
+    mlsacheck = diffsptk.MLSADigitalFilterStabilityCheck(M, warn_type="ignore")
+    mlsacheck_defer = diffsptk.MLSADigitalFilterStabilityCheck(M, defer=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert torch.allclose(mlsacheck(c), mlsacheck_defer(c))
+        _, mask = mlsacheck_defer(c, return_mask=True)
+    assert torch.equal(mask, torch.arange(B) < B // 2)
+    with pytest.warns(UserWarning):
+        assert mlsacheck_defer.report() == 2 * (B // 2)
+    assert mlsacheck_defer.report() == 0
+    assert "_n_unstable" not in mlsacheck_defer.state_dict()
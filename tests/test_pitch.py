@@ -23,7 +23,7 @@ import tests.utils as U
 
 
 @pytest.mark.parametrize("device", ["cpu", "cuda"])
-@pytest.mark.parametrize("algorithm", ["crepe", "fcnf0"])
+@pytest.mark.parametrize("algorithm", ["crepe", "fcnf0", "yin"])
 @pytest.mark.parametrize("out_format", [0, 1, 2])
 def test_compatibility(device, algorithm, out_format, P=80, sr=16000, L=80, H=180):
     try:
@@ -91,3 +91,55 @@ def test_probability_calculation(algorithm, P=80, L=80, H=180):
         pytest.skip(f"Algorithm '{algorithm}' is not available.")
 
     pitch(x)
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+def test_yin(device, P=80, sr=16000, f0=120, B=2):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    pitch = diffsptk.Pitch(P, sr, "yin", out_format="f0").to(device)
+    x = diffsptk.sin(sr - 1, sr / f0, device=device)
+    x = torch.stack([x, torch.zeros_like(x)])
+    y = pitch(x)
+    assert y.shape == (B, sr // P)
+    assert U.allclose(y[0, 5:-5], torch.full_like(y[0, 5:-5], f0), rtol=1e-3)
+    assert torch.all(y[1] == 0)
+
+
+@pytest.mark.parametrize("out_format", ["prob", "embed"])
+def test_yin_unsupported_format(out_format, P=80, sr=16000):
+    with pytest.raises(ValueError):
+        diffsptk.Pitch(P, sr, "yin", out_format=out_format)
+
+    extractor = diffsptk.Pitch(P, sr, "yin", out_format="f0").extractor
+    with pytest.raises(ValueError):
+        getattr(extractor, f"calc_{out_format}")(diffsptk.nrand(sr - 1))
+
+
+def test_yin_threshold(P=80, sr=16000, f0=120):
+    x = diffsptk.sin(sr - 1, sr / f0) + 0.5 * diffsptk.nrand(sr - 1)
+    x = x.unsqueeze(0)
+    n_voiced = []
+    for threshold in (0.05, 0.15, 0.5):
+        pitch = diffsptk.Pitch(
+            P, sr, "yin", out_format="f0", aperiodicity_threshold=threshold
+        )
+        n_voiced.append((pitch(x) != 0).sum())
+    assert n_voiced[0] <= n_voiced[1] <= n_voiced[2]
+    assert n_voiced[0] < n_voiced[2]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7, 100])
+@pytest.mark.parametrize("B", [2, 16])
+def test_infer_by_chunk(chunk_size, B, T=100, L=16, P=10):
+    from diffsptk.modules.pitch import infer_by_chunk
+
+    def infer(x):
+        if chunk_size is not None:
+            assert x.shape[:-1].numel() <= chunk_size
+        return x.cumsum(-1)
+
+    frames = diffsptk.Frame(L, P)(torch.randn(B, T))
+    y = infer_by_chunk(infer, frames, chunk_size)
+    assert U.allclose(y, frames.cumsum(-1))
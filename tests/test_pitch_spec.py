@@ -49,3 +49,22 @@ def test_compatibility(device, out_format, P=80, sr=16000, L=1024, B=2):
     U.check_differentiability(
         device, pitch_spec, [(B, sr), (B, sr // P)], checks=[True, False]
     )
+
+
+@pytest.mark.parametrize("block_size", [1, 7])
+def test_block_processing(monkeypatch, block_size, P=80, L=1024, B=2):
+    # Remove the randomness of the infinitesimal noise.
+    monkeypatch.setattr(torch, "randn_like", lambda x: torch.full_like(x, 0.5))
+
+    x, sr = diffsptk.read(
+        "assets/data.wav",
+        double=torch.get_default_dtype() == torch.double,
+    )
+    x = torch.stack([x, x.flip(-1)])
+    f0 = torch.full((B, x.size(-1) // P), 120.0)
+
+    pitch_spec1 = diffsptk.PitchAdaptiveSpectralAnalysis(P, sr, L, out_format="db")
+    pitch_spec2 = diffsptk.PitchAdaptiveSpectralAnalysis(
+        P, sr, L, out_format="db", block_size=block_size
+    )
+    assert U.allclose(pitch_spec1(x, f0), pitch_spec2(x, f0), atol=1e-2)
@@ -0,0 +1,89 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import os
+import subprocess
+import sys
+
+import torch
+
+import diffsptk
+import diffsptk.functional as F
+
+
+def test_profiling():
+    forward = diffsptk.STFT.forward
+    x = torch.randn(1000)
+
+    diffsptk.reset_profiling()
+    diffsptk.set_profiling(True)
+    try:
+        stft = diffsptk.STFT(frame_length=400, frame_period=80, fft_length=512)
+        stft(x)
+        stft(x)
+        F.stft(x, frame_length=400, frame_period=80, fft_length=512)
+        assert diffsptk.STFT.forward is not forward
+        report = diffsptk.get_profiling_report()
+    finally:
+        diffsptk.set_profiling(False)
+    assert diffsptk.STFT.forward is forward
+
+    lines = report.splitlines()
+    names = [line.split()[0] for line in lines[2:]]
+    assert "ShortTimeFourierTransform" in names
+    assert "Frame" in names
+    assert "functional.stft" in names
+    calls = dict(line.split()[:2] for line in lines[2:])
+    assert calls["ShortTimeFourierTransform"] == "2"
+    assert calls["functional.stft"] == "1"
+
+    diffsptk.reset_profiling()
+    stft(x)
+    assert len(diffsptk.get_profiling_report().splitlines()) == 2
+
+
+def test_cuda():
+    if not torch.cuda.is_available():
+        return
+
+    x = torch.randn(16000, device="cuda")
+    stft = diffsptk.STFT(frame_length=400, frame_period=80, fft_length=512)
+
+    diffsptk.reset_profiling()
+    diffsptk.set_profiling(True)
+    try:
+        stft(x)
+        report = diffsptk.get_profiling_report()
+    finally:
+        diffsptk.set_profiling(False)
+
+    lines = report.splitlines()
+    total = {line.split()[0]: float(line.split()[2]) for line in lines[2:]}
+    assert 0 < total["Frame"] <= total["ShortTimeFourierTransform"]
+
+
+def test_environment_variable():
+    code = "import torch, diffsptk; diffsptk.Frame(4, 2)(torch.randn(10))"
+    env = dict(os.environ, DIFFSPTK_PROFILING="1")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "Frame" in result.stderr
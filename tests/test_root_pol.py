@@ -50,3 +50,16 @@ def test_compatibility(device, module, out_format, M=12, B=2):
     )
 
     U.check_differentiability(device, [torch.abs, root_pol], [B, M + 1])
+
+
+def test_defer(M=4, B=5):
+    a = diffsptk.nrand(B, M)
+    a[:2, 0] = 0
+    root_pol = diffsptk.PolynomialToRoots(M, defer=True)
+    _, mask = root_pol(a, return_mask=True)
+    assert torch.equal(mask, torch.arange(B) < 2)
+    with pytest.raises(RuntimeError):
+        root_pol.report()
+    assert root_pol.report() == 0
+    with pytest.raises(RuntimeError):
+        diffsptk.PolynomialToRoots(M)(a)
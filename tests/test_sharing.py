@@ -0,0 +1,90 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import io
+
+import torch
+
+import diffsptk
+
+
+def storages(module):
+    return {x.untyped_storage().data_ptr() for x in module.buffers()}
+
+
+def nbytes(module):
+    buffer = io.BytesIO()
+    torch.save(module.state_dict(), buffer)
+    return buffer.tell()
+
+
+def test_buffer_sharing(M=24, L=512):
+    x = diffsptk.nrand(3, L // 2) ** 2 + 1
+
+    diffsptk.set_buffer_sharing(True)
+    try:
+        modules = torch.nn.ModuleList(
+            [
+                diffsptk.MelGeneralizedCepstralAnalysis(M, L, 0.42, -0.5)
+                for _ in range(3)
+            ]
+        )
+        gmm1 = diffsptk.GMM(M, 4)
+        gmm2 = diffsptk.GMM(M, 4)
+        mlsacheck1 = diffsptk.MLSADigitalFilterStabilityCheck(M, defer=True)
+        mlsacheck2 = diffsptk.MLSADigitalFilterStabilityCheck(M, defer=True)
+    finally:
+        diffsptk.set_buffer_sharing(False)
+    module = diffsptk.MelGeneralizedCepstralAnalysis(M, L, 0.42, -0.5)
+
+    assert storages(modules) == storages(modules[0])
+    assert storages(modules).isdisjoint(storages(module))
+    assert storages(gmm1).isdisjoint(storages(gmm2))
+    assert mlsacheck1.alpha_vector.data_ptr() == mlsacheck2.alpha_vector.data_ptr()
+    assert mlsacheck1._n_unstable.data_ptr() != mlsacheck2._n_unstable.data_ptr()
+    assert nbytes(modules) < 2 * nbytes(module)
+    for m in modules:
+        assert torch.equal(m(x), module(x))
+
+    modules.to(torch.half)
+    assert storages(modules) != storages(modules[0])
+    diffsptk.share_buffers(modules)
+    assert storages(modules) == storages(modules[0])
+
+
+def test_copy_on_write(n_band=4, filter_order=63):
+    diffsptk.set_buffer_sharing(True)
+    try:
+        pqmf1 = diffsptk.PQMF(n_band, filter_order, learnable=True)
+        pqmf2 = diffsptk.PQMF(n_band, filter_order, learnable=True)
+        pqmf3 = diffsptk.PQMF(n_band, filter_order)
+    finally:
+        diffsptk.set_buffer_sharing(False)
+    filters = pqmf3.filters.clone()
+    assert pqmf1.filters.data_ptr() == pqmf2.filters.data_ptr()
+    assert pqmf1.filters.data_ptr() == pqmf3.filters.data_ptr()
+
+    optimizer = torch.optim.SGD(pqmf1.parameters(), lr=0.1)
+    pqmf1(diffsptk.nrand(1, 1, 99)).sum().backward()
+    optimizer.step()
+    assert not torch.equal(pqmf1.filters, filters)
+    assert torch.equal(pqmf2.filters, filters)
+    assert torch.equal(pqmf3.filters, filters)
+
+    state_dict = {k: v + 1 for k, v in pqmf2.state_dict().items()}
+    pqmf2.load_state_dict(state_dict)
+    assert torch.equal(pqmf2.filters, filters + 1)
+    assert torch.equal(pqmf3.filters, filters)
@@ -59,3 +59,37 @@ def test_compatibility(
     )
 
     U.check_differentiability(device, [torch.abs, stft], [T])
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("center", [False, True])
+@pytest.mark.parametrize("zmean", [False, True])
+@pytest.mark.parametrize("out_format", ["db", "magnitude", "complex"])
+def test_fused(device, center, zmean, out_format, B=2, T=100, P=10, L1=12, L2=16):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    params = {
+        "frame_length": L1,
+        "frame_period": P,
+        "fft_length": L2,
+        "center": center,
+        "zmean": zmean,
+        "relative_floor": -40,
+        "out_format": out_format,
+    }
+    stft = diffsptk.STFT(**params).to(device)
+    fused_stft = diffsptk.STFT(**params, fused=True).to(device)
+
+    x = torch.randn(B, T, device=device)
+    y = stft(x)
+    with torch.no_grad():
+        y_hat = fused_stft(x)
+    assert U.allclose(y, y_hat)
+
+    y_hat = diffsptk.functional.stft(x, **params, fused=True)
+    assert U.allclose(y, y_hat)
+
+    U.check_differentiability(
+        device, [torch.abs, fused_stft] if out_format == "complex" else fused_stft, [T]
+    )
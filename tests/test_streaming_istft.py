@@ -0,0 +1,57 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import pytest
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("center", [False, True])
+@pytest.mark.parametrize("P", [3, 10, 12])
+def test_compatibility(device, center, P, B=2, T=100, L1=12, L2=16):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    params = {
+        "frame_length": L1,
+        "frame_period": P,
+        "fft_length": L2,
+        "center": center,
+        "window": "hamming",
+    }
+    stft = diffsptk.STFT(**params, out_format="complex").to(device)
+    istft = diffsptk.ISTFT(**params).to(device)
+    streaming_istft = diffsptk.StreamingISTFT(**params).to(device)
+
+    x = diffsptk.nrand(B, T - 1).to(device)
+    X = stft(x)
+    N = X.size(-2)
+    chunks = torch.split(X, [1, 0, N // 2, N - N // 2 - 1], dim=-2)
+    y = istft(X).cpu().numpy()
+    y_hat = torch.cat(
+        [streaming_istft(c, last=i == len(chunks) - 1) for i, c in enumerate(chunks)],
+        dim=-1,
+    )
+    assert U.allclose(y, y_hat.cpu().numpy())
+
+    U.check_differentiability(
+        device,
+        [lambda x: streaming_istft(x, last=True), lambda x: torch.polar(x, x)],
+        [B, T // P, L2 // 2 + 1],
+    )
@@ -0,0 +1,52 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import pytest
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("center", [False, True])
+@pytest.mark.parametrize("comp", [False, True])
+def test_compatibility(device, center, comp, B=2, T=100, P=10, L1=12, L2=16):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    params = {
+        "frame_length": L1,
+        "frame_period": P,
+        "fft_length": L2,
+        "center": center,
+        "out_format": "complex" if comp else "power",
+    }
+    stft = diffsptk.STFT(**params).to(device)
+    streaming_stft = diffsptk.StreamingSTFT(**params).to(device)
+
+    x = diffsptk.nrand(B, T - 1).to(device)
+    chunks = torch.split(x, [7, 0, 31, 1, 61], dim=-1)
+    y = stft(x).cpu().numpy()
+    y_hat = torch.cat(
+        [streaming_stft(c, last=i == len(chunks) - 1) for i, c in enumerate(chunks)],
+        dim=-2,
+    )
+    assert U.allclose(y, y_hat.cpu().numpy())
+
+    U.check_differentiability(
+        device, [torch.abs, lambda x: streaming_stft(x, last=True)], [B, T]
+    )
@@ -48,3 +48,21 @@ def test_compatibility(device, module, fl, fp, center, T=20):
     assert torch.allclose(x2, x3)
 
     U.check_differentiability(device, unframe, [T // fp, fl])
+
+
+@pytest.mark.parametrize("fl", [1, 4, 7])
+@pytest.mark.parametrize("fp", [1, 2, 3])
+@pytest.mark.parametrize("N", [1, 2, 3, 10])
+def test_envelope(fl, fp, N):
+    if fl < fp:
+        return
+
+    w = diffsptk.Window._precompute(fl, "hanning", "none")
+    e1 = torch.nn.functional.fold(
+        w.view(1, -1, 1).repeat(1, 1, N),
+        (1, (N - 1) * fp + fl),
+        (1, fl),
+        stride=(1, fp),
+    ).view(-1)
+    e2 = diffsptk.Unframe._envelope(w, fp, N)
+    assert U.allclose(e1, e2)
@@ -0,0 +1,54 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import pytest
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+def test_compatibility(device, monkeypatch, P=80, L=1024, B=2):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    # Remove the randomness of the infinitesimal noise.
+    monkeypatch.setattr(torch, "randn_like", lambda x: torch.full_like(x, 0.5))
+
+    x, sr = diffsptk.read(
+        "assets/data.wav",
+        double=torch.get_default_dtype() == torch.double,
+        device=device,
+    )
+    f0 = diffsptk.Pitch(P, sr, "yin", out_format="f0").to(device)(x)
+
+    world = diffsptk.WORLDAnalysis(P, sr, L, sp_format="db", threshold=0.5).to(device)
+    pitch_spec = diffsptk.PitchAdaptiveSpectralAnalysis(P, sr, L, out_format="db")
+    ap = diffsptk.Aperiodicity(P, sr, L, "d4c", threshold=0.5)
+
+    sp1, ap1 = world(x, f0)
+    sp2 = pitch_spec.to(device)(x, f0)
+    ap2 = ap.to(device)(x, f0)
+    assert U.allclose(sp1, sp2)
+    assert U.allclose(ap1, ap2)
+
+    U.check_differentiability(
+        device,
+        lambda x, f0: torch.cat(world(x, f0), dim=-1),
+        [(B, sr), (B, sr // P)],
+        checks=[True, False],
+    )
@@ -0,0 +1,54 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import pytest
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+def test_analysis_synthesis(device, P=80, L=1024, B=2, N=20):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    x, sr = diffsptk.read(
+        "assets/data.wav",
+        double=torch.get_default_dtype() == torch.double,
+        device=device,
+    )
+    f0 = diffsptk.Pitch(P, sr, "yin", out_format="f0").to(device)(x)
+
+    analysis = diffsptk.WORLDAnalysis(P, sr, L, sp_format="db").to(device)
+    synthesis = diffsptk.WORLDSynthesis(P, sr, L, sp_format="db").to(device)
+
+    sp, ap = analysis(x, f0)
+    y = synthesis(f0, sp, ap)
+    assert y.shape == x.shape
+
+    # The resynthesized waveform should have a similar spectral envelope.
+    sp2, _ = analysis(y, f0)
+    lsd = (sp - sp2).square().mean(-1).sqrt()
+    assert torch.median(lsd) < 6
+
+    U.check_differentiability(
+        device,
+        lambda sp, ap: synthesis(
+            torch.full((B, N), 120.0, device=device), sp, torch.sigmoid(ap)
+        ),
+        [(B, N, L // 2 + 1), (B, N, L // 2 + 1)],
+    )
@@ -57,3 +57,20 @@ def test_compatibility(
     assert U.allclose(y, y_hat)
 
     U.check_differentiability(device, yingram, [B, fl])
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("chunk_size", [None, 7])
+def test_waveform_input(device, chunk_size, fl=256, fp=40, sr=16000, T=1000, B=2):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    frame = diffsptk.Frame(fl, fp).to(device)
+    yingram1 = diffsptk.Yingram(fl, sr).to(device)
+    yingram2 = diffsptk.Yingram(fl, sr, frame_period=fp, chunk_size=chunk_size)
+    yingram2 = yingram2.to(device)
+
+    x = diffsptk.nrand(B, T - 1, device=device)
+    assert U.allclose(yingram1(frame(x)), yingram2(x))
+
+    U.check_differentiability(device, yingram2, [B, T])